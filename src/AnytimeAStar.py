@@ -0,0 +1,206 @@
+"""
+Anytime repairing A* (ARA*), which finds a first path quickly and improves it until the budget runs out
+Each iteration is weighted A*, priority is backward cost + weight * forward cost
+First iteration uses a large weight, and the weight is decreased by the step in each next iteration
+
+Cells whose backward cost becomes smaller after they are explored are kept as inconsistent cells,
+and they are queued again in the next iteration instead of searching from scratch
+Path of each iteration is at most bound times longer than the optimal path,
+bound = min(weight, cost of the path / the smallest backward cost + forward cost of queued and inconsistent cells)
+Search ends with the optimal path when the weight is 1, or when the expansion limit or the time limit is reached
+"""
+
+import heapq
+from array import array
+
+from AStar import AStar
+from MazeReader import MazeReader
+from PathEncoding import format_paths
+
+# backward cost of the cells which are not queued yet
+INFINITY = 0x3FFFFFFF
+
+
+class AnytimeAStar(AStar):
+    def __init__(self, cells, y_start, x_start, y_end, x_end, weight=3.0, weight_step=0.5, layout='nested',
+                 trace=None, heuristic=None, max_expansions=None, time_limit=None):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list
+        :param y_start: <int>, 0 in this homework
+        :param x_start: <int>, 0 in this homework
+        :param y_end: <int>, height - 1 in this homework
+        :param x_end: <int>, width - 1 in this homework
+        :param weight: <float>, weight of the first iteration
+        :param weight_step: <float>, weight is decreased by this in each iteration until 1
+        :param layout: <str>, tables of the grid, 'nested' list of lists or 'flat' bytearray
+        :param trace: <str>, sink of explored nodes, 'print', 'none', 'list', callback function, or trace object
+                      node is explored again in each iteration if it is queued again
+        :param heuristic: <object>, forward cost which has get_cost(y, x), None is Manhattan distance
+        :param max_expansions: <int>, search stops after exploring this number of nodes, None is no limit
+        :param time_limit: <float>, search stops after this number of seconds, None is no limit
+        """
+        super(AnytimeAStar, self).__init__(cells, y_start, x_start, y_end, x_end, layout=layout, state='arrays',
+                                           trace=trace, heuristic=heuristic, max_expansions=max_expansions,
+                                           time_limit=time_limit)
+        self.initial_weight = weight
+        self.weight_step = weight_step
+        # suboptimality bound of the last path
+        self.bound = None
+        # cell closest to the goal when the budget runs out before the first path is found
+        self.best_cell = None
+
+    def search_path(self):
+        """
+        Improve the path until the budget runs out, node is explored again in each iteration if it is queued again
+        :return: <generator>, (y, x) of each explored node of every iteration, and the best path is returned at the end,
+                 if no path is found in the budget, the path to the node closest to the goal is returned
+        """
+        for step in self.search_steps():
+            if step is not None:
+                yield step
+
+        if self.paths is None and self.best_cell is not None:
+            self.is_partial = True
+            self.paths = self.arrays.get_path(self.best_cell)
+        return self.paths
+
+    def search_paths(self):
+        """
+        Generator of the paths, bound of each path is not larger than the bound of the previous path
+        :return: <generator>, (suboptimality bound, (y, x) locations from the start to the goal)
+        """
+        explore = self.trace.explore
+        for step in self.search_steps():
+            if step is None:
+                yield self.bound, self.paths
+            else:
+                explore(*step)
+
+    def search_steps(self):
+        """
+        Iterations of weighted A*, the path and the bound of each iteration are kept in self.paths and self.bound
+        :return: <generator>, (y, x) of each explored node, and None when an iteration finds a path
+        """
+        width = self.grid.width
+        height = self.grid.height
+        size = width * height
+        start = self.y_start * width + self.x_start
+        goal = self.y_end * width + self.x_end
+        parents = self.arrays.parents
+
+        back_costs = array('i', [INFINITY]) * size
+        forward_costs = {}
+        closed = bytearray(size)
+        opened = set()
+        inconsistent = set()
+        back_costs[start] = 0
+        opened.add(start)
+
+        is_bounded = self.start_budget()
+        expansions = 0
+        self.paths = None
+        self.best_cell = None
+        best_cell = start
+        weight = self.initial_weight
+        while True:
+            # Priorities of the queued cells are changed by the weight, so the heap is made again
+            priorities = {}
+            for cell in opened:
+                priorities[cell] = back_costs[cell] + weight * self.get_cell_forward_cost(cell, forward_costs)
+            queued = [(priority, self.get_tie_breaker(*divmod(cell, width)), cell)
+                      for cell, priority in priorities.items()]
+            heapq.heapify(queued)
+
+            while len(queued) > 0 and back_costs[goal] > queued[0][0]:
+                priority, tie, cell = heapq.heappop(queued)
+                if cell not in opened or priorities[cell] != priority:
+                    continue
+                if is_bounded and self.is_over_budget(expansions):
+                    if back_costs[goal] == INFINITY:
+                        self.best_cell = best_cell
+                    return
+
+                opened.discard(cell)
+                closed[cell] = 1
+                y, x = divmod(cell, width)
+                yield y, x
+                expansions += 1
+                if is_bounded and forward_costs[cell] < forward_costs[best_cell]:
+                    best_cell = cell
+
+                back_cost = back_costs[cell] + 1
+                for next_y, next_x in ((y, x - 1), (y, x + 1), (y - 1, x), (y + 1, x)):
+                    if next_y < 0 or next_y >= height or next_x < 0 or next_x >= width or \
+                            self.grid.is_wall(next_y, next_x):
+                        continue
+
+                    next_cell = next_y * width + next_x
+                    if back_cost >= back_costs[next_cell]:
+                        continue
+                    back_costs[next_cell] = back_cost
+                    parents[next_cell] = cell
+                    if closed[next_cell] == 1:
+                        inconsistent.add(next_cell)
+                    else:
+                        opened.add(next_cell)
+                        priority = back_cost + weight * self.get_cell_forward_cost(next_cell, forward_costs)
+                        priorities[next_cell] = priority
+                        heapq.heappush(queued, (priority, self.get_tie_breaker(next_y, next_x), next_cell))
+
+            if back_costs[goal] == INFINITY:
+                return
+
+            # Every path through the queued and inconsistent cells costs at least the smallest lower bound
+            lower_bounds = [back_costs[cell] + forward_costs[cell] for cell in opened | inconsistent]
+            # Every reachable cell is explored without inconsistent cells, so the path is optimal
+            bound = 1
+            if len(lower_bounds) > 0 and min(lower_bounds) > 0:
+                bound = min(weight, back_costs[goal] / min(lower_bounds))
+            self.bound = max(bound, 1)
+            self.paths = self.arrays.get_path(goal)
+            yield None
+
+            if weight <= 1 or self.bound <= 1:
+                return
+            weight = max(1, weight - self.weight_step)
+            opened |= inconsistent
+            inconsistent = set()
+            closed = bytearray(size)
+
+    def get_cell_forward_cost(self, cell, forward_costs):
+        """
+        :param cell: <int>, cell id
+        :param forward_costs: <dict>, forward costs which are already found
+        :return: <int>, forward cost without the weight
+        """
+        if cell not in forward_costs:
+            forward_costs[cell] = self.get_forward_cost(*divmod(cell, self.grid.width))
+        return forward_costs[cell]
+
+
+def main(path_format='list'):
+    """
+    :param path_format: <str>, 'list' writes every location of the path, 'directions' writes compact path
+    """
+    output_file = open("output.txt", "w")
+    # read mazes one by one
+    for height, width, cells in MazeReader('input.txt').mazes():
+        y_start = 0
+        x_start = 0
+        y_end = height - 1
+        x_end = width - 1
+
+        anytime_a_star = AnytimeAStar(cells, y_start, x_start, y_end, x_end)
+        explored, paths = anytime_a_star.search_answer()
+
+        for ele in explored:
+            output_file.write(str(ele) + "\n")
+
+        output_file.write(format_paths(paths, path_format))
+        output_file.write("\n\n")
+
+    output_file.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+"""
+Solve the mazes of the input file in parallel, and write the output in the original order
+Each maze is independent, so the mazes are dispatched to a pool of workers
+
+Process pool is used by default, and thread pool is used on free-threaded Python which has no GIL
+Walls of a group of mazes are copied once to shared memory, so the workers read them without pickling
+Each worker returns the text of the maze, which is explored nodes and optimal path like main() writes
+
+python Batch.py [solver] [workers] [chunk size]
+"""
+
+import importlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python 3.7 or older, walls are pickled
+    shared_memory = None
+
+from Grid import FlatGrid
+from MazeReader import MazeReader
+from PathEncoding import format_paths
+
+SOLVERS = ('AStar', 'UCS', 'BFS', 'DFS')
+# frontier of the solvers which have a priority queue, when the options do not choose one
+DEFAULT_FRONTIERS = {'AStar': 'indexed', 'UCS': 'indexed'}
+
+
+def is_free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def get_solver(solver_name):
+    if solver_name not in SOLVERS:
+        raise ValueError("unknown solver: " + str(solver_name))
+    return getattr(importlib.import_module(solver_name), solver_name)
+
+
+def get_options(solver_name, options):
+    """
+    :param solver_name: <str>, 'AStar', 'UCS', 'BFS' or 'DFS'
+    :param options: <dict>, keyword arguments of the solver
+    :return: <dict>, the options with the default frontier if they do not choose one
+    """
+    if solver_name in DEFAULT_FRONTIERS and 'frontier' not in options:
+        options = dict(options, frontier=DEFAULT_FRONTIERS[solver_name])
+    return options
+
+
+def solve_grid(solver_name, grid, options, path_format='list'):
+    """
+    :param solver_name: <str>, 'AStar', 'UCS', 'BFS' or 'DFS'
+    :param grid: <FlatGrid>
+    :param options: <dict>, keyword arguments of the solver
+    :param path_format: <str>, 'list' or 'directions'
+    :return: <str>, explored nodes and optimal path
+    """
+    solver = get_solver(solver_name)(grid, 0, 0, grid.height - 1, grid.width - 1, trace='list',
+                                     **get_options(solver_name, options))
+    explored, paths = solver.search_answer()
+
+    lines = [str(y) + " " + str(x) + "\n" for y, x in solver.trace.explored]
+    lines.append(format_paths(paths, path_format))
+    lines.append("\n\n")
+    return ''.join(lines)
+
+
+def solve_task(task):
+    """
+    Worker function
+    :param task: <tuple>, (solver name, height, width, walls, options, path format)
+                 walls is bytearray, or (shared memory name, offset) for process pool
+    :return: <str>, explored nodes and optimal path
+    """
+    solver_name, height, width, walls, options, path_format = task
+    if not isinstance(walls, tuple):
+        return solve_grid(solver_name, FlatGrid.from_walls(height, width, walls), options, path_format)
+
+    shm = shared_memory.SharedMemory(name=walls[0])
+    view = shm.buf[walls[1]:walls[1] + height * width]
+    try:
+        return solve_grid(solver_name, FlatGrid.from_walls(height, width, view), options, path_format)
+    finally:
+        view.release()
+        shm.close()
+
+
+class SharedWalls(object):
+    def __init__(self, grids):
+        """
+        Copy walls of the grids to one shared memory block
+        :param grids: <list>, FlatGrid
+        """
+        self.offsets = []
+        size = 0
+        for grid in grids:
+            self.offsets.append(size)
+            size += grid.height * grid.width
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for grid, offset in zip(grids, self.offsets):
+            self.shm.buf[offset:offset + len(grid.walls)] = grid.walls
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+class Batch(object):
+    def __init__(self, solver_name='AStar', workers=None, chunk_size=1, executor='auto', options=None,
+                 path_format='list'):
+        """
+        :param solver_name: <str>, 'AStar', 'UCS', 'BFS' or 'DFS'
+        :param workers: <int>, the number of workers, None is the number of CPUs
+        :param chunk_size: <int>, the number of mazes sent to a worker at once
+        :param executor: <str>, 'auto', 'process' or 'thread'
+        :param options: <dict>, keyword arguments of the solver, like {'state': 'arrays'},
+                        AStar and UCS use 'indexed' frontier if the options do not choose one,
+                        trace is not an option because the workers return the explored nodes of their trace
+        :param path_format: <str>, 'list' or 'directions'
+        """
+        get_solver(solver_name)
+        if options is not None and 'trace' in options:
+            raise ValueError("trace is not an option of Batch, explored nodes are written to the output file")
+        if executor == 'auto':
+            executor = 'thread' if is_free_threaded() else 'process'
+        if executor not in ('process', 'thread'):
+            raise ValueError("unknown executor: " + str(executor))
+
+        self.solver_name = solver_name
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.executor = executor
+        self.options = options if options is not None else {}
+        self.path_format = path_format
+        # the number of mazes which are read and shared at once
+        self.group_size = self.workers * self.chunk_size * 4
+
+    def solve_file(self, input_file_name, output_file_name):
+        """
+        :param input_file_name: <str>
+        :param output_file_name: <str>
+        :return: <int>, the number of solved mazes
+        """
+        if self.executor == 'thread':
+            pool = ThreadPoolExecutor(max_workers=self.workers)
+        else:
+            pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        count = 0
+        with pool, open(output_file_name, 'w') as output_file:
+            group = []
+            for height, width, grid in MazeReader(input_file_name, 'flat').mazes():
+                group.append(grid)
+                if len(group) >= self.group_size:
+                    count += self.solve_group(pool, group, output_file)
+                    group = []
+            if len(group) > 0:
+                count += self.solve_group(pool, group, output_file)
+        return count
+
+    def solve_group(self, pool, grids, output_file):
+        """
+        Solve the grids in the pool, and write the results in the order of the grids
+        :return: <int>, the number of solved mazes
+        """
+        shared = None
+        if self.executor == 'process' and shared_memory is not None:
+            shared = SharedWalls(grids)
+            tasks = [(self.solver_name, grid.height, grid.width, (shared.shm.name, offset), self.options,
+                      self.path_format) for grid, offset in zip(grids, shared.offsets)]
+        else:
+            tasks = [(self.solver_name, grid.height, grid.width, grid.walls, self.options, self.path_format)
+                     for grid in grids]
+
+        try:
+            for text in pool.map(solve_task, tasks, chunksize=self.chunk_size):
+                output_file.write(text)
+        finally:
+            if shared is not None:
+                shared.close()
+        return len(tasks)
+
+
+def main():
+    solver_name = sys.argv[1] if len(sys.argv) > 1 else 'AStar'
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    chunk_size = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    batch = Batch(solver_name, workers, chunk_size)
+    batch.solve_file('input.txt', 'output.txt')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+"""
+Bidirectional search from both the start (0, 0) and the goal (height - 1, width - 1)
+Forward search goes from the start to the goal, and backward search goes from the goal to the start
+Search ends when both searches meet and no shorter path can be found
+
+BidirectionalBFS expands one whole level of the smaller side at a time
+Path is optimal when the level where the searches meet is finished
+
+BidirectionalAStar runs A* on both sides, and the side which has the smaller queue is expanded
+Forward cost of the forward search is the Manhattan distance to the goal,
+and forward cost of the backward search is the Manhattan distance to the start
+Best cost is the smallest backward cost of forward + backward cost of backward at the cell where the searches meet
+Search ends when the smallest cost in one of the queues is not smaller than the best cost
+
+Cell id is y * width + x, and costs and parents of both sides are kept in arrays
+"""
+
+import heapq
+from array import array
+
+from Grid import make_grid
+from Trace import make_trace
+
+FORWARD = 0
+BACKWARD = 1
+
+
+class Bidirectional(object):
+    def __init__(self, cells, y_start, x_start, y_end, x_end, layout='nested', trace=None):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list
+        :param y_start: <int>, 0 in this homework
+        :param x_start: <int>, 0 in this homework
+        :param y_end: <int>, height - 1 in this homework
+        :param x_end: <int>, width - 1 in this homework
+        :param layout: <str>, tables of the grid, 'nested' list of lists or 'flat' bytearray
+        :param trace: <str>, sink of explored nodes, 'print', 'none', 'list', callback function, or trace object
+        """
+        self.cells = cells
+        self.y_start = y_start
+        self.x_start = x_start
+        self.y_end = y_end
+        self.x_end = x_end
+
+        self.grid = make_grid(cells, layout)
+        self.width = self.grid.width
+        self.height = self.grid.height
+        size = self.width * self.height
+        self.start = y_start * self.width + x_start
+        self.end = y_end * self.width + x_end
+
+        # backward costs and parents of each side, -1 is not reached
+        self.back_costs = (array('i', [-1]) * size, array('i', [-1]) * size)
+        self.parents = (array('i', [-1]) * size, array('i', [-1]) * size)
+        self.trace = make_trace(trace)
+        self.explored = self.trace.explored
+
+    def get_adjacent_cells(self, cell):
+        """
+        :param cell: <int>, cell id
+        :return: <list>, cell ids of adjacent roads, LEFT, RIGHT, UP, DOWN
+        """
+        y, x = divmod(cell, self.width)
+        adjacent_cells = []
+        if x - 1 >= 0 and not self.grid.is_wall(y, x - 1):
+            adjacent_cells.append(cell - 1)
+        if x + 1 <= self.width - 1 and not self.grid.is_wall(y, x + 1):
+            adjacent_cells.append(cell + 1)
+        if y - 1 >= 0 and not self.grid.is_wall(y - 1, x):
+            adjacent_cells.append(cell - self.width)
+        if y + 1 <= self.height - 1 and not self.grid.is_wall(y + 1, x):
+            adjacent_cells.append(cell + self.width)
+        return adjacent_cells
+
+    def explore(self, cell):
+        y, x = divmod(cell, self.width)
+        self.trace.explore(y, x)
+
+    def get_path(self, meet):
+        """
+        Join the path from the start to the meeting cell and the path from the meeting cell to the goal
+        :param meet: <int>, cell id where both searches meet
+        :return: <list>, (y, x) locations from the start to the goal
+        """
+        paths = []
+        cell = meet
+        while cell != -1:
+            paths.append(divmod(cell, self.width))
+            cell = self.parents[FORWARD][cell]
+        paths.reverse()
+
+        cell = self.parents[BACKWARD][meet]
+        while cell != -1:
+            paths.append(divmod(cell, self.width))
+            cell = self.parents[BACKWARD][cell]
+        return paths
+
+    def finish(self, meet):
+        if meet == -1:
+            self.trace.finish(None)
+            return self.trace.explored, None
+
+        paths = self.get_path(meet)
+        self.trace.finish(paths)
+        return self.trace.explored, paths
+
+
+class BidirectionalBFS(Bidirectional):
+    def search_answer(self):
+        """
+        :return: <tuple>, explored nodes and optimal path, path is None if the goal is not reachable
+        """
+        self.back_costs[FORWARD][self.start] = 0
+        self.back_costs[BACKWARD][self.end] = 0
+        if self.start == self.end:
+            self.explore(self.start)
+            return self.finish(self.start)
+
+        levels = ([self.start], [self.end])
+        while len(levels[FORWARD]) > 0 and len(levels[BACKWARD]) > 0:
+            side = FORWARD if len(levels[FORWARD]) <= len(levels[BACKWARD]) else BACKWARD
+            next_level, meet = self.expand_level(side, levels[side])
+            if meet != -1:
+                return self.finish(meet)
+            if side == FORWARD:
+                levels = (next_level, levels[BACKWARD])
+            else:
+                levels = (levels[FORWARD], next_level)
+
+        return self.finish(-1)
+
+    def expand_level(self, side, level):
+        """
+        Expand every cell of the level, and find the best meeting cell in the next level
+        :param side: <int>, FORWARD or BACKWARD
+        :param level: <list>, cell ids which have same backward cost
+        :return: <tuple>, next level, and meeting cell id or -1
+        """
+        back_costs = self.back_costs[side]
+        parents = self.parents[side]
+        other_back_costs = self.back_costs[1 - side]
+
+        next_level = []
+        meet = -1
+        best_cost = -1
+        for cell in level:
+            self.explore(cell)
+            back_cost = back_costs[cell] + 1
+            for next_cell in self.get_adjacent_cells(cell):
+                if back_costs[next_cell] != -1:
+                    continue
+                back_costs[next_cell] = back_cost
+                parents[next_cell] = cell
+                next_level.append(next_cell)
+
+                if other_back_costs[next_cell] != -1:
+                    cost = back_cost + other_back_costs[next_cell]
+                    if meet == -1 or cost < best_cost:
+                        meet = next_cell
+                        best_cost = cost
+        return next_level, meet
+
+
+class BidirectionalAStar(Bidirectional):
+    def get_forward_cost(self, side, cell):
+        """
+        :param side: <int>, FORWARD or BACKWARD
+        :param cell: <int>, cell id
+        :return: <int>, Manhattan distance to the goal of the side
+        """
+        y, x = divmod(cell, self.width)
+        if side == FORWARD:
+            return abs(self.y_end - y) + abs(self.x_end - x)
+        return abs(self.y_start - y) + abs(self.x_start - x)
+
+    def get_tie_breaker(self, side, cell):
+        y, x = divmod(cell, self.width)
+        if side == FORWARD:
+            return (self.y_end - y) ** 2 + (self.x_end - x) ** 2
+        return (self.y_start - y) ** 2 + (self.x_start - x) ** 2
+
+    def search_answer(self):
+        """
+        :return: <tuple>, explored nodes and optimal path, path is None if the goal is not reachable
+        """
+        if self.start == self.end:
+            self.back_costs[FORWARD][self.start] = 0
+            self.back_costs[BACKWARD][self.end] = 0
+            self.explore(self.start)
+            return self.finish(self.start)
+
+        size = self.width * self.height
+        visited = (bytearray(size), bytearray(size))
+        queues = ([], [])
+        for side, root in ((FORWARD, self.start), (BACKWARD, self.end)):
+            self.back_costs[side][root] = 0
+            heapq.heappush(queues[side], (self.get_forward_cost(side, root), self.get_tie_breaker(side, root), root))
+
+        meet = -1
+        best_cost = -1
+        while len(queues[FORWARD]) > 0 and len(queues[BACKWARD]) > 0:
+            # No path through unexplored cells is shorter than the best cost
+            if meet != -1 and max(queues[FORWARD][0][0], queues[BACKWARD][0][0]) >= best_cost:
+                break
+
+            side = FORWARD if len(queues[FORWARD]) <= len(queues[BACKWARD]) else BACKWARD
+            back_costs = self.back_costs[side]
+            other_back_costs = self.back_costs[1 - side]
+
+            cost, tie, cell = heapq.heappop(queues[side])
+            if visited[side][cell]:
+                # stale entry which has larger cost
+                continue
+            visited[side][cell] = 1
+            self.explore(cell)
+
+            back_cost = back_costs[cell] + 1
+            for next_cell in self.get_adjacent_cells(cell):
+                if visited[side][next_cell] or (back_costs[next_cell] != -1 and back_costs[next_cell] <= back_cost):
+                    continue
+                back_costs[next_cell] = back_cost
+                self.parents[side][next_cell] = cell
+                heapq.heappush(queues[side], (back_cost + self.get_forward_cost(side, next_cell),
+                                              self.get_tie_breaker(side, next_cell), next_cell))
+
+                # Both searches meet at the cell
+                if other_back_costs[next_cell] != -1:
+                    cost = back_cost + other_back_costs[next_cell]
+                    if meet == -1 or cost < best_cost:
+                        meet = next_cell
+                        best_cost = cost
+
+        return self.finish(meet)
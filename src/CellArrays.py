@@ -0,0 +1,100 @@
+"""
+Search state kept as struct of arrays instead of one Node object per cell
+Cell id is y * width + x
+Backward cost, cost, and parent cell id of each cell are kept in parallel int arrays
+Parent is -1 when the cell has no parent, which is the root cell
+Arrays are int32, and int64 when the grid has 2^31 cells or more, whose cell ids and costs do not fit in int32
+
+SparseCells keeps the same values in dicts, only for the cells which are touched by the search,
+and get_dense() copies them to CellArrays when the search touches many cells
+"""
+
+from array import array
+
+# the number of cells whose cell ids do not fit in int32
+LARGE_SIZE = 1 << 31
+
+
+def get_typecode(size):
+    """
+    :param size: <int>, the number of cells
+    :return: <str>, typecode of the arrays of cell ids and costs, 'i' for int32 or 'q' for int64
+    """
+    return 'q' if size >= LARGE_SIZE else 'i'
+
+
+class CellArrays(object):
+    def __init__(self, height, width):
+        """
+        :param height: <int>
+        :param width: <int>
+        """
+        size = height * width
+        typecode = get_typecode(size)
+        self.width = width
+        self.back_costs = array(typecode, [0]) * size
+        self.costs = array(typecode, [0]) * size
+        self.parents = array(typecode, [-1]) * size
+
+    def set_cell(self, cell, back_cost, cost, parent):
+        """
+        :param cell: <int>, cell id
+        :param back_cost: <int>, backward cost
+        :param cost: <int>, backward cost + forward cost
+        :param parent: <int>, parent cell id
+        :return: <None>
+        """
+        self.back_costs[cell] = back_cost
+        self.costs[cell] = cost
+        self.parents[cell] = parent
+
+    def get_path(self, cell):
+        """
+        Follow parent cells from the cell to the root cell
+        :param cell: <int>, cell id of the goal
+        :return: <list>, (y, x) locations from the root to the goal
+        """
+        paths = []
+        while cell != -1:
+            paths.append(divmod(cell, self.width))
+            cell = self.parents[cell]
+        paths.reverse()
+        return paths
+
+    def get_cells(self, cell):
+        """
+        Follow parent cells like get_path, but keep cell ids instead of locations
+        :param cell: <int>, cell id of the goal
+        :return: <array>, cell ids from the root to the goal
+        """
+        cells = array('q')
+        while cell != -1:
+            cells.append(cell)
+            cell = self.parents[cell]
+        cells.reverse()
+        return cells
+
+
+class SparseCells(CellArrays):
+    def __init__(self, height, width):
+        """
+        :param height: <int>
+        :param width: <int>
+        """
+        self.height = height
+        self.width = width
+        self.back_costs = {}
+        self.costs = {}
+        self.parents = {}
+
+    def __len__(self):
+        return len(self.parents)
+
+    def get_dense(self):
+        """
+        :return: <CellArrays>, arrays which have the values of the touched cells
+        """
+        arrays = CellArrays(self.height, self.width)
+        for cell, parent in self.parents.items():
+            arrays.set_cell(cell, self.back_costs[cell], self.costs[cell], parent)
+        return arrays
@@ -0,0 +1,87 @@
+"""
+Connected components of the roads, which are labelled once per maze
+Start and goal are connected only when they have the same label, so the goal which is walled off is found in O(1)
+without searching the whole region reachable from the start
+
+Labels are made by union find with path halving, each road is joined with the road on the LEFT and UP
+Root of each component is the smallest cell id in the component, so labels are numbered in row major order
+Label of a wall is 0, and labels of roads are 1 to the number of components
+"""
+
+from array import array
+
+from Grid import WALL, get_flat_grid
+
+
+class Components(object):
+    def __init__(self, cells):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list, or grid
+        """
+        grid = get_flat_grid(cells)
+        self.height = grid.height
+        self.width = grid.width
+        self.count = 0
+        self.labels = self.get_labels(grid)
+
+    def get_labels(self, grid):
+        """
+        :param grid: <FlatGrid>
+        :return: <array>, label of cell id y * width + x
+        """
+        width = self.width
+        size = self.height * width
+        walls = grid.walls
+        parents = array('i', range(size))
+
+        def find(cell):
+            while parents[cell] != cell:
+                parents[cell] = parents[parents[cell]]
+                cell = parents[cell]
+            return cell
+
+        def union(cell, other_cell):
+            root = find(cell)
+            other_root = find(other_cell)
+            if root < other_root:
+                parents[other_root] = root
+            elif other_root < root:
+                parents[root] = other_root
+
+        for cell in range(size):
+            if walls[cell] == WALL:
+                continue
+            if cell % width > 0 and walls[cell - 1] != WALL:
+                union(cell, cell - 1)
+            if cell >= width and walls[cell - width] != WALL:
+                union(cell, cell - width)
+
+        labels = array('i', [0]) * size
+        for cell in range(size):
+            if walls[cell] == WALL:
+                continue
+            root = find(cell)
+            if root == cell:
+                self.count += 1
+                labels[cell] = self.count
+            else:
+                labels[cell] = labels[root]
+        return labels
+
+    def get_label(self, y, x) -> int:
+        """
+        :param y: <int>
+        :param x: <int>
+        :return: <int>, label of the component, 0 for a wall
+        """
+        return self.labels[y * self.width + x]
+
+    def is_connected(self, y_start, x_start, y_end, x_end) -> bool:
+        """
+        :return: <bool>, True if there is a path from the start to the goal
+        """
+        label = self.get_label(y_start, x_start)
+        return label != 0 and label == self.get_label(y_end, x_end)
+
+    def __len__(self):
+        return self.count
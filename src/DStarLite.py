@@ -0,0 +1,285 @@
+"""
+D* Lite, incremental search which repairs the previous search tree when cells change
+Search runs backward from the goal, so g of each cell is the number of step from the cell to the goal
+rhs is one step look ahead of g, rhs = min(g of adjacent road + 1), and rhs of the goal is 0
+Cell is inconsistent when g != rhs, and only inconsistent cells are queued and explored
+
+Key of a cell is (min(g, rhs) + Manhattan distance from the start + km, min(g, rhs))
+km is the sum of the distances the start moved, so the keys in the queue are still valid after the start moves
+
+When a cell changes, rhs of the cell and its adjacent cells are updated,
+and replan() explores only the cells whose g is changed by it
+g, rhs, and keys are kept in int arrays of cell id y * width + x, and stale heap entries are skipped
+"""
+
+import heapq
+from array import array
+
+from Grid import make_grid
+from MazeReader import MazeReader
+from PathEncoding import format_paths
+from Trace import make_trace
+
+# g and rhs of the cells which can not reach the goal, small enough to add distances in int array
+INFINITY = 0x3FFFFFFF
+
+
+class DStarLite(object):
+    def __init__(self, cells, y_start, x_start, y_end, x_end, layout='nested', trace=None):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list, update_cell changes the cells with 'nested' layout
+        :param y_start: <int>, 0 in this homework
+        :param x_start: <int>, 0 in this homework
+        :param y_end: <int>, height - 1 in this homework
+        :param x_end: <int>, width - 1 in this homework
+        :param layout: <str>, tables of the grid, 'nested' list of lists or 'flat' bytearray
+        :param trace: <str>, sink of explored nodes, 'print', 'none', 'list', callback function, or trace object
+        """
+        self.cells = cells
+        self.y_start = y_start
+        self.x_start = x_start
+        self.y_end = y_end
+        self.x_end = x_end
+
+        self.grid = make_grid(cells, layout)
+        self.width = self.grid.width
+        self.height = self.grid.height
+        size = self.height * self.width
+        self.start = y_start * self.width + x_start
+        self.goal = y_end * self.width + x_end
+
+        self.g = array('i', [INFINITY]) * size
+        self.rhs = array('i', [INFINITY]) * size
+        self.key1 = array('i', [0]) * size
+        self.key2 = array('i', [0]) * size
+        self.in_queue = bytearray(size)
+        self.queued = []
+        self.km = 0
+        self.changed = []
+        self.is_searched = False
+
+        self.trace = make_trace(trace)
+        self.explored = self.trace.explored
+
+        self.rhs[self.goal] = 0
+        self.push(self.goal, self.calculate_key(self.goal))
+
+    def search_answer(self):
+        """
+        Search from the goal until the start is consistent
+        :return: <tuple>, explored nodes and optimal path, path is None if the goal is not reachable
+        """
+        self.is_searched = True
+        self.compute_shortest_path()
+        return self.finish()
+
+    def update_cell(self, y, x, value):
+        """
+        Change the cell, the search tree is repaired by replan()
+        :param y: <int>
+        :param x: <int>
+        :param value: <int>, 0 is road, and 1 is wall
+        :return: <None>
+        """
+        self.grid.set_cell(y, x, value)
+        self.changed.append(y * self.width + x)
+
+    def move_start(self, y, x):
+        """
+        Move the start, like an agent walking along the path
+        :param y: <int>
+        :param x: <int>
+        :return: <None>
+        """
+        self.km += abs(self.y_start - y) + abs(self.x_start - x)
+        self.y_start = y
+        self.x_start = x
+        self.start = y * self.width + x
+
+    def replan(self):
+        """
+        Update rhs of the changed cells and their adjacent cells, and explore only the inconsistent cells
+        :return: <tuple>, explored nodes and optimal path, path is None if the goal is not reachable
+        """
+        if not self.is_searched:
+            return self.search_answer()
+
+        for cell in self.changed:
+            self.update_vertex(cell)
+            for next_cell in self.get_adjacent_cells(cell):
+                self.update_vertex(next_cell)
+        self.changed = []
+
+        self.compute_shortest_path()
+        return self.finish()
+
+    def compute_shortest_path(self):
+        """
+        Explore inconsistent cells in key order until the start is consistent and has the smallest key
+        :return: <None>
+        """
+        g = self.g
+        rhs = self.rhs
+        start = self.start
+        while True:
+            top = self.get_top()
+            if top is None:
+                break
+            old_key = top[:2]
+            cell = top[2]
+            if old_key >= self.calculate_key(start) and rhs[start] == g[start]:
+                break
+
+            new_key = self.calculate_key(cell)
+            if old_key < new_key:
+                self.push(cell, new_key)
+                continue
+
+            y, x = divmod(cell, self.width)
+            self.trace.explore(y, x)
+            if g[cell] > rhs[cell]:
+                # Overconsistent, shorter path is found
+                g[cell] = rhs[cell]
+                self.in_queue[cell] = 0
+            else:
+                # Underconsistent, path is blocked, so g is found again from the adjacent cells
+                g[cell] = INFINITY
+                self.update_vertex(cell)
+            for next_cell in self.get_adjacent_cells(cell):
+                self.update_vertex(next_cell)
+
+    def update_vertex(self, cell):
+        """
+        Find rhs from the adjacent cells, and queue the cell if it is inconsistent
+        :param cell: <int>, cell id
+        :return: <None>
+        """
+        if cell != self.goal:
+            self.rhs[cell] = self.get_rhs(cell)
+        if self.g[cell] != self.rhs[cell]:
+            self.push(cell, self.calculate_key(cell))
+        else:
+            self.in_queue[cell] = 0
+
+    def get_rhs(self, cell) -> int:
+        """
+        :param cell: <int>, cell id
+        :return: <int>, the smallest g of the adjacent roads + 1, INFINITY for a wall
+        """
+        grid = self.grid
+        y, x = divmod(cell, self.width)
+        if grid.is_wall(y, x):
+            return INFINITY
+
+        g = self.g
+        rhs = INFINITY
+        for next_cell in self.get_adjacent_cells(cell):
+            next_y, next_x = divmod(next_cell, self.width)
+            if g[next_cell] + 1 < rhs and not grid.is_wall(next_y, next_x):
+                rhs = g[next_cell] + 1
+        return rhs
+
+    def calculate_key(self, cell):
+        """
+        :param cell: <int>, cell id
+        :return: <tuple>, priority of the cell
+        """
+        cost = min(self.g[cell], self.rhs[cell])
+        y, x = divmod(cell, self.width)
+        return cost + abs(self.y_start - y) + abs(self.x_start - x) + self.km, cost
+
+    def push(self, cell, key):
+        """
+        Queue the cell with the key, the old heap entry of the cell becomes stale
+        :param cell: <int>, cell id
+        :param key: <tuple>
+        :return: <None>
+        """
+        if self.in_queue[cell] == 1 and self.key1[cell] == key[0] and self.key2[cell] == key[1]:
+            return
+        self.in_queue[cell] = 1
+        self.key1[cell] = key[0]
+        self.key2[cell] = key[1]
+        heapq.heappush(self.queued, (key[0], key[1], cell))
+
+    def get_top(self):
+        """
+        Remove stale heap entries
+        :return: <tuple>, (key1, key2, cell id) of the smallest key, or None if the queue is empty
+        """
+        queued = self.queued
+        while len(queued) > 0:
+            key1, key2, cell = queued[0]
+            if self.in_queue[cell] == 1 and self.key1[cell] == key1 and self.key2[cell] == key2:
+                return queued[0]
+            heapq.heappop(queued)
+        return None
+
+    def get_adjacent_cells(self, cell):
+        """
+        :param cell: <int>, cell id
+        :return: <list>, cell ids of LEFT, RIGHT, UP, DOWN in the grid
+        """
+        width = self.width
+        y, x = divmod(cell, width)
+        cells = []
+        if x - 1 >= 0:
+            cells.append(cell - 1)
+        if x + 1 <= width - 1:
+            cells.append(cell + 1)
+        if y - 1 >= 0:
+            cells.append(cell - width)
+        if y + 1 <= self.height - 1:
+            cells.append(cell + width)
+        return cells
+
+    def finish(self):
+        paths = self.get_path()
+        self.trace.finish(paths)
+        return self.trace.explored, paths
+
+    def get_path(self):
+        """
+        Follow the adjacent road which has the smallest g from the start to the goal
+        :return: <list>, (y, x) locations from the start to the goal, or None if the goal is not reachable
+        """
+        g = self.g
+        cell = self.start
+        if cell != self.goal and g[cell] >= INFINITY:
+            return None
+
+        paths = [divmod(cell, self.width)]
+        while cell != self.goal:
+            next_cells = [next_cell for next_cell in self.get_adjacent_cells(cell)
+                          if not self.grid.is_wall(*divmod(next_cell, self.width))]
+            cell = min(next_cells, key=lambda next_cell: g[next_cell])
+            paths.append(divmod(cell, self.width))
+        return paths
+
+
+def main(path_format='list'):
+    """
+    :param path_format: <str>, 'list' writes every location of the optimal path, 'directions' writes compact path
+    """
+    output_file = open("output.txt", "w")
+    # read mazes one by one
+    for height, width, cells in MazeReader('input.txt').mazes():
+        y_start = 0
+        x_start = 0
+        y_end = height - 1
+        x_end = width - 1
+
+        d_star_lite = DStarLite(cells, y_start, x_start, y_end, x_end)
+        explored, paths = d_star_lite.search_answer()
+
+        for ele in explored:
+            output_file.write(str(ele) + "\n")
+
+        output_file.write(format_paths(paths, path_format))
+        output_file.write("\n\n")
+
+    output_file.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+Cache of distance fields for repeated queries to the same goal on the same maze
+Distance field is made by one BFS from the goal, and keeps the number of step to the goal for every cell
+Next hop field keeps the direction to the adjacent cell which is one step closer to the goal
+
+Query from any start follows the next hops, so the optimal path is found in O(path length)
+Distance field is also the exact forward cost, so AStar uses it as a perfect heuristic
+
+Maze is added once, and its walls are copied and hashed only then, the hash is the key of the maze for the queries
+Fields are keyed by the key of the maze and the goal
+When the memory of the mazes and the fields is larger than the limit, the least recently used field is evicted,
+and the least recently used maze is evicted with its fields when only the newest field is left
+"""
+
+import hashlib
+from collections import OrderedDict
+
+from Grid import FlatGrid, get_flat_grid
+from WavefrontBFS import get_distance_field
+
+# next hop of each cell, LEFT, RIGHT, UP, DOWN, and NONE for the goal and the cells which are not reachable
+LEFT = 0
+RIGHT = 1
+UP = 2
+DOWN = 3
+NONE = 255
+
+
+def get_maze_hash(grid):
+    """
+    :param grid: <FlatGrid>
+    :return: <str>, hash of the size and the walls of the maze
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((str(grid.height) + " " + str(grid.width) + "\n").encode())
+    digest.update(grid.walls)
+    return digest.hexdigest()
+
+
+class DistanceField(object):
+    def __init__(self, grid, y_end, x_end):
+        """
+        :param grid: <FlatGrid>
+        :param y_end: <int>, y of the goal
+        :param x_end: <int>, x of the goal
+        """
+        self.height = grid.height
+        self.width = grid.width
+        self.y_end = y_end
+        self.x_end = x_end
+        self.distances = get_distance_field(grid, y_end, x_end)
+        self.next_hops = self.get_next_hops()
+        # forward cost of the cells which are not reachable, larger than any path
+        self.unreachable_cost = self.height * self.width
+
+    def get_next_hops(self):
+        """
+        :return: <bytearray>, direction to the adjacent cell which has distance - 1
+        """
+        width = self.width
+        height = self.height
+        distances = self.distances
+        next_hops = bytearray([NONE]) * (width * height)
+        for cell in range(width * height):
+            distance = distances[cell]
+            if distance <= 0:
+                continue
+            y, x = divmod(cell, width)
+            if x - 1 >= 0 and distances[cell - 1] == distance - 1:
+                next_hops[cell] = LEFT
+            elif x + 1 <= width - 1 and distances[cell + 1] == distance - 1:
+                next_hops[cell] = RIGHT
+            elif y - 1 >= 0 and distances[cell - width] == distance - 1:
+                next_hops[cell] = UP
+            elif y + 1 <= height - 1 and distances[cell + width] == distance - 1:
+                next_hops[cell] = DOWN
+        return next_hops
+
+    def get_memory(self) -> int:
+        return self.distances.itemsize * len(self.distances) + len(self.next_hops)
+
+    def get_cost(self, y, x) -> int:
+        """
+        Exact forward cost for AStar
+        :param y: <int>
+        :param x: <int>
+        :return: <int>, the number of step to the goal
+        """
+        distance = self.distances[y * self.width + x]
+        return distance if distance != -1 else self.unreachable_cost
+
+    def get_path(self, y_start, x_start):
+        """
+        Follow next hops from the start to the goal
+        :param y_start: <int>
+        :param x_start: <int>
+        :return: <list>, (y, x) locations from the start to the goal, or None if the goal is not reachable
+        """
+        width = self.width
+        cell = y_start * width + x_start
+        if self.distances[cell] == -1:
+            return None
+
+        steps = (-1, 1, -width, width)
+        cells = [cell]
+        while self.next_hops[cell] != NONE:
+            cell = cell + steps[self.next_hops[cell]]
+            cells.append(cell)
+        return [divmod(cell, width) for cell in cells]
+
+
+def get_grid_memory(grid) -> int:
+    """
+    :param grid: <FlatGrid>
+    :return: <int>, the number of bytes of the walls and the tables of the grid
+    """
+    return len(grid.walls) + len(grid.queue_cells) + len(grid.visit_cells)
+
+
+class DistanceCache(object):
+    def __init__(self, max_memory=256 * 1024 * 1024):
+        """
+        :param max_memory: <int>, the number of bytes of all mazes and fields in the cache,
+                           the newest maze and field are kept even if they are larger than the limit
+        """
+        self.max_memory = max_memory
+        self.memory = 0
+        # key of the maze -> FlatGrid of the maze, fields are made from it, the least recently used is first
+        self.grids = OrderedDict()
+        self.fields = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def add_map(self, cells):
+        """
+        Add the maze, the same walls get the same key and share the fields
+        Walls are copied, so changing the cells later does not change the fields of the cache
+        :param cells: <list>, 0 is road, and 1 is wall in list, or grid
+        :return: <str>, key of the maze for the queries
+        """
+        grid = get_flat_grid(cells)
+        key = get_maze_hash(grid)
+        if key in self.grids:
+            self.grids.move_to_end(key)
+            return key
+
+        grid = FlatGrid.from_walls(grid.height, grid.width, bytearray(grid.walls))
+        self.grids[key] = grid
+        self.memory += get_grid_memory(grid)
+        self.evict()
+        return key
+
+    def remove_map(self, key):
+        """
+        Remove the maze and its fields
+        :param key: <str>, key of the maze from add_map
+        :return: <None>
+        """
+        self.memory -= get_grid_memory(self.grids.pop(key))
+        for field_key in [field_key for field_key in self.fields if field_key[0] == key]:
+            self.memory -= self.fields.pop(field_key).get_memory()
+
+    def evict(self):
+        """
+        Evict the least recently used fields, and then the least recently used mazes with their fields,
+        until the memory is not larger than the limit
+        :return: <None>
+        """
+        while self.memory > self.max_memory:
+            if len(self.fields) > 1:
+                old_key, old_field = self.fields.popitem(last=False)
+                self.memory -= old_field.get_memory()
+            elif len(self.grids) > 1:
+                self.remove_map(next(iter(self.grids)))
+            else:
+                break
+
+    def lookup(self, key, y_end, x_end):
+        """
+        Find the field which is already made
+        :param key: <str>, key of the maze from add_map
+        :param y_end: <int>
+        :param x_end: <int>
+        :return: <DistanceField>, or None if the field is not in the cache
+        """
+        field_key = (key, y_end, x_end)
+        field = self.fields.get(field_key)
+        if field is not None:
+            self.fields.move_to_end(field_key)
+            self.grids.move_to_end(key)
+        return field
+
+    def get_field(self, key, y_end, x_end):
+        """
+        Find the field, or make the field by BFS from the goal
+        :param key: <str>, key of the maze from add_map
+        :param y_end: <int>
+        :param x_end: <int>
+        :return: <DistanceField>
+        """
+        if key not in self.grids:
+            raise KeyError("unknown maze, it is removed or evicted and has to be added again: " + str(key))
+        self.grids.move_to_end(key)
+        field_key = (key, y_end, x_end)
+        field = self.fields.get(field_key)
+        if field is not None:
+            self.hits += 1
+            self.fields.move_to_end(field_key)
+            return field
+
+        self.misses += 1
+        field = DistanceField(self.grids[key], y_end, x_end)
+        self.fields[field_key] = field
+        self.memory += field.get_memory()
+        self.evict()
+        return field
+
+    def query(self, key, y_start, x_start, y_end, x_end):
+        """
+        :param key: <str>, key of the maze from add_map
+        :return: <list>, (y, x) locations from the start to the goal, or None if the goal is not reachable
+        """
+        return self.get_field(key, y_end, x_end).get_path(y_start, x_start)
+
+    def __len__(self):
+        return len(self.fields)
@@ -0,0 +1,380 @@
+"""
+Priority queues for the frontier of A* search and uniform cost search
+Each entry is a tuple like (cost, tie breaker, node), and the smallest entry is explored first
+Each entry belongs to a key, which is the (y, x) location of the node
+
+ListFrontier keeps a heap list and removes the old entry by scanning the list when a smaller cost is found,
+and the list is made into heap again after the removal
+LazyFrontier keeps the old entry in the heap and skips it when it is popped
+IndexedFrontier keeps the position of each key in the heap, so a smaller cost moves the entry in O(log n)
+BucketFrontier keeps one bucket per integer cost (Dial's algorithm), so push is O(1) and pop scans to the next bucket
+Entries in the same bucket are ordered by the rest of the entry, which is tie breaker for A* search
+FIFOFrontier is the queue of BFS, and LIFOFrontier is the stack of DFS, entries are popped in the order of push
+
+Run this file to compare the time of the frontiers on open mazes
+"""
+
+import heapq
+import random
+from collections import deque
+import sys
+import time
+
+
+class ListFrontier(object):
+    def __init__(self):
+        self.queued = []
+
+    def __len__(self):
+        return len(self.queued)
+
+    def push(self, key, entry):
+        """
+        Add new entry to heap
+        :param key: <tuple>, (y, x) of the node
+        :param entry: <tuple>, (cost, ..., node)
+        :return: <None>
+        """
+        heapq.heappush(self.queued, entry)
+
+    def update(self, key, old_entry, new_entry):
+        """
+        Remove the old entry by scanning the heap list, and add the new entry
+        Removing from the middle breaks the heap order, so the list is made into heap again
+        :param key: <tuple>, (y, x) of the node
+        :param old_entry: <tuple>, entry which has old cost
+        :param new_entry: <tuple>, entry which has new smaller cost
+        :return: <None>
+        """
+        index = self.find(old_entry)
+        if index is not None:
+            last_entry = self.queued.pop()
+            if index < len(self.queued):
+                self.queued[index] = last_entry
+                heapq.heapify(self.queued)
+        heapq.heappush(self.queued, new_entry)
+
+    def find(self, old_entry):
+        """
+        Node is equal to any node of the same cost, so the entry of the node is found by the node itself,
+        and the entry of the cell id is found by the equal entry
+        :param old_entry: <tuple>, (cost, ..., node or cell id)
+        :return: <int>, index of the entry in the heap list, or None if it is not in the heap
+        """
+        item = old_entry[-1]
+        if isinstance(item, int):
+            try:
+                return self.queued.index(old_entry)
+            except ValueError:
+                return None
+        for index, entry in enumerate(self.queued):
+            if entry[-1] is item:
+                return index
+        return None
+
+    def pop(self):
+        return heapq.heappop(self.queued)
+
+
+class LazyFrontier(object):
+    def __init__(self):
+        self.queued = []
+        # key -> live entry, and id of live entry -> key
+        self.live = {}
+        self.live_ids = {}
+
+    def __len__(self):
+        return len(self.live)
+
+    def push(self, key, entry):
+        """
+        Add new entry to heap, the previous entry of the key becomes stale
+        :param key: <tuple>, (y, x) of the node
+        :param entry: <tuple>, (cost, ..., node)
+        :return: <None>
+        """
+        old_entry = self.live.get(key)
+        if old_entry is not None:
+            del self.live_ids[id(old_entry)]
+        self.live[key] = entry
+        self.live_ids[id(entry)] = key
+        heapq.heappush(self.queued, entry)
+
+    def update(self, key, old_entry, new_entry):
+        """
+        Old entry is not removed from heap, it is skipped when it is popped
+        :param key: <tuple>, (y, x) of the node
+        :param old_entry: <tuple>, entry which has old cost
+        :param new_entry: <tuple>, entry which has new smaller cost
+        :return: <None>
+        """
+        self.push(key, new_entry)
+
+    def pop(self):
+        """
+        Pop the smallest live entry, stale entries are thrown away
+        :return: <tuple>, entry
+        """
+        while True:
+            entry = heapq.heappop(self.queued)
+            key = self.live_ids.pop(id(entry), None)
+            if key is not None:
+                del self.live[key]
+                return entry
+
+
+class IndexedFrontier(object):
+    def __init__(self):
+        self.entries = []
+        self.keys = []
+        # key -> index of the entry in heap
+        self.position = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def push(self, key, entry):
+        """
+        Add new entry to heap, or replace the entry of the key if the key is already in heap
+        :param key: <tuple>, (y, x) of the node
+        :param entry: <tuple>, (cost, ..., node)
+        :return: <None>
+        """
+        index = self.position.get(key)
+        if index is None:
+            index = len(self.entries)
+            self.entries.append(entry)
+            self.keys.append(key)
+            self.position[key] = index
+            self.sift_up(index)
+        else:
+            self.entries[index] = entry
+            self.sift_down(self.sift_up(index))
+
+    def update(self, key, old_entry, new_entry):
+        """
+        Decrease key, the entry moves up to the new position
+        :param key: <tuple>, (y, x) of the node
+        :param old_entry: <tuple>, entry which has old cost
+        :param new_entry: <tuple>, entry which has new smaller cost
+        :return: <None>
+        """
+        self.push(key, new_entry)
+
+    def pop(self):
+        """
+        Pop the smallest entry, and move the last entry to the root
+        :return: <tuple>, entry
+        """
+        entry = self.entries[0]
+        del self.position[self.keys[0]]
+
+        last_entry = self.entries.pop()
+        last_key = self.keys.pop()
+        if len(self.entries) > 0:
+            self.entries[0] = last_entry
+            self.keys[0] = last_key
+            self.position[last_key] = 0
+            self.sift_down(0)
+        return entry
+
+    def sift_up(self, index):
+        entries = self.entries
+        keys = self.keys
+        entry = entries[index]
+        key = keys[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not entry < entries[parent]:
+                break
+            entries[index] = entries[parent]
+            keys[index] = keys[parent]
+            self.position[keys[index]] = index
+            index = parent
+        entries[index] = entry
+        keys[index] = key
+        self.position[key] = index
+        return index
+
+    def sift_down(self, index):
+        entries = self.entries
+        keys = self.keys
+        size = len(entries)
+        entry = entries[index]
+        key = keys[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and entries[child + 1] < entries[child]:
+                child = child + 1
+            if not entries[child] < entry:
+                break
+            entries[index] = entries[child]
+            keys[index] = keys[child]
+            self.position[keys[index]] = index
+            index = child
+        entries[index] = entry
+        keys[index] = key
+        self.position[key] = index
+        return index
+
+
+class BucketFrontier(object):
+    def __init__(self):
+        # buckets[cost] is heap of entries which have the cost
+        self.buckets = []
+        # every bucket smaller than current is empty
+        self.current = 0
+        # key -> live entry, and id of live entry -> key
+        self.live = {}
+        self.live_ids = {}
+
+    def __len__(self):
+        return len(self.live)
+
+    def push(self, key, entry):
+        """
+        Add new entry to the bucket of its cost, the previous entry of the key becomes stale
+        :param key: <tuple>, (y, x) of the node
+        :param entry: <tuple>, (cost, ..., node), cost is non-negative integer
+        :return: <None>
+        """
+        old_entry = self.live.get(key)
+        if old_entry is not None:
+            del self.live_ids[id(old_entry)]
+        self.live[key] = entry
+        self.live_ids[id(entry)] = key
+
+        cost = entry[0]
+        while len(self.buckets) <= cost:
+            self.buckets.append([])
+        heapq.heappush(self.buckets[cost], entry)
+        if cost < self.current:
+            self.current = cost
+
+    def update(self, key, old_entry, new_entry):
+        """
+        Old entry is not removed from its bucket, it is skipped when it is popped
+        :param key: <tuple>, (y, x) of the node
+        :param old_entry: <tuple>, entry which has old cost
+        :param new_entry: <tuple>, entry which has new smaller cost
+        :return: <None>
+        """
+        self.push(key, new_entry)
+
+    def pop(self):
+        """
+        Pop the smallest live entry from the first bucket which is not empty
+        :return: <tuple>, entry
+        """
+        while True:
+            bucket = self.buckets[self.current]
+            if len(bucket) == 0:
+                self.current += 1
+                continue
+
+            entry = heapq.heappop(bucket)
+            key = self.live_ids.pop(id(entry), None)
+            if key is not None:
+                del self.live[key]
+                return entry
+
+
+class FIFOFrontier(object):
+    def __init__(self):
+        self.queued = deque()
+
+    def __len__(self):
+        return len(self.queued)
+
+    def push(self, key, entry):
+        self.queued.append(entry)
+
+    def update(self, key, old_entry, new_entry):
+        """
+        Old entry is not removed, the key is popped again with the new entry
+        """
+        self.queued.append(new_entry)
+
+    def pop(self):
+        return self.queued.popleft()
+
+
+class LIFOFrontier(object):
+    def __init__(self):
+        self.queued = []
+
+    def __len__(self):
+        return len(self.queued)
+
+    def push(self, key, entry):
+        self.queued.append(entry)
+
+    def update(self, key, old_entry, new_entry):
+        """
+        Old entry is not removed, the key is popped again with the new entry
+        """
+        self.queued.append(new_entry)
+
+    def pop(self):
+        return self.queued.pop()
+
+
+FRONTIERS = {
+    'list': ListFrontier,
+    'lazy': LazyFrontier,
+    'indexed': IndexedFrontier,
+    'bucket': BucketFrontier,
+    'fifo': FIFOFrontier,
+    'lifo': LIFOFrontier,
+}
+# frontiers which pop the smallest entry first
+PRIORITY_FRONTIERS = ('bucket', 'indexed', 'lazy', 'list')
+
+
+def make_frontier(name):
+    """
+    :param name: <str>, 'list', 'lazy', 'indexed', 'bucket', 'fifo' or 'lifo'
+    :return: frontier
+    """
+    if name not in FRONTIERS:
+        raise ValueError("unknown frontier: " + str(name))
+    return FRONTIERS[name]()
+
+
+def make_open_maze(height, width, wall_rate, seed):
+    """
+    Make random maze which has few walls, start and goal are always road
+    :return: <list>, 0 is road, and 1 is wall in list
+    """
+    rand = random.Random(seed)
+    cells = [[1 if rand.random() < wall_rate else 0 for x in range(width)] for y in range(height)]
+    cells[0][0] = 0
+    cells[height - 1][width - 1] = 0
+    return cells
+
+
+def main():
+    # python Frontier.py [size] [wall rate]
+    from AStar import AStar
+    from UCS import UCS
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    wall_rate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    cells = make_open_maze(size, size, wall_rate, 0)
+
+    for solver in (AStar, UCS):
+        for name in PRIORITY_FRONTIERS:
+            search = solver(cells, 0, 0, size - 1, size - 1, frontier=name, trace='none')
+            start_time = time.perf_counter()
+            explored, paths = search.search_answer()
+            elapsed = time.perf_counter() - start_time
+
+            path_length = len(paths) if paths is not None else 0
+            print(solver.__name__ + " " + name + " explored: " + str(search.trace.count) +
+                  " path: " + str(path_length) + " time: " + "%.3f" % elapsed)
+
+
+if __name__ == '__main__':
+    main()
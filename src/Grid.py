@@ -0,0 +1,418 @@
+"""
+Grid keeps the walls of the maze and the boolean tables of queued cells and visited cells
+Every search (A*, UCS, BFS, DFS) asks the grid whether the cell is wall, queued, or visited
+
+NestedGrid keeps list of lists like the input cells, cells[y][x]
+FlatGrid keeps one bytearray per table, and the cell (y, x) is at index y * width + x
+FlatGrid uses 1 byte per cell for each table instead of a list reference per cell
+BitGrid keeps the walls in 1 bit per cell, bit (index & 7) of byte (index >> 3), like the walls of a maze file
+BitsetGrid also keeps the tables of queued cells and visited cells in 1 bit per cell, in 64 bit words
+BitsetGrid uses 3 bits per cell for the grid, so a maze of 10^10 cells needs about 3.75 GB for the grid
+SparseGrid reads the walls from the cells as they are, and keeps only the queued and visited cells in sets,
+so it is made in O(1) and make_dense() changes the sets to bytearrays when the search touches many cells
+"""
+
+from array import array
+
+WALL = 1
+# byte of 0 and 1 values -> the bit of the index, and the bit of the index -> byte of 0 and 1 value
+BIT_TABLES = tuple(bytes(1 << index if value == WALL else 0 for value in range(256)) for index in range(8))
+UNPACK_TABLES = tuple(bytes((value >> index) & 1 for value in range(256)) for index in range(8))
+# byte of the cell value -> digit of the wall bit, the digits of a row are read as one binary number
+ROW_TABLE = bytes(ord('1') if value == WALL else ord('0') for value in range(256))
+
+
+def get_row_bits(row):
+    """
+    :param row: <bytes>, value of each cell of the row
+    :return: <int>, bit x is 1 if the cell x is wall
+    """
+    return int(bytes(row).translate(ROW_TABLE)[::-1], 2)
+
+
+class NestedGrid(object):
+    def __init__(self, cells):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list
+        """
+        self.cells = cells
+        self.height = len(cells)
+        self.width = len(cells[0])
+        self.queue_cells = [[False for x in range(self.width)] for y in range(self.height)]
+        self.visit_cells = [[False for x in range(self.width)] for y in range(self.height)]
+
+    def is_wall(self, y, x) -> bool:
+        return self.cells[y][x] == WALL
+
+    def get_row_walls(self, y) -> int:
+        """
+        :param y: <int>
+        :return: <int>, bit x is 1 if (y, x) is wall
+        """
+        return get_row_bits(self.cells[y])
+
+    def is_queued(self, y, x) -> bool:
+        return self.queue_cells[y][x]
+
+    def is_visited(self, y, x) -> bool:
+        return self.visit_cells[y][x]
+
+    def set_queued(self, y, x):
+        self.queue_cells[y][x] = True
+
+    def set_visited(self, y, x):
+        self.visit_cells[y][x] = True
+
+    def set_cell(self, y, x, value):
+        self.cells[y][x] = value
+
+
+class FlatGrid(object):
+    def __init__(self, cells):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list
+        """
+        height = len(cells)
+        width = len(cells[0])
+        walls = bytearray(height * width)
+        for y in range(height):
+            row = cells[y]
+            offset = y * width
+            for x in range(width):
+                if row[x] == WALL:
+                    walls[offset + x] = 1
+        self.set_walls(height, width, walls)
+
+    @classmethod
+    def from_walls(cls, height, width, walls):
+        """
+        Make grid from walls which are already flat
+        :param height: <int>
+        :param width: <int>
+        :param walls: <bytearray>, 1 is wall at index y * width + x
+        :return: <FlatGrid>
+        """
+        grid = cls.__new__(cls)
+        grid.set_walls(height, width, walls)
+        return grid
+
+    def set_walls(self, height, width, walls):
+        self.height = height
+        self.width = width
+        self.walls = walls
+        self.queue_cells = bytearray(height * width)
+        self.visit_cells = bytearray(height * width)
+
+    def index(self, y, x) -> int:
+        return y * self.width + x
+
+    def is_wall(self, y, x) -> bool:
+        return self.walls[y * self.width + x] == WALL
+
+    def get_row_walls(self, y) -> int:
+        """
+        :param y: <int>
+        :return: <int>, bit x is 1 if (y, x) is wall
+        """
+        return get_row_bits(self.walls[y * self.width:(y + 1) * self.width])
+
+    def is_queued(self, y, x) -> bool:
+        return self.queue_cells[y * self.width + x] == 1
+
+    def is_visited(self, y, x) -> bool:
+        return self.visit_cells[y * self.width + x] == 1
+
+    def set_queued(self, y, x):
+        self.queue_cells[y * self.width + x] = 1
+
+    def set_visited(self, y, x):
+        self.visit_cells[y * self.width + x] = 1
+
+    def set_cell(self, y, x, value):
+        self.walls[y * self.width + x] = 1 if value == WALL else 0
+
+
+def pack_walls(walls):
+    """
+    :param walls: <bytearray>, 1 is wall at index y * width + x
+    :return: <bytearray>, 1 bit per cell
+    """
+    size = (len(walls) + 7) // 8
+    bits = 0
+    for index in range(8):
+        bits |= int.from_bytes(bytes(walls[index::8]).translate(BIT_TABLES[index]), 'little')
+    return bytearray(bits.to_bytes(size, 'little'))
+
+
+def unpack_walls(bits, size):
+    """
+    :param bits: <bytes>, 1 bit per cell
+    :param size: <int>, the number of cells
+    :return: <bytearray>, 1 is wall at index y * width + x
+    """
+    walls = bytearray(len(bits) * 8)
+    bits = bytes(bits)
+    for index in range(8):
+        walls[index::8] = bits.translate(UNPACK_TABLES[index])
+    del walls[size:]
+    return walls
+
+
+class BitGrid(object):
+    def __init__(self, cells):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list
+        """
+        flat_grid = FlatGrid(cells)
+        self.set_bits(flat_grid.height, flat_grid.width, pack_walls(flat_grid.walls))
+
+    @classmethod
+    def from_bits(cls, height, width, bits):
+        """
+        Make grid from packed walls, the bits are not copied, so memoryview of mmap is used as it is
+        :param height: <int>
+        :param width: <int>
+        :param bits: <bytearray> or <memoryview>, 1 bit per cell
+        :return: <BitGrid>
+        """
+        grid = cls.__new__(cls)
+        grid.set_bits(height, width, bits)
+        return grid
+
+    def set_bits(self, height, width, bits):
+        self.height = height
+        self.width = width
+        self.bits = bits
+        self.queue_cells = bytearray(height * width)
+        self.visit_cells = bytearray(height * width)
+
+    def get_walls(self):
+        """
+        :return: <bytearray>, walls unpacked to 1 byte per cell
+        """
+        return unpack_walls(self.bits, self.height * self.width)
+
+    def is_wall(self, y, x) -> bool:
+        index = y * self.width + x
+        return (self.bits[index >> 3] >> (index & 7)) & 1 == 1
+
+    def get_row_walls(self, y) -> int:
+        """
+        :param y: <int>
+        :return: <int>, bit x is 1 if (y, x) is wall
+        """
+        start = y * self.width
+        row = int.from_bytes(self.bits[start >> 3:(start + self.width + 7) >> 3], 'little')
+        return (row >> (start & 7)) & ((1 << self.width) - 1)
+
+    def is_queued(self, y, x) -> bool:
+        return self.queue_cells[y * self.width + x] == 1
+
+    def is_visited(self, y, x) -> bool:
+        return self.visit_cells[y * self.width + x] == 1
+
+    def set_queued(self, y, x):
+        self.queue_cells[y * self.width + x] = 1
+
+    def set_visited(self, y, x):
+        self.visit_cells[y * self.width + x] = 1
+
+    def set_cell(self, y, x, value):
+        index = y * self.width + x
+        if value == WALL:
+            self.bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+
+class Bitset(object):
+    def __init__(self, size):
+        """
+        :param size: <int>, the number of bits, every bit is 0 at first
+        """
+        self.size = size
+        self.words = array('Q', [0]) * ((size + 63) >> 6)
+
+    def __len__(self):
+        return self.size
+
+    def test(self, index) -> bool:
+        return (self.words[index >> 6] >> (index & 63)) & 1 == 1
+
+    def set(self, index):
+        self.words[index >> 6] |= 1 << (index & 63)
+
+    def clear(self, index):
+        self.words[index >> 6] &= ~(1 << (index & 63)) & 0xFFFFFFFFFFFFFFFF
+
+    def test_and_set(self, index) -> bool:
+        """
+        :param index: <int>
+        :return: <bool>, the bit before it is set
+        """
+        word = self.words[index >> 6]
+        mask = 1 << (index & 63)
+        self.words[index >> 6] = word | mask
+        return word & mask != 0
+
+
+class BitsetGrid(BitGrid):
+    def set_bits(self, height, width, bits):
+        self.height = height
+        self.width = width
+        self.bits = bits
+        self.queue_cells = Bitset(height * width)
+        self.visit_cells = Bitset(height * width)
+        self.queue_words = self.queue_cells.words
+        self.visit_words = self.visit_cells.words
+
+    def is_queued(self, y, x) -> bool:
+        index = y * self.width + x
+        return (self.queue_words[index >> 6] >> (index & 63)) & 1 == 1
+
+    def is_visited(self, y, x) -> bool:
+        index = y * self.width + x
+        return (self.visit_words[index >> 6] >> (index & 63)) & 1 == 1
+
+    def set_queued(self, y, x):
+        index = y * self.width + x
+        self.queue_words[index >> 6] |= 1 << (index & 63)
+
+    def set_visited(self, y, x):
+        index = y * self.width + x
+        self.visit_words[index >> 6] |= 1 << (index & 63)
+
+
+class SparseGrid(object):
+    def __init__(self, cells, layout='nested'):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list, or grid, walls are not copied
+        :param layout: <str>, tables of make_dense, Bitset for 'bitset' layout and bytearray for the others
+        """
+        self.layout = layout
+        if isinstance(cells, list):
+            self.cells = cells
+            self.height = len(cells)
+            self.width = len(cells[0])
+            self.is_wall = self.is_cell_wall
+        else:
+            self.cells = None
+            self.height = cells.height
+            self.width = cells.width
+            self.is_wall = cells.is_wall
+        self.queue_cells = set()
+        self.visit_cells = set()
+
+    def make_dense(self):
+        """
+        Change the sets of queued and visited cells to bytearrays, or Bitsets for 'bitset' layout,
+        and use the methods of the tables
+        :return: <None>
+        """
+        size = self.height * self.width
+        if self.layout == 'bitset':
+            queue_cells = Bitset(size)
+            for index in self.queue_cells:
+                queue_cells.set(index)
+            visit_cells = Bitset(size)
+            for index in self.visit_cells:
+                visit_cells.set(index)
+            self.is_queued = self.is_bitset_queued
+            self.is_visited = self.is_bitset_visited
+            self.set_queued = self.set_bitset_queued
+            self.set_visited = self.set_bitset_visited
+        else:
+            queue_cells = bytearray(size)
+            for index in self.queue_cells:
+                queue_cells[index] = 1
+            visit_cells = bytearray(size)
+            for index in self.visit_cells:
+                visit_cells[index] = 1
+            self.is_queued = self.is_dense_queued
+            self.is_visited = self.is_dense_visited
+            self.set_queued = self.set_dense_queued
+            self.set_visited = self.set_dense_visited
+        self.queue_cells = queue_cells
+        self.visit_cells = visit_cells
+
+    def is_cell_wall(self, y, x) -> bool:
+        return self.cells[y][x] == WALL
+
+    def is_queued(self, y, x) -> bool:
+        return y * self.width + x in self.queue_cells
+
+    def is_visited(self, y, x) -> bool:
+        return y * self.width + x in self.visit_cells
+
+    def set_queued(self, y, x):
+        self.queue_cells.add(y * self.width + x)
+
+    def set_visited(self, y, x):
+        self.visit_cells.add(y * self.width + x)
+
+    def is_dense_queued(self, y, x) -> bool:
+        return self.queue_cells[y * self.width + x] == 1
+
+    def is_dense_visited(self, y, x) -> bool:
+        return self.visit_cells[y * self.width + x] == 1
+
+    def set_dense_queued(self, y, x):
+        self.queue_cells[y * self.width + x] = 1
+
+    def set_dense_visited(self, y, x):
+        self.visit_cells[y * self.width + x] = 1
+
+    def is_bitset_queued(self, y, x) -> bool:
+        return self.queue_cells.test(y * self.width + x)
+
+    def is_bitset_visited(self, y, x) -> bool:
+        return self.visit_cells.test(y * self.width + x)
+
+    def set_bitset_queued(self, y, x):
+        self.queue_cells.set(y * self.width + x)
+
+    def set_bitset_visited(self, y, x):
+        self.visit_cells.set(y * self.width + x)
+
+
+GRIDS = {
+    'nested': NestedGrid,
+    'flat': FlatGrid,
+    'bits': BitGrid,
+    'bitset': BitsetGrid,
+}
+
+
+def make_grid(cells, layout):
+    """
+    Grid which is already made keeps its layout and walls, and gets new tables of queued and visited cells
+    'bitset' layout packs the walls of the grid which is already made, if they are not packed yet
+    :param cells: <list>, 0 is road, and 1 is wall in list, or grid
+    :param layout: <str>, 'nested', 'flat', 'bits' or 'bitset'
+    :return: grid
+    """
+    if layout == 'bitset' and isinstance(cells, (FlatGrid, BitGrid)):
+        bits = cells.bits if isinstance(cells, BitGrid) else pack_walls(cells.walls)
+        return BitsetGrid.from_bits(cells.height, cells.width, bits)
+    if isinstance(cells, FlatGrid):
+        return FlatGrid.from_walls(cells.height, cells.width, cells.walls)
+    if isinstance(cells, NestedGrid):
+        return NestedGrid(cells.cells)
+    if isinstance(cells, BitGrid):
+        return type(cells).from_bits(cells.height, cells.width, cells.bits)
+    if layout not in GRIDS:
+        raise ValueError("unknown grid layout: " + str(layout))
+    return GRIDS[layout](cells)
+
+
+def get_flat_grid(cells):
+    """
+    :param cells: <list>, 0 is road, and 1 is wall in list, or grid
+    :return: <FlatGrid>
+    """
+    grid = make_grid(cells, 'flat')
+    if isinstance(grid, BitGrid):
+        grid = FlatGrid.from_walls(grid.height, grid.width, grid.get_walls())
+    elif not isinstance(grid, FlatGrid):
+        grid = FlatGrid(grid.cells)
+    return grid
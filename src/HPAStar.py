@@ -0,0 +1,381 @@
+"""
+Hierarchical path finding A* (HPA*) for very large maps
+Maze is divided into square clusters, and entrances are found on the border between two adjacent clusters
+Each maximal run of roads on both sides of a border is an entrance,
+short entrance has one transition at the middle, and wide entrance has two transitions at both ends
+
+Abstract graph has the cells of the transitions as nodes
+Two nodes of a transition are connected with cost 1, and two nodes in the same cluster are connected
+with the distance inside the cluster, which is found once by BFS in the cluster
+
+Search inserts the start and the goal to the graph, runs A* on the small abstract graph,
+and refines only the edges of the abstract path to cells by AStar inside each cluster
+Path is near optimal because the path has to go through the transitions
+
+Cluster whose cells are changed is rebuilt locally with its borders and the adjacent clusters
+"""
+
+import heapq
+
+from AStar import AStar
+from Grid import FlatGrid, WALL, get_flat_grid
+from MazeReader import MazeReader
+from PathEncoding import format_paths
+from Trace import make_trace
+from WavefrontBFS import get_distance_field
+
+# entrance which is wider than this has two transitions
+WIDE_ENTRANCE = 6
+
+
+class ClusterGraph(object):
+    def __init__(self, cells, cluster_size=16):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list, or grid
+        :param cluster_size: <int>, height and width of a cluster
+        """
+        grid = get_flat_grid(cells)
+        # walls are copied, so update_cell does not change the cells
+        self.grid = FlatGrid.from_walls(grid.height, grid.width, bytearray(grid.walls))
+        self.height = grid.height
+        self.width = grid.width
+        self.cluster_size = cluster_size
+        self.rows = (self.height + cluster_size - 1) // cluster_size
+        self.columns = (self.width + cluster_size - 1) // cluster_size
+
+        # transitions of each border, and edges of each node
+        self.transitions = {}
+        self.inter_edges = {}
+        self.intra_edges = {}
+        self.cluster_nodes = {}
+
+        for cluster in range(self.rows * self.columns):
+            for border in self.get_borders(cluster):
+                if border[0] == cluster:
+                    self.build_border(border)
+        for cluster in range(self.rows * self.columns):
+            self.build_cluster(cluster)
+
+    def get_cluster(self, cell) -> int:
+        """
+        :param cell: <int>, cell id
+        :return: <int>, cluster id, cluster row * the number of cluster columns + cluster column
+        """
+        y, x = divmod(cell, self.width)
+        return (y // self.cluster_size) * self.columns + x // self.cluster_size
+
+    def get_bounds(self, cluster):
+        """
+        :param cluster: <int>, cluster id
+        :return: <tuple>, top, left, bottom, and right of the cluster, bottom and right are excluded
+        """
+        row, column = divmod(cluster, self.columns)
+        top = row * self.cluster_size
+        left = column * self.cluster_size
+        return top, left, min(top + self.cluster_size, self.height), min(left + self.cluster_size, self.width)
+
+    def get_neighbor_clusters(self, cluster):
+        """
+        :param cluster: <int>, cluster id
+        :return: <list>, cluster ids of the adjacent clusters, LEFT, RIGHT, UP, DOWN
+        """
+        row, column = divmod(cluster, self.columns)
+        neighbors = []
+        if column > 0:
+            neighbors.append(cluster - 1)
+        if column < self.columns - 1:
+            neighbors.append(cluster + 1)
+        if row > 0:
+            neighbors.append(cluster - self.columns)
+        if row < self.rows - 1:
+            neighbors.append(cluster + self.columns)
+        return neighbors
+
+    def get_borders(self, cluster):
+        """
+        :param cluster: <int>, cluster id
+        :return: <list>, borders of the cluster, border is (smaller cluster id, larger cluster id)
+        """
+        return [(min(cluster, neighbor), max(cluster, neighbor)) for neighbor in self.get_neighbor_clusters(cluster)]
+
+    def get_sub_grid(self, cluster):
+        """
+        :param cluster: <int>, cluster id
+        :return: <FlatGrid>, walls of the cluster only
+        """
+        top, left, bottom, right = self.get_bounds(cluster)
+        walls = bytearray()
+        for y in range(top, bottom):
+            walls += self.grid.walls[y * self.width + left:y * self.width + right]
+        return FlatGrid.from_walls(bottom - top, right - left, walls)
+
+    def find_transitions(self, border):
+        """
+        Find entrances on the border, and choose transitions of each entrance
+        :param border: <tuple>, (cluster id, cluster id of the cluster on the RIGHT or DOWN)
+        :return: <list>, (cell id in the first cluster, cell id in the second cluster)
+        """
+        cluster, other_cluster = border
+        top, left, bottom, right = self.get_bounds(cluster)
+        if other_cluster // self.columns == cluster // self.columns:
+            pairs = [(y * self.width + right - 1, y * self.width + right) for y in range(top, bottom)]
+        else:
+            pairs = [((bottom - 1) * self.width + x, bottom * self.width + x) for x in range(left, right)]
+
+        walls = self.grid.walls
+        transitions = []
+        entrance = []
+        for pair in pairs + [None]:
+            if pair is not None and walls[pair[0]] != WALL and walls[pair[1]] != WALL:
+                entrance.append(pair)
+                continue
+            if len(entrance) >= WIDE_ENTRANCE:
+                transitions.append(entrance[0])
+                transitions.append(entrance[-1])
+            elif len(entrance) > 0:
+                transitions.append(entrance[len(entrance) // 2])
+            entrance = []
+        return transitions
+
+    def build_border(self, border):
+        """
+        Replace the transitions of the border, and the edges between the clusters
+        :param border: <tuple>, (cluster id, cluster id)
+        :return: <None>
+        """
+        for cell, other_cell in self.transitions.get(border, []):
+            self.inter_edges[cell].discard(other_cell)
+            self.inter_edges[other_cell].discard(cell)
+
+        self.transitions[border] = self.find_transitions(border)
+        for cell, other_cell in self.transitions[border]:
+            self.inter_edges.setdefault(cell, set()).add(other_cell)
+            self.inter_edges.setdefault(other_cell, set()).add(cell)
+
+    def build_cluster(self, cluster):
+        """
+        Find nodes of the cluster, and the distance between every two nodes inside the cluster
+        :param cluster: <int>, cluster id
+        :return: <None>
+        """
+        for cell in self.cluster_nodes.get(cluster, []):
+            del self.intra_edges[cell]
+
+        nodes = set()
+        for border in self.get_borders(cluster):
+            for transition in self.transitions[border]:
+                nodes.update(cell for cell in transition if self.get_cluster(cell) == cluster)
+        nodes = sorted(nodes)
+        self.cluster_nodes[cluster] = nodes
+
+        sub_grid = self.get_sub_grid(cluster)
+        for cell in nodes:
+            self.intra_edges[cell] = self.get_cluster_distances(cluster, cell, nodes, sub_grid)
+
+    def get_cluster_distances(self, cluster, cell, targets, sub_grid=None):
+        """
+        :param cluster: <int>, cluster id
+        :param cell: <int>, cell id in the cluster
+        :param targets: <list>, cell ids in the cluster
+        :param sub_grid: <FlatGrid>, walls of the cluster if it is already made
+        :return: <dict>, distance from the cell to each target inside the cluster, if the target is reachable
+        """
+        top, left, bottom, right = self.get_bounds(cluster)
+        sub_width = right - left
+        y, x = divmod(cell, self.width)
+        if sub_grid is None:
+            sub_grid = self.get_sub_grid(cluster)
+        distances = get_distance_field(sub_grid, y - top, x - left)
+
+        edges = {}
+        for target in targets:
+            target_y, target_x = divmod(target, self.width)
+            distance = distances[(target_y - top) * sub_width + target_x - left]
+            if target != cell and distance != -1:
+                edges[target] = distance
+        return edges
+
+    def get_edges(self, cell):
+        """
+        :param cell: <int>, cell id of a node
+        :return: <list>, (cell id of the adjacent node, cost)
+        """
+        edges = list(self.intra_edges.get(cell, {}).items())
+        edges.extend((other_cell, 1) for other_cell in self.inter_edges.get(cell, ()))
+        return edges
+
+    def update_cell(self, y, x, value):
+        """
+        Change the cell, and rebuild the cluster of the cell, its borders, and the adjacent clusters
+        :param y: <int>
+        :param x: <int>
+        :param value: <int>, 0 is road, and 1 is wall
+        :return: <None>
+        """
+        cell = y * self.width + x
+        self.grid.walls[cell] = 1 if value == WALL else 0
+
+        cluster = self.get_cluster(cell)
+        for border in self.get_borders(cluster):
+            self.build_border(border)
+        for changed_cluster in [cluster] + self.get_neighbor_clusters(cluster):
+            self.build_cluster(changed_cluster)
+
+    def find_cluster_path(self, cell, other_cell):
+        """
+        Refine the edge between two cells of the same cluster by AStar inside the cluster
+        :param cell: <int>, cell id
+        :param other_cell: <int>, cell id
+        :return: <list>, (y, x) locations from the cell to the other cell
+        """
+        cluster = self.get_cluster(cell)
+        top, left, bottom, right = self.get_bounds(cluster)
+        y, x = divmod(cell, self.width)
+        other_y, other_x = divmod(other_cell, self.width)
+        a_star = AStar(self.get_sub_grid(cluster), y - top, x - left, other_y - top, other_x - left,
+                       frontier='indexed', layout='flat', state='arrays', trace='none')
+        explored, paths = a_star.search_answer()
+        return [(path_y + top, path_x + left) for path_y, path_x in paths]
+
+
+class HPAStar(object):
+    def __init__(self, cells, y_start, x_start, y_end, x_end, graph=None, cluster_size=16, near_optimal=True,
+                 trace=None):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list
+        :param y_start: <int>, 0 in this homework
+        :param x_start: <int>, 0 in this homework
+        :param y_end: <int>, height - 1 in this homework
+        :param x_end: <int>, width - 1 in this homework
+        :param graph: <ClusterGraph>, abstract graph which is already built for the cells
+        :param cluster_size: <int>, height and width of a cluster when the graph is built
+        :param near_optimal: <bool>, True searches the abstract graph and the path can be a bit longer,
+                             False searches every cell by AStar for the optimal path
+        :param trace: <str>, sink of explored abstract nodes, 'print', 'none', 'list', callback function,
+                      or trace object
+        """
+        self.y_start = y_start
+        self.x_start = x_start
+        self.y_end = y_end
+        self.x_end = x_end
+        self.graph = graph if graph is not None else ClusterGraph(cells, cluster_size)
+        self.near_optimal = near_optimal
+        self.trace = make_trace(trace)
+        self.explored = self.trace.explored
+
+    def search_answer(self):
+        """
+        :return: <tuple>, explored abstract nodes and path, path is None if the goal is not reachable
+        """
+        graph = self.graph
+        if not self.near_optimal:
+            a_star = AStar(graph.grid, self.y_start, self.x_start, self.y_end, self.x_end, frontier='indexed',
+                           layout='flat', state='arrays', trace=self.trace)
+            return a_star.search_answer()
+
+        width = graph.width
+        start = self.y_start * width + self.x_start
+        goal = self.y_end * width + self.x_end
+        if graph.grid.walls[start] == WALL or graph.grid.walls[goal] == WALL:
+            self.trace.finish(None)
+            return self.trace.explored, None
+
+        nodes = self.search_abstract_path(start, goal)
+        if nodes is None:
+            self.trace.finish(None)
+            return self.trace.explored, None
+
+        paths = [divmod(start, width)]
+        for cell, next_cell in zip(nodes, nodes[1:]):
+            if graph.get_cluster(cell) == graph.get_cluster(next_cell):
+                paths.extend(graph.find_cluster_path(cell, next_cell)[1:])
+            else:
+                paths.append(divmod(next_cell, width))
+        self.trace.finish(paths)
+        return self.trace.explored, paths
+
+    def search_abstract_path(self, start, goal):
+        """
+        Insert the start and the goal to the abstract graph, and search the graph by A*
+        :param start: <int>, cell id
+        :param goal: <int>, cell id
+        :return: <list>, cell ids of the abstract path from the start to the goal, or None if there is no path
+        """
+        graph = self.graph
+        width = graph.width
+        start_cluster = graph.get_cluster(start)
+        goal_cluster = graph.get_cluster(goal)
+
+        # Edges from the start to the nodes of its cluster, and from the nodes of the goal cluster to the goal
+        # Goal in the same cluster can be reached from the start directly
+        start_targets = graph.cluster_nodes[start_cluster]
+        if goal_cluster == start_cluster:
+            start_targets = start_targets + [goal]
+        start_edges = graph.get_cluster_distances(start_cluster, start, start_targets)
+        goal_edges = graph.get_cluster_distances(goal_cluster, goal, graph.cluster_nodes[goal_cluster])
+
+        back_costs = {start: 0}
+        parents = {start: None}
+        closed = set()
+        queued = [(self.get_forward_cost(start), start)]
+        while len(queued) > 0:
+            cost, cell = heapq.heappop(queued)
+            if cell in closed:
+                continue
+            closed.add(cell)
+            y, x = divmod(cell, width)
+            self.trace.explore(y, x)
+
+            if cell == goal:
+                nodes = []
+                while cell is not None:
+                    nodes.append(cell)
+                    cell = parents[cell]
+                nodes.reverse()
+                return nodes
+
+            edges = graph.get_edges(cell)
+            if cell == start:
+                edges.extend(start_edges.items())
+            if cell in goal_edges:
+                edges.append((goal, goal_edges[cell]))
+            for next_cell, edge_cost in edges:
+                back_cost = back_costs[cell] + edge_cost
+                if next_cell in closed or (next_cell in back_costs and back_cost >= back_costs[next_cell]):
+                    continue
+                back_costs[next_cell] = back_cost
+                parents[next_cell] = cell
+                heapq.heappush(queued, (back_cost + self.get_forward_cost(next_cell), next_cell))
+        return None
+
+    def get_forward_cost(self, cell):
+        y, x = divmod(cell, self.graph.width)
+        return abs(self.y_end - y) + abs(self.x_end - x)
+
+
+def main(path_format='list'):
+    """
+    :param path_format: <str>, 'list' writes every location of the path, 'directions' writes compact path
+    """
+    output_file = open("output.txt", "w")
+    # read mazes one by one
+    for height, width, cells in MazeReader('input.txt').mazes():
+        y_start = 0
+        x_start = 0
+        y_end = height - 1
+        x_end = width - 1
+
+        hpa_star = HPAStar(cells, y_start, x_start, y_end, x_end)
+        explored, paths = hpa_star.search_answer()
+
+        for ele in explored:
+            output_file.write(str(ele) + "\n")
+
+        output_file.write(format_paths(paths, path_format))
+        output_file.write("\n\n")
+
+    output_file.close()
+
+
+if __name__ == '__main__':
+    main()
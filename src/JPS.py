@@ -0,0 +1,320 @@
+"""
+Jump Point Search for 4-connected grids where every step costs 1
+A* search which does not queue every adjacent cell, but jumps straight until a jump point is found
+
+Moving horizontally, a cell is a jump point if it is the goal,
+or the cell above or below is road while the cell behind it is wall (forced neighbor)
+Moving vertically, a cell is a jump point if it is the goal, it has a forced neighbor on the left or right,
+or a horizontal jump from the cell finds a jump point
+
+Only jump points are queued and explored, so symmetric paths in open area are not queued
+
+Walls and jump points of each row are kept in bits of an int, bit x is the cell (y, x), when a jump reaches the row
+Horizontal jump finds the first jump point before the first wall by bit operations instead of stepping,
+and each step of a vertical jump tests one bit of the cells which stop the vertical jump in the row,
+so a jump costs O(1) per row, not O(width) for the horizontal jumps from every cell on the way
+
+Cost and forward cost are same as AStar, backward cost is the number of step, and forward cost is Manhattan distance
+Jump points of the same cost are broken by the distance from the line between the start and the goal,
+a long jump along the border is closer to the goal by Euclidean distance, but it leaves the line of the optimal paths
+Parent of each jump point is the previous jump point, and the cells between them are filled for the optimal path
+"""
+
+from AStar import AStar
+from MazeReader import MazeReader
+from PathEncoding import format_paths
+
+
+class JPS(AStar):
+    def __init__(self, cells, y_start, x_start, y_end, x_end, frontier='indexed', layout='nested', trace=None,
+                 components=None):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list
+        :param y_start: <int>, 0 in this homework
+        :param x_start: <int>, 0 in this homework
+        :param y_end: <int>, height - 1 in this homework
+        :param x_end: <int>, width - 1 in this homework
+        :param frontier: <str>, priority queue of the frontier, 'list', 'lazy', 'indexed' or 'bucket',
+                         'indexed' by default because jump points are often queued again with smaller cost
+        :param layout: <str>, tables of the grid, 'nested' list of lists or 'flat' bytearray
+        :param trace: <str>, sink of explored jump points, 'print', 'none', 'list', callback function, or trace object
+        :param components: <Components>, connected components of the maze, disconnected goal is rejected at once
+        """
+        super(JPS, self).__init__(cells, y_start, x_start, y_end, x_end, frontier=frontier, layout=layout,
+                                  state='arrays', trace=trace, components=components)
+        height = self.grid.height
+        self.row_mask = (1 << self.grid.width) - 1
+        # bits of each row, None until a jump reaches the row
+        self.row_walls = [None] * height
+        # jump points moving right and left
+        self.row_jump_points = [None] * height
+        # cells which stop the vertical jump moving down and up, both are made when a vertical jump reaches the row
+        self.down_points = [None] * height
+        self.up_points = [None] * height
+
+    def search_cells(self):
+        """
+        Search answer from starting point (0, 0) by jumping between jump points
+        :return: <generator>, (y, x) of each explored jump point, and the optimal path is returned
+        """
+        width = self.grid.width
+        arrays = self.arrays
+
+        start = self.y_start * width + self.x_start
+        start_cost = self.get_forward_cost(self.y_start, self.x_start)
+        arrays.set_cell(start, 0, start_cost, -1)
+        self.queued.push(start, (start_cost, self.get_tie_breaker(self.y_start, self.x_start), start))
+        self.grid.set_queued(self.y_start, self.x_start)
+
+        while len(self.queued) > 0:
+            current_cost, current_tie_index, cell = self.queued.pop()
+            y, x = divmod(cell, width)
+            if self.grid.is_visited(y, x):
+                continue
+            self.grid.set_visited(y, x)
+            yield y, x
+            self.y = y
+            self.x = x
+
+            # End search when the goal is found
+            if y == self.y_end and x == self.x_end:
+                return self.get_path(cell)
+
+            for dy, dx in self.get_directions(cell):
+                jump_point = self.jump(y, x, dy, dx)
+                if jump_point is None:
+                    continue
+
+                next_y, next_x = jump_point
+                if self.grid.is_visited(next_y, next_x):
+                    continue
+
+                next_cell = next_y * width + next_x
+                back_cost = arrays.back_costs[cell] + self.get_manhattan_distance(next_y, next_x, y, x)
+                is_queued = self.grid.is_queued(next_y, next_x)
+                if is_queued and back_cost >= arrays.back_costs[next_cell]:
+                    continue
+
+                tie = self.get_tie_breaker(next_y, next_x)
+                cost = back_cost + self.get_forward_cost(next_y, next_x)
+                el_set = (cost, tie, next_cell)
+                if is_queued:
+                    self.queued.update(next_cell, (arrays.costs[next_cell], tie, next_cell), el_set)
+                else:
+                    self.queued.push(next_cell, el_set)
+                arrays.set_cell(next_cell, back_cost, cost, cell)
+                self.grid.set_queued(next_y, next_x)
+
+        return None
+
+    def get_directions(self, cell):
+        """
+        Prune directions by the direction from the parent jump point
+        Moving horizontally, go straight, up, and down
+        Moving vertically, go straight, left, and right
+        :param cell: <int>, cell id
+        :return: <list>, (dy, dx) directions to jump
+        """
+        parent = self.arrays.parents[cell]
+        if parent == -1:
+            return [(0, -1), (0, 1), (-1, 0), (1, 0)]
+
+        y, x = divmod(cell, self.grid.width)
+        parent_y, parent_x = divmod(parent, self.grid.width)
+        if y == parent_y:
+            dx = 1 if x > parent_x else -1
+            return [(0, dx), (-1, 0), (1, 0)]
+        dy = 1 if y > parent_y else -1
+        return [(dy, 0), (0, -1), (0, 1)]
+
+    def jump(self, y, x, dy, dx):
+        """
+        Move straight from (y, x) until a jump point is found
+        :param y: <int>
+        :param x: <int>
+        :param dy: <int>, -1, 0, or 1
+        :param dx: <int>, -1, 0, or 1
+        :return: <tuple>, (y, x) of the jump point, or None if wall or border is reached
+        """
+        if dx != 0:
+            return self.jump_row(y, x, dx)
+
+        height = self.grid.height
+        bit = 1 << x
+        while True:
+            y = y + dy
+            if y < 0 or y >= height or self.get_row_walls(y) & bit:
+                return None
+            if self.get_vertical_points(y, dy) & bit:
+                return y, x
+
+    def jump_row(self, y, x, dx):
+        """
+        Move horizontally from (y, x) until a jump point is found, by the bits of the row
+        :param y: <int>
+        :param x: <int>
+        :param dx: <int>, -1 or 1
+        :return: <tuple>, (y, x) of the jump point, or None if wall or border is reached
+        """
+        walls = self.get_row_walls(y)
+        right_points, left_points = self.get_jump_points(y)
+        if dx > 0:
+            # Border is wall, and the cells before the first wall are reachable
+            ahead = (walls | (self.row_mask + 1)) >> (x + 1)
+            points = (right_points >> (x + 1)) & ((ahead & -ahead) - 1)
+            if points == 0:
+                return None
+            return y, x + (points & -points).bit_length()
+
+        behind = (1 << x) - 1
+        points = left_points & behind
+        # The nearest jump point is the highest bit, and it is not reachable if the nearest wall is not lower
+        if points == 0 or (walls & behind).bit_length() >= points.bit_length():
+            return None
+        return y, points.bit_length() - 1
+
+    def get_row_walls(self, y) -> int:
+        """
+        :param y: <int>
+        :return: <int>, bit x is 1 if (y, x) is wall, every bit is 1 out of the grid
+        """
+        if y < 0 or y >= self.grid.height:
+            return self.row_mask
+        walls = self.row_walls[y]
+        if walls is None:
+            walls = self.grid.get_row_walls(y)
+            self.row_walls[y] = walls
+        return walls
+
+    def get_jump_points(self, y):
+        """
+        Cells of the row which stop a horizontal jump, the goal and the cells which have a forced neighbor
+        Moving right, the cell above or below is road while the cell behind it, on the left, is wall
+        :param y: <int>
+        :return: <tuple>, bits of the jump points moving right, and bits of the jump points moving left
+        """
+        jump_points = self.row_jump_points[y]
+        if jump_points is None:
+            row_mask = self.row_mask
+            right_points = 0
+            left_points = 0
+            for walls in (self.get_row_walls(y - 1), self.get_row_walls(y + 1)):
+                roads = ~walls & row_mask
+                # Cell out of the grid is wall
+                right_points |= roads & ((walls << 1) | 1)
+                left_points |= roads & ((walls >> 1) | ((row_mask + 1) >> 1))
+            if y == self.y_end:
+                right_points |= 1 << self.x_end
+                left_points |= 1 << self.x_end
+            jump_points = (right_points, left_points)
+            self.row_jump_points[y] = jump_points
+        return jump_points
+
+    def get_vertical_points(self, y, dy) -> int:
+        """
+        Cells of the row which stop a vertical jump, the goal, the cells which have a forced neighbor,
+        and the cells from which a horizontal jump finds a jump point
+        Moving down, the cell on the left or right is road while the cell behind it, above, is wall
+        :param y: <int>
+        :param dy: <int>, -1 or 1
+        :return: <int>, bit x is 1 if the vertical jump stops at (y, x)
+        """
+        points = self.down_points[y] if dy > 0 else self.up_points[y]
+        if points is None:
+            # Both directions share the cells from which a horizontal jump finds a jump point
+            row_mask = self.row_mask
+            roads = ~self.get_row_walls(y) & row_mask
+            right_points, left_points = self.get_jump_points(y)
+            reaching = self.get_reaching_cells(right_points & roads, roads, 1) | \
+                self.get_reaching_cells(left_points & roads, roads, -1)
+            if y == self.y_end:
+                reaching |= 1 << self.x_end
+            forced = roads & self.get_row_walls(y - 1)
+            self.down_points[y] = ((forced << 1) | (forced >> 1)) & row_mask | reaching
+            forced = roads & self.get_row_walls(y + 1)
+            self.up_points[y] = ((forced << 1) | (forced >> 1)) & row_mask | reaching
+            points = self.down_points[y] if dy > 0 else self.up_points[y]
+        return points
+
+    def get_reaching_cells(self, points, roads, dx) -> int:
+        """
+        Cells from which a horizontal jump reaches one of the points through the roads
+        Cell reaches the points if the next cell is a point, or the next cell is road which reaches the points,
+        the runs of roads are filled in O(log width) steps of shifting by 1, 2, 4, ... cells
+        :param points: <int>, bits of the jump points
+        :param roads: <int>, bits of the roads
+        :param dx: <int>, 1 moving right, or -1 moving left
+        :return: <int>, bits of the cells which reach the points
+        """
+        row_mask = self.row_mask
+        if dx > 0:
+            reaching = points >> 1
+            passing = roads >> 1
+        else:
+            reaching = (points << 1) & row_mask
+            passing = (roads << 1) & row_mask
+        shift = 1
+        while shift < self.grid.width and reaching != 0:
+            if dx > 0:
+                reaching |= passing & (reaching >> shift)
+                passing &= passing >> shift
+            else:
+                reaching |= passing & (reaching << shift)
+                passing &= passing << shift
+            shift <<= 1
+        return reaching & row_mask
+
+    def get_tie_breaker(self, y, x):
+        """
+        Distance from the line between the start and the goal, and forward cost for the same distance
+        :param y: <int>
+        :param x: <int>
+        :return: <int>, smaller is explored first
+        """
+        cross = abs((y - self.y_end) * (self.x_start - self.x_end) - (x - self.x_end) * (self.y_start - self.y_end))
+        return cross * (self.grid.height + self.grid.width) + self.get_manhattan_distance(self.y_end, self.x_end, y, x)
+
+    def get_path(self, cell):
+        """
+        Follow parent jump points, and fill the cells between the jump points
+        :param cell: <int>, cell id of the goal
+        :return: <list>, (y, x) locations from the start to the goal
+        """
+        jump_points = self.arrays.get_path(cell)
+        paths = [jump_points[0]]
+        for (y, x), (next_y, next_x) in zip(jump_points, jump_points[1:]):
+            dy = (next_y > y) - (next_y < y)
+            dx = (next_x > x) - (next_x < x)
+            while (y, x) != (next_y, next_x):
+                y = y + dy
+                x = x + dx
+                paths.append((y, x))
+        return paths
+
+
+def main(path_format='list'):
+    """
+    :param path_format: <str>, 'list' writes every location of the optimal path, 'directions' writes compact path
+    """
+    output_file = open("output.txt", "w")
+    # read mazes one by one
+    for height, width, cells in MazeReader('input.txt').mazes():
+        y_start = 0
+        x_start = 0
+        y_end = height - 1
+        x_end = width - 1
+
+        jps = JPS(cells, y_start, x_start, y_end, x_end)
+        explored, paths = jps.search_answer()
+
+        for ele in explored:
+            output_file.write(str(ele) + "\n")
+
+        output_file.write(format_paths(paths, path_format))
+        output_file.write("\n\n")
+
+    output_file.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+"""
+ALT heuristic (A*, Landmarks, Triangle inequality) for AStar
+K landmark cells are chosen, and BFS distance from each landmark to every cell is kept in a table
+
+By triangle inequality, distance(v, goal) >= |distance(L, goal) - distance(L, v)| for every landmark L
+Forward cost is the largest of these bounds and Manhattan distance, so it is never larger than the real distance
+In mazes which have many walls, this is much closer to the real distance than Manhattan distance
+
+Landmarks are chosen by
+    'farthest': each landmark is the cell farthest from the landmarks already chosen
+    'planar': each landmark is the road farthest from the center in K directions around the maze
+Tables use 2 bytes per cell (4 bytes if the maze is too large), and they are saved to file once per maze
+"""
+
+import math
+import struct
+from array import array
+
+from DistanceCache import get_maze_hash
+from Grid import get_flat_grid
+from WavefrontBFS import get_distance_field
+
+MAGIC = b'ALT1'
+
+
+class LandmarkHeuristic(object):
+    def __init__(self, landmarks, y_end, x_end):
+        """
+        :param landmarks: <Landmarks>
+        :param y_end: <int>, y of the goal
+        :param x_end: <int>, x of the goal
+        """
+        self.width = landmarks.width
+        self.y_end = y_end
+        self.x_end = x_end
+        self.unreachable = landmarks.unreachable
+
+        # Landmarks which can not reach the goal give no bound
+        goal = y_end * self.width + x_end
+        self.tables = []
+        for table in landmarks.tables:
+            if table[goal] != self.unreachable:
+                self.tables.append((table, table[goal]))
+
+    def get_cost(self, y, x) -> int:
+        """
+        :param y: <int>
+        :param x: <int>
+        :return: <int>, the largest lower bound of the distance to the goal
+        """
+        cost = abs(self.y_end - y) + abs(self.x_end - x)
+        cell = y * self.width + x
+        for table, goal_distance in self.tables:
+            distance = table[cell]
+            if distance != self.unreachable:
+                bound = abs(goal_distance - distance)
+                if bound > cost:
+                    cost = bound
+        return cost
+
+
+class Landmarks(object):
+    def __init__(self, cells, count=8, selection='farthest'):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list, or grid
+        :param count: <int>, the number of landmarks K
+        :param selection: <str>, 'farthest' or 'planar'
+        """
+        grid = get_flat_grid(cells)
+        self.height = grid.height
+        self.width = grid.width
+        self.maze_hash = get_maze_hash(grid)
+        self.typecode = 'H' if self.height * self.width < 0xFFFF else 'I'
+        self.unreachable = 0xFFFF if self.typecode == 'H' else 0xFFFFFFFF
+        self.locations = []
+        self.tables = []
+
+        if selection == 'farthest':
+            self.select_farthest(grid, count)
+        elif selection == 'planar':
+            self.select_planar(grid, count)
+        else:
+            raise ValueError("unknown landmark selection: " + str(selection))
+
+    def add_landmark(self, grid, y, x):
+        """
+        :return: <array>, distance from the landmark, unreachable for walls and the cells which are not reachable
+        """
+        distances = get_distance_field(grid, y, x)
+        table = array(self.typecode, [self.unreachable]) * len(distances)
+        for cell, distance in enumerate(distances):
+            if distance != -1:
+                table[cell] = distance
+        self.locations.append((y, x))
+        self.tables.append(table)
+        return table
+
+    def select_farthest(self, grid, count):
+        """
+        First landmark is the farthest cell from the first road
+        Next landmark is the cell whose distance to the nearest landmark is the largest
+        """
+        roads = [cell for cell in range(self.height * self.width) if grid.walls[cell] != 1]
+        if len(roads) == 0:
+            return
+
+        # distance from the first road at first, and then distance to the nearest landmark
+        nearest = list(get_distance_field(grid, *divmod(roads[0], self.width)))
+        for i in range(min(count, len(roads))):
+            farthest = max(roads, key=lambda cell: nearest[cell])
+            if i > 0 and nearest[farthest] <= 0:
+                break
+
+            table = self.add_landmark(grid, *divmod(farthest, self.width))
+            for cell in roads:
+                distance = table[cell]
+                if distance != self.unreachable and (i == 0 or nearest[cell] == -1 or distance < nearest[cell]):
+                    nearest[cell] = distance
+
+    def select_planar(self, grid, count):
+        """
+        Divide the maze into K directions from the center, and choose the road farthest along each direction
+        """
+        y_center = (self.height - 1) / 2
+        x_center = (self.width - 1) / 2
+        roads = [cell for cell in range(self.height * self.width) if grid.walls[cell] != 1]
+        chosen = set()
+        for i in range(min(count, len(roads))):
+            angle = 2 * math.pi * i / count
+            dy = math.sin(angle)
+            dx = math.cos(angle)
+            farthest = max(roads, key=lambda cell: (cell // self.width - y_center) * dy +
+                                                   (cell % self.width - x_center) * dx)
+            if farthest not in chosen:
+                chosen.add(farthest)
+                self.add_landmark(grid, *divmod(farthest, self.width))
+
+    def get_heuristic(self, y_end, x_end):
+        """
+        :param y_end: <int>, y of the goal
+        :param x_end: <int>, x of the goal
+        :return: <LandmarkHeuristic>, forward cost for AStar(heuristic=...)
+        """
+        return LandmarkHeuristic(self, y_end, x_end)
+
+    def save(self, file_name):
+        """
+        Save the landmarks and the tables
+        Header is magic, height, width, the number of landmarks, type code, and hash of the maze
+        :param file_name: <str>
+        :return: <None>
+        """
+        with open(file_name, 'wb') as output_file:
+            output_file.write(MAGIC)
+            output_file.write(struct.pack('<IIIc', self.height, self.width, len(self.locations),
+                                          self.typecode.encode()))
+            output_file.write(self.maze_hash.encode())
+            for y, x in self.locations:
+                output_file.write(struct.pack('<II', y, x))
+            for table in self.tables:
+                output_file.write(table.tobytes())
+
+    @classmethod
+    def load(cls, file_name, cells=None):
+        """
+        :param file_name: <str>
+        :param cells: <list>, if it is given, the file must be made from the same maze
+        :return: <Landmarks>
+        """
+        landmarks = cls.__new__(cls)
+        with open(file_name, 'rb') as input_file:
+            if input_file.read(len(MAGIC)) != MAGIC:
+                raise ValueError("not a landmark file: " + str(file_name))
+            height, width, count, typecode = struct.unpack('<IIIc', input_file.read(struct.calcsize('<IIIc')))
+            landmarks.height = height
+            landmarks.width = width
+            landmarks.typecode = typecode.decode()
+            landmarks.unreachable = 0xFFFF if landmarks.typecode == 'H' else 0xFFFFFFFF
+            landmarks.maze_hash = input_file.read(32).decode()
+            landmarks.locations = [struct.unpack('<II', input_file.read(8)) for i in range(count)]
+            landmarks.tables = []
+            for i in range(count):
+                table = array(landmarks.typecode)
+                table.frombytes(input_file.read(table.itemsize * height * width))
+                landmarks.tables.append(table)
+
+        if cells is not None and get_maze_hash(get_flat_grid(cells)) != landmarks.maze_hash:
+            raise ValueError("landmark file is made from another maze: " + str(file_name))
+        return landmarks
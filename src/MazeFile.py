@@ -0,0 +1,189 @@
+"""
+Binary maze file, which is loaded through mmap without parsing or copying the cells
+
+File header is magic and the number of mazes, and the index of the byte offset of each maze follows it
+Each maze has a header of height, width, start, goal, and bits per cell, and the cells start at the next 8 bytes
+1 bit per cell keeps only the walls, bit (index & 7) of byte (index >> 3) is 1 for wall
+1 byte per cell keeps the value of each cell, 0 is road, 1 is wall, and other values are kept for weighted cells
+
+The cells are viewed as the walls of BitGrid or FlatGrid directly, so the grid is made in O(1) for any size
+The file is mapped copy on write, so set_cell changes only the grid in memory and the file is not changed
+
+python MazeFile.py input.txt input.maze [bits]
+"""
+
+import mmap
+import struct
+import sys
+
+from Grid import BitGrid, FlatGrid, pack_walls
+from MazeReader import MazeReader
+
+MAGIC = b'MAZ1'
+FILE_HEADER = struct.Struct('<4sI')
+INDEX_ENTRY = struct.Struct('<Q')
+# height, width, y_start, x_start, y_end, x_end, bits per cell
+MAZE_HEADER = struct.Struct('<IIIIIIB')
+ALIGNMENT = 8
+# digit -> value of the cell for 1 byte per cell
+VALUE_TABLE = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+
+def get_aligned(position):
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_mazes(file_name, mazes, count, bits=1):
+    """
+    Write mazes one by one, only one maze is kept in memory
+    :param file_name: <str>, output file
+    :param mazes: <iterable>, (height, width, walls, (y, x) of the start, (y, x) of the goal),
+                  walls is bytes of cell values at index y * width + x
+    :param count: <int>, the number of mazes
+    :param bits: <int>, 1 bit per cell for walls, or 8 bits per cell for the values of the cells
+    :return: <None>
+    """
+    if bits not in (1, 8):
+        raise ValueError("unknown bits per cell: " + str(bits))
+
+    offsets = []
+    with open(file_name, 'wb') as output_file:
+        output_file.write(FILE_HEADER.pack(MAGIC, count))
+        # Index is written again after the offsets are known
+        output_file.write(bytes(INDEX_ENTRY.size * count))
+        for height, width, walls, start, goal in mazes:
+            position = get_aligned(output_file.tell())
+            output_file.write(bytes(position - output_file.tell()))
+            offsets.append(position)
+            output_file.write(MAZE_HEADER.pack(height, width, start[0], start[1], goal[0], goal[1], bits))
+            output_file.write(bytes(get_aligned(output_file.tell()) - output_file.tell()))
+            if bits == 1:
+                output_file.write(pack_walls(walls))
+            else:
+                output_file.write(walls)
+
+        if len(offsets) != count:
+            raise ValueError("expected " + str(count) + " mazes, but got " + str(len(offsets)))
+        output_file.seek(FILE_HEADER.size)
+        for offset in offsets:
+            output_file.write(INDEX_ENTRY.pack(offset))
+
+
+def convert(input_file_name, output_file_name, bits=1):
+    """
+    Convert the input file of the homework, start is (0, 0) and goal is (height - 1, width - 1)
+    :param input_file_name: <str>, comma separated text of MazeReader
+    :param output_file_name: <str>, binary maze file
+    :param bits: <int>, 1 or 8 bits per cell
+    :return: <int>, the number of mazes
+    """
+    reader = MazeReader(input_file_name)
+    count = len(reader)
+
+    def get_mazes():
+        for number in range(count):
+            height, width, rows = reader.load_rows(number)
+            values = rows.translate(VALUE_TABLE, b', \t\r\n')
+            if len(values) != height * width:
+                raise ValueError("expected " + str(height * width) + " cells, but got " + str(len(values)))
+            yield height, width, values, (0, 0), (height - 1, width - 1)
+
+    write_mazes(output_file_name, get_mazes(), count, bits)
+    return count
+
+
+class MazeFile(object):
+    def __init__(self, file_name):
+        """
+        :param file_name: <str>, binary maze file
+        """
+        self.file_name = file_name
+        with open(file_name, 'rb') as input_file:
+            self.mm = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.view = memoryview(self.mm)
+
+        magic, count = FILE_HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("not a maze file: " + str(file_name))
+        self.index = [INDEX_ENTRY.unpack_from(self.mm, FILE_HEADER.size + INDEX_ENTRY.size * number)[0]
+                      for number in range(count)]
+
+    def __len__(self):
+        return len(self.index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Grids of the file view the mapped memory, so the memory is unmapped when the last grid is dropped
+        Without grids which are still alive, the memory is unmapped at once
+        """
+        if self.mm is None:
+            return
+        view = self.view
+        mm = self.mm
+        self.view = None
+        self.mm = None
+        view.release()
+        try:
+            mm.close()
+        except BufferError:
+            # Views of the grids keep the mapping, and it is unmapped when they are dropped
+            pass
+
+    def get_header(self, number):
+        """
+        :param number: <int>, 0 is the first maze
+        :return: <tuple>, (height, width, y_start, x_start, y_end, x_end, bits per cell)
+        """
+        return MAZE_HEADER.unpack_from(self.mm, self.index[number])
+
+    def get_start_goal(self, number):
+        """
+        :param number: <int>, 0 is the first maze
+        :return: <tuple>, ((y, x) of the start, (y, x) of the goal)
+        """
+        height, width, y_start, x_start, y_end, x_end, bits = self.get_header(number)
+        return (y_start, x_start), (y_end, x_end)
+
+    def load(self, number):
+        """
+        View the cells of one maze as the grid without copying them
+        :param number: <int>, 0 is the first maze
+        :return: <tuple>, (height, width, BitGrid for 1 bit per cell or FlatGrid for 1 byte per cell)
+        """
+        height, width, y_start, x_start, y_end, x_end, bits = self.get_header(number)
+        position = get_aligned(self.index[number] + MAZE_HEADER.size)
+        if bits == 1:
+            cells = self.view[position:position + (height * width + 7) // 8]
+            return height, width, BitGrid.from_bits(height, width, cells)
+        cells = self.view[position:position + height * width]
+        return height, width, FlatGrid.from_walls(height, width, cells)
+
+    def mazes(self):
+        """
+        :return: <generator>, (height, width, grid) like MazeReader
+        """
+        for number in range(len(self.index)):
+            yield self.load(number)
+
+    def __iter__(self):
+        return self.mazes()
+
+
+def main():
+    # python MazeFile.py [input file] [output file] [bits]
+    input_file_name = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
+    output_file_name = sys.argv[2] if len(sys.argv) > 2 else 'input.maze'
+    bits = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    count = convert(input_file_name, output_file_name, bits)
+    print(str(count) + " mazes are written to " + output_file_name)
+
+
+if __name__ == '__main__':
+    main()
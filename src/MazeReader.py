@@ -0,0 +1,165 @@
+"""
+Read mazes from the input file of the homework
+
+The first line is the number of mazes T
+Each maze has a blank line, "height width" line, and height rows of comma separated cells
+0 is road, and 1 is wall
+
+mazes() reads the file from the beginning, and yields one maze at a time
+build_index() keeps the byte offset of each maze, so load(number) reads only that maze through mmap
+Each maze is (height, width, cells), and cells is list of lists for 'nested' layout or FlatGrid for 'flat' layout
+"""
+
+import mmap
+from array import array
+
+from Grid import FlatGrid
+
+# '1' is wall, and other digits are road
+WALL_TABLE = bytes.maketrans(b'0123456789', b'\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00')
+SEPARATORS = b', \t\r\n'
+
+
+def parse_rows(rows, height, width, layout):
+    """
+    :param rows: <list>, bytes of each row, or <bytes>, all rows
+    :param height: <int>
+    :param width: <int>
+    :param layout: <str>, 'nested' or 'flat'
+    :return: <list> or <FlatGrid>
+    """
+    if layout == 'nested':
+        if isinstance(rows, bytes):
+            rows = rows.splitlines()
+        cells = []
+        for row in rows:
+            row = row.strip()
+            if len(row) > 0:
+                cells.append([int(element) for element in row.split(b',')])
+        if len(cells) != height:
+            raise ValueError("expected " + str(height) + " rows, but got " + str(len(cells)))
+        return cells
+
+    if layout == 'flat':
+        if not isinstance(rows, bytes):
+            rows = b''.join(rows)
+        walls = bytearray(rows.translate(WALL_TABLE, SEPARATORS))
+        if len(walls) != height * width:
+            raise ValueError("expected " + str(height * width) + " cells, but got " + str(len(walls)))
+        return FlatGrid.from_walls(height, width, walls)
+
+    raise ValueError("unknown grid layout: " + str(layout))
+
+
+class MazeReader(object):
+    def __init__(self, file_name, layout='nested'):
+        """
+        :param file_name: <str>, input file
+        :param layout: <str>, 'nested' list of lists or 'flat' bytearray
+        """
+        self.file_name = file_name
+        self.layout = layout
+        self.index = None
+
+    def mazes(self):
+        """
+        Read mazes one by one, only one maze is kept in memory
+        :return: <generator>, (height, width, cells)
+        """
+        with open(self.file_name, 'rb') as input_file:
+            T = int(input_file.readline())
+            for i in range(T):
+                header = input_file.readline()
+                while len(header) > 0 and len(header.strip()) == 0:
+                    header = input_file.readline()
+                height, width = header.split()
+                height = int(height)
+                width = int(width)
+
+                rows = [input_file.readline() for h in range(height)]
+                yield height, width, parse_rows(rows, height, width, self.layout)
+
+    def __iter__(self):
+        return self.mazes()
+
+    def build_index(self):
+        """
+        Find byte offset of "height width" line of each maze without parsing the cells
+        :return: <array>, byte offsets
+        """
+        index = array('q')
+        with open(self.file_name, 'rb') as input_file:
+            with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                position = mm.find(b'\n') + 1
+                T = int(mm[:position])
+                for i in range(T):
+                    position = self.skip_blank_lines(mm, position)
+                    index.append(position)
+                    end = mm.find(b'\n', position)
+                    height = int(mm[position:end].split()[0])
+                    position = self.skip_rows(mm, end + 1, height)
+        self.index = index
+        return index
+
+    def save_index(self, index_file_name):
+        with open(index_file_name, 'wb') as index_file:
+            self.index.tofile(index_file)
+
+    def load_index(self, index_file_name):
+        index = array('q')
+        with open(index_file_name, 'rb') as index_file:
+            index.frombytes(index_file.read())
+        self.index = index
+        return index
+
+    def load(self, number):
+        """
+        Read only one maze by using the index
+        :param number: <int>, 0 is the first maze
+        :return: <tuple>, (height, width, cells)
+        """
+        height, width, rows = self.load_rows(number)
+        return height, width, parse_rows(rows, height, width, self.layout)
+
+    def load_rows(self, number):
+        """
+        Read the rows of one maze without parsing them
+        :param number: <int>, 0 is the first maze
+        :return: <tuple>, (height, width, bytes of all rows)
+        """
+        if self.index is None:
+            self.build_index()
+        with open(self.file_name, 'rb') as input_file:
+            with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                position = self.index[number]
+                end = mm.find(b'\n', position)
+                height, width = mm[position:end].split()
+                height = int(height)
+                width = int(width)
+                rows_end = self.skip_rows(mm, end + 1, height)
+                return height, width, mm[end + 1:rows_end]
+
+    def __len__(self):
+        if self.index is None:
+            self.build_index()
+        return len(self.index)
+
+    @staticmethod
+    def skip_blank_lines(mm, position):
+        while position < len(mm):
+            end = mm.find(b'\n', position)
+            if end == -1:
+                end = len(mm)
+            if len(mm[position:end].strip()) > 0:
+                break
+            position = end + 1
+        return position
+
+    @staticmethod
+    def skip_rows(mm, position, height):
+        for h in range(height):
+            end = mm.find(b'\n', position)
+            if end == -1:
+                return len(mm)
+            position = end + 1
+        return position
@@ -0,0 +1,103 @@
+"""
+Compact encodings of the optimal path
+Path is a list of (y, x) locations from the start to the goal, and each step moves to an adjacent cell
+
+Directions: start location and run length encoded directions, L is left, R is right, U is up, and D is down
+For example, [(0, 0), (0, 1), (0, 2), (1, 2)] is (0, 0) and "R2D1"
+
+Cells: packed array of cell ids, cell id is y * width + x
+NO_PATH is written instead of the path when the goal is not reachable
+"""
+
+from array import array
+
+DIRECTIONS = {
+    (0, -1): 'L',
+    (0, 1): 'R',
+    (-1, 0): 'U',
+    (1, 0): 'D',
+}
+STEPS = {direction: step for step, direction in DIRECTIONS.items()}
+NO_PATH = 'no path'
+
+
+def encode_directions(paths):
+    """
+    :param paths: <list>, (y, x) locations from the start to the goal
+    :return: <tuple>, (y, x) of the start, and run length encoded directions
+    """
+    runs = []
+    direction = None
+    count = 0
+    for (y, x), (next_y, next_x) in zip(paths, paths[1:]):
+        next_direction = DIRECTIONS[(next_y - y, next_x - x)]
+        if next_direction == direction:
+            count += 1
+            continue
+        if direction is not None:
+            runs.append(direction + str(count))
+        direction = next_direction
+        count = 1
+    if direction is not None:
+        runs.append(direction + str(count))
+    return paths[0], ''.join(runs)
+
+
+def decode_directions(start, directions):
+    """
+    :param start: <tuple>, (y, x) of the start
+    :param directions: <str>, run length encoded directions
+    :return: <list>, (y, x) locations from the start to the goal
+    """
+    y, x = start
+    paths = [(y, x)]
+    index = 0
+    while index < len(directions):
+        dy, dx = STEPS[directions[index]]
+        end = index + 1
+        while end < len(directions) and directions[end].isdigit():
+            end += 1
+        for i in range(int(directions[index + 1:end])):
+            y = y + dy
+            x = x + dx
+            paths.append((y, x))
+        index = end
+    return paths
+
+
+def encode_cells(paths, width):
+    """
+    :param paths: <list>, (y, x) locations from the start to the goal
+    :param width: <int>
+    :return: <array>, cell ids
+    """
+    return array('q', [y * width + x for y, x in paths])
+
+
+def decode_cells(cells, width):
+    """
+    :param cells: <array>, cell ids
+    :param width: <int>
+    :return: <list>, (y, x) locations from the start to the goal
+    """
+    return [divmod(cell, width) for cell in cells]
+
+
+def format_paths(paths, path_format='list'):
+    """
+    Text of the optimal path which is written to output file
+    :param paths: <list>, (y, x) locations from the start to the goal, None if the goal is not reachable
+    :param path_format: <str>, 'list' writes every location like "(0, 0)(0, 1)",
+                        'directions' writes the start and directions like "(0, 0) R1"
+    :return: <str>, NO_PATH if the goal is not reachable
+    """
+    if paths is None:
+        return NO_PATH
+    if len(paths) == 0:
+        return ''
+    if path_format == 'list':
+        return ''.join(str(path) for path in paths)
+    if path_format == 'directions':
+        start, directions = encode_directions(paths)
+        return str(start) + " " + directions
+    raise ValueError("unknown path format: " + str(path_format))
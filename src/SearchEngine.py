@@ -0,0 +1,407 @@
+"""
+Search engine which is shared by A*, uniform cost search, BFS and DFS
+Every search explores the node popped from the frontier, and queues the adjacent roads which are not seen yet
+The searches are different only in the frontier, the heuristic, and whether seen cells are queued again
+
+A*: priority frontier, cost = backward cost + forward cost, and tie breaker is Euclidean distance
+UCS: priority frontier, cost = backward cost
+BFS: first in first out frontier, seen cells are never queued again
+DFS: last in first out frontier, seen cells are never queued again
+
+Frontier entry is (cost, tie breaker, node) in 'nodes' state, and (cost, tie breaker, cell id) in 'arrays' state
+Adjacent cells are found from the offset table, LEFT, RIGHT, UP, DOWN, which is made once for the grid
+
+'sparse' state keeps the state of the touched cells in dicts and sets, so the solver is made in O(1),
+and the state is changed to 'arrays' state when the search touches many cells
+"""
+
+import time
+
+from CellArrays import CellArrays, SparseCells
+from Frontier import make_frontier
+from Grid import SparseGrid, make_grid
+from Trace import make_trace
+
+# (dy, dx) of LEFT, RIGHT, UP, DOWN, adjacent cells are queued in this order
+OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+# sparse state becomes dense when it touches more cells than this rate,
+# dict entries of a cell take about 16 times the memory of the dense arrays of a cell
+DENSE_RATE = 1 / 16
+
+
+class Node(object):
+    def __init__(self, y, x, back_cost, forward_cost, parent):
+        """
+        Initialize node
+        :param y: <int>, y coordinates
+        :param x: <int>, x coordinates
+        :param back_cost: <int>, backward cost
+        :param forward_cost: <int>, forward cost
+        :param parent: <Node>, parent node
+        """
+        self.y = y
+        self.x = x
+        self.back_cost = back_cost
+        self.forward_cost = forward_cost
+        self.cost = back_cost + forward_cost
+        self.parent = parent
+
+    def __lt__(self, other_node):
+        """
+        Override function for priority comparison
+        :param other_node: <Node>
+        :return: <bool>
+        """
+        return self.cost < other_node.cost
+
+    def __eq__(self, other_node):
+        """
+        Override function for priority comparison
+        :param other_node: <Node>
+        :return: <bool>
+        """
+        return self.cost == other_node.cost
+
+
+class SearchEngine(object):
+    def __init__(self, cells, y_start, x_start, y_end, x_end, frontier='list', layout='nested', state='nodes',
+                 trace=None, heuristic=None, components=None, weight=1, update_costs=True, max_expansions=None,
+                 time_limit=None, stats=None):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list
+        :param y_start: <int>, 0 in this homework
+        :param x_start: <int>, 0 in this homework
+        :param y_end: <int>, height - 1 in this homework
+        :param x_end: <int>, width - 1 in this homework
+        :param frontier: <str>, 'list', 'lazy', 'indexed' or 'bucket' priority queue, 'fifo' queue or 'lifo' stack
+        :param layout: <str>, tables of the grid, 'nested' list of lists, 'flat' bytearray, 'bits' packed walls,
+                       or 'bitset' packed walls and tables
+        :param state: <str>, search state, 'nodes' for Node objects, 'arrays' for cell id arrays,
+                      or 'sparse' for dicts of the touched cells, the walls are read from the cells without layout,
+                      and the layout chooses the tables when the state becomes dense
+        :param trace: <str>, sink of explored nodes, 'print', 'none', 'list', callback function, or trace object
+        :param heuristic: <object>, forward cost which has get_cost(y, x), None is no forward cost
+        :param components: <Components>, connected components of the maze, disconnected goal is rejected at once
+        :param weight: <float>, forward cost is multiplied by it and rounded down
+        :param update_costs: <bool>, True queues the seen cell again when smaller backward cost is found
+        :param max_expansions: <int>, search stops after exploring this number of nodes, None is no limit
+        :param time_limit: <float>, search stops after this number of seconds, None is no limit
+        :param stats: <Stats>, counters and timers of the search, None collects nothing
+        """
+        if stats is not None:
+            stats.start_init()
+
+        self.cells = cells
+        self.y_start = y_start
+        self.x_start = x_start
+        self.y_end = y_end
+        self.x_end = x_end
+        self.y = y_start
+        self.x = x_start
+        self.heuristic = heuristic
+        self.components = components
+        self.weight = weight
+        self.update_costs = update_costs
+        self.max_expansions = max_expansions
+        self.time_limit = time_limit
+        self.deadline = None
+        # True if the search is stopped by the budget, and the path does not reach the goal
+        self.is_partial = False
+        # path of the last search, None until the search ends
+        self.paths = None
+
+        if state == 'sparse':
+            self.grid = SparseGrid(cells, layout)
+        else:
+            self.grid = make_grid(cells, layout)
+        width = self.grid.width
+        height = self.grid.height
+        # (dy, dx, cell id offset) of the adjacent cells, the cell ids are used only by the cell arrays
+        self.offsets = tuple((dy, dx, dy * width + dx) for dy, dx in OFFSETS)
+        if state == 'nodes':
+            self.nodes = [[Node(y, x, 0, self.get_forward_cost(y, x), None) for x in range(width)]
+                          for y in range(height)]
+            self.arrays = None
+        elif state == 'arrays':
+            self.nodes = None
+            self.arrays = CellArrays(height, width)
+        elif state == 'sparse':
+            self.nodes = None
+            self.arrays = SparseCells(height, width)
+        else:
+            raise ValueError("unknown search state: " + str(state))
+        self.queued = make_frontier(frontier)
+        self.trace = make_trace(trace)
+        self.explored = self.trace.explored
+        self.stats = stats
+        if stats is not None:
+            stats.attach(self)
+
+    def search_answer(self):
+        """
+        Search answer from the start until the frontier is empty or the goal is explored
+        :return: <tuple>, explored nodes and optimal path, path is None if the goal is not reachable
+        """
+        explore = self.trace.explore
+        for y, x in self.search_iter():
+            explore(y, x)
+        self.trace.finish(self.paths)
+        return self.trace.explored, self.paths
+
+    def search_iter(self):
+        """
+        Search step by step, each explored node is yielded before its adjacent nodes are queued
+        Search is paused between the steps, and closing the generator aborts it
+        Trace is not used, so the caller receives the explored nodes instead of the trace
+        :return: <generator>, (y, x) of each explored node,
+                 the path is returned at the end, and it is kept in self.paths
+        """
+        self.paths = None
+        self.is_partial = False
+        if self.stats is not None:
+            self.stats.start_search()
+        try:
+            self.paths = yield from self.search_path()
+        finally:
+            # Search timer stops when the search ends or the generator is closed
+            if self.stats is not None:
+                self.stats.stop_search(self.paths)
+        return self.paths
+
+    def search_path(self):
+        """
+        :return: <generator>, (y, x) of each explored node, and the path is returned at the end
+        """
+        # Goal which is not in the same component as the start is rejected without search
+        if self.components is not None and \
+                not self.components.is_connected(self.y_start, self.x_start, self.y_end, self.x_end):
+            return None
+
+        if self.arrays is not None:
+            return (yield from self.search_cells())
+        return (yield from self.search_nodes())
+
+    def search_nodes(self):
+        """
+        Search with one Node object per cell, parent of each node is followed for the path
+        :return: <generator>, (y, x) of each explored node, and the optimal path is returned
+        """
+        grid = self.grid
+        width = grid.width
+        height = grid.height
+        nodes = self.nodes
+        queued = self.queued
+        update_costs = self.update_costs
+        get_forward_cost = self.get_forward_cost
+        get_tie_breaker = self.get_tie_breaker
+
+        # Start from starting point (0, 0)
+        root_node = Node(self.y_start, self.x_start, 0, self.get_forward_cost(self.y_start, self.x_start), None)
+        queued.push((self.y_start, self.x_start),
+                    (root_node.cost, self.get_tie_breaker(self.y_start, self.x_start), root_node))
+        is_bounded = self.start_budget()
+        expansions = 0
+        best_node = root_node
+
+        # Search answer until queue is empty or answer is found
+        while len(queued) > 0:
+            if is_bounded and self.is_over_budget(expansions):
+                self.is_partial = True
+                return self.get_node_path(best_node)
+
+            current_cost, current_tie_index, node = queued.pop()
+            y = node.y
+            x = node.x
+            grid.set_visited(y, x)
+            yield y, x
+            self.y = y
+            self.x = x
+            expansions += 1
+
+            # End search when the goal is found
+            if y == self.y_end and x == self.x_end:
+                return self.get_node_path(node)
+
+            if is_bounded and node.forward_cost < best_node.forward_cost:
+                best_node = node
+
+            # Search adjacent nodes, LEFT, RIGHT, UP, DOWN
+            back_cost = node.back_cost + 1
+            for dy, dx in OFFSETS:
+                next_y = y + dy
+                next_x = x + dx
+                if next_y < 0 or next_y >= height or next_x < 0 or next_x >= width or grid.is_wall(next_y, next_x):
+                    continue
+
+                old_node = nodes[next_y][next_x]
+                is_seen = grid.is_queued(next_y, next_x) or grid.is_visited(next_y, next_x)
+                if is_seen and (not update_costs or back_cost >= old_node.back_cost):
+                    continue
+
+                tie = get_tie_breaker(next_y, next_x)
+                next_node = Node(next_y, next_x, back_cost, get_forward_cost(next_y, next_x), node)
+                nodes[next_y][next_x] = next_node
+                el_set = (next_node.cost, tie, next_node)
+                # Update cost by replacing old cost node in queue if new explored cost is smaller than old cost
+                if is_seen:
+                    queued.update((next_y, next_x), (old_node.cost, tie, old_node), el_set)
+                else:
+                    queued.push((next_y, next_x), el_set)
+                grid.set_queued(next_y, next_x)
+
+        return None
+
+    def search_cells(self):
+        """
+        Search like search_nodes, but with cell ids instead of Node objects
+        Cell id is y * width + x, and costs and parent of each cell are kept in arrays
+        Heap entry is (cost, tie breaker, cell id), cell id is compared only when cost and tie breaker are same
+        :return: <generator>, (y, x) of each explored node, and the optimal path is returned
+        """
+        grid = self.grid
+        width = grid.width
+        height = grid.height
+        arrays = self.arrays
+        back_costs = arrays.back_costs
+        costs = arrays.costs
+        parents = arrays.parents
+        queued = self.queued
+        update_costs = self.update_costs
+        get_forward_cost = self.get_forward_cost
+        get_tie_breaker = self.get_tie_breaker
+        is_sparse = isinstance(arrays, SparseCells)
+        dense_size = int(DENSE_RATE * width * height)
+
+        # Start from starting point (0, 0)
+        start = self.y_start * width + self.x_start
+        start_cost = self.get_forward_cost(self.y_start, self.x_start)
+        arrays.set_cell(start, 0, start_cost, -1)
+        queued.push(start, (start_cost, self.get_tie_breaker(self.y_start, self.x_start), start))
+        is_bounded = self.start_budget()
+        expansions = 0
+        best_cell = start
+
+        # Search answer until queue is empty or answer is found
+        while len(queued) > 0:
+            if is_bounded and self.is_over_budget(expansions):
+                self.is_partial = True
+                return arrays.get_path(best_cell)
+
+            if is_sparse and len(parents) > dense_size:
+                self.make_dense()
+                arrays = self.arrays
+                back_costs = arrays.back_costs
+                costs = arrays.costs
+                parents = arrays.parents
+                is_sparse = False
+
+            current_cost, current_tie_index, cell = queued.pop()
+            y, x = divmod(cell, width)
+            grid.set_visited(y, x)
+            yield y, x
+            self.y = y
+            self.x = x
+            expansions += 1
+
+            # End search when the goal is found
+            if y == self.y_end and x == self.x_end:
+                return arrays.get_path(cell)
+
+            if is_bounded and current_cost - back_costs[cell] < costs[best_cell] - back_costs[best_cell]:
+                best_cell = cell
+
+            # Search adjacent cells, LEFT, RIGHT, UP, DOWN
+            back_cost = back_costs[cell] + 1
+            for dy, dx, offset in self.offsets:
+                next_y = y + dy
+                next_x = x + dx
+                if next_y < 0 or next_y >= height or next_x < 0 or next_x >= width or grid.is_wall(next_y, next_x):
+                    continue
+
+                next_cell = cell + offset
+                is_seen = grid.is_queued(next_y, next_x) or grid.is_visited(next_y, next_x)
+                if is_seen and (not update_costs or back_cost >= back_costs[next_cell]):
+                    continue
+
+                tie = get_tie_breaker(next_y, next_x)
+                cost = back_cost + get_forward_cost(next_y, next_x)
+                el_set = (cost, tie, next_cell)
+                if is_seen:
+                    queued.update(next_cell, (costs[next_cell], tie, next_cell), el_set)
+                else:
+                    queued.push(next_cell, el_set)
+                back_costs[next_cell] = back_cost
+                costs[next_cell] = cost
+                parents[next_cell] = cell
+                grid.set_queued(next_y, next_x)
+
+        return None
+
+    def make_dense(self):
+        """
+        Copy the sparse state of the touched cells to arrays and bytearrays
+        :return: <None>
+        """
+        self.arrays = self.arrays.get_dense()
+        self.grid.make_dense()
+
+    def get_node_path(self, node):
+        """
+        Follow parent nodes from the node to the root node
+        :param node: <Node>
+        :return: <list>, (y, x) locations from the root to the node
+        """
+        paths = []
+        while node is not None:
+            paths.append((node.y, node.x))
+            node = node.parent
+        paths.reverse()
+        return paths
+
+    def start_budget(self) -> bool:
+        """
+        :return: <bool>, True if the search has the expansion limit or the time limit
+        """
+        if self.time_limit is not None:
+            self.deadline = time.perf_counter() + self.time_limit
+        return self.max_expansions is not None or self.time_limit is not None
+
+    def is_over_budget(self, expansions) -> bool:
+        """
+        :param expansions: <int>, the number of explored nodes
+        :return: <bool>, True if the search has to stop
+        """
+        if self.max_expansions is not None and expansions >= self.max_expansions:
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def get_forward_cost(self, y, x):
+        """
+        Get forward cost from the heuristic, multiplied by the weight
+        :param y: <int>
+        :param x: <int>
+        :return: <int>, 0 without heuristic
+        """
+        if self.heuristic is None:
+            return 0
+        cost = self.heuristic.get_cost(y, x)
+        if self.weight != 1:
+            return int(self.weight * cost)
+        return cost
+
+    def get_tie_breaker(self, y, x):
+        """
+        :param y: <int>
+        :param x: <int>
+        :return: <int>, 0 without tie breaker, so the order of the frontier decides the tie
+        """
+        return 0
+
+    def is_queued(self, y, x) -> bool:
+        return self.grid.is_queued(y, x)
+
+    def is_visited(self, y, x) -> bool:
+        return self.grid.is_visited(y, x)
+
+    def is_arrived(self, node) -> bool:
+        return (node.y == self.y_end) and (node.x == self.x_end)
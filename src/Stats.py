@@ -0,0 +1,212 @@
+"""
+Counters and timers of one search, which are collected only when the solver is made with stats=Stats()
+Solver without stats runs the same code as before, so the collection costs nothing when it is disabled
+
+Stats wraps the grid and the trace of the solver
+StatsGrid counts the pushes and the expansions in set_queued and set_visited, which every search calls
+StatsTrace stops the search timer and exports the stats when the search finishes
+
+expanded: the number of explored nodes
+pushes: the number of queued cells, the start is the first push
+decrease_keys: queued or explored cells which are queued again with smaller cost,
+               each one leaves a stale heap entry with 'lazy' and 'bucket' frontiers
+re_expansions: explored cells which are explored again
+peak_frontier: the largest number of queued cells which are not explored yet
+peak_memory: the largest traced memory in bytes while the solver is made and searches, with memory=True
+times: seconds of 'parse', 'init' and 'search', parse is timed by the caller
+
+stats = Stats(export=print)
+stats.start('parse')
+cells = ...
+stats.stop('parse')
+AStar(cells, 0, 0, height - 1, width - 1, stats=stats).search_answer()
+"""
+
+import time
+import tracemalloc
+
+
+class StatsGrid(object):
+    def __init__(self, grid, stats):
+        """
+        :param grid: <NestedGrid> or <FlatGrid>
+        :param stats: <Stats>
+        """
+        self.grid = grid
+        self.stats = stats
+        self.height = grid.height
+        self.width = grid.width
+        self.is_wall = grid.is_wall
+
+    def __getattr__(self, name):
+        return getattr(self.grid, name)
+
+    def is_queued(self, y, x) -> bool:
+        return self.grid.is_queued(y, x)
+
+    def is_visited(self, y, x) -> bool:
+        return self.grid.is_visited(y, x)
+
+    def set_queued(self, y, x):
+        stats = self.stats
+        if self.grid.is_visited(y, x):
+            # Explored cell is queued again
+            stats.decrease_keys += 1
+            stats.frontier += 1
+        elif self.grid.is_queued(y, x):
+            stats.decrease_keys += 1
+        else:
+            stats.pushes += 1
+            stats.frontier += 1
+        if stats.frontier > stats.peak_frontier:
+            stats.peak_frontier = stats.frontier
+        self.grid.set_queued(y, x)
+
+    def set_visited(self, y, x):
+        stats = self.stats
+        if self.grid.is_visited(y, x):
+            stats.re_expansions += 1
+        stats.expanded += 1
+        stats.frontier -= 1
+        self.grid.set_visited(y, x)
+
+
+class StatsTrace(object):
+    def __init__(self, trace, stats):
+        """
+        :param trace: trace object of the solver
+        :param stats: <Stats>
+        """
+        self.trace = trace
+        self.stats = stats
+        self.explored = trace.explored
+        self.explore = trace.explore
+
+    @property
+    def count(self):
+        return self.trace.count
+
+    def __getattr__(self, name):
+        return getattr(self.trace, name)
+
+    def finish(self, paths):
+        self.trace.finish(paths)
+        self.stats.finish(paths)
+
+
+class Stats(object):
+    def __init__(self, memory=False, export=None):
+        """
+        :param memory: <bool>, True traces the peak memory by tracemalloc, which makes the search slower
+        :param export: <function>, called with the dict of the stats when each search finishes
+        """
+        self.memory = memory
+        self.export = export
+        self.times = {'parse': 0.0, 'init': 0.0, 'search': 0.0}
+        self.started = {}
+        self.is_tracing = False
+        self.reset()
+
+    def reset(self):
+        self.expanded = 0
+        self.pushes = 0
+        self.decrease_keys = 0
+        self.re_expansions = 0
+        self.frontier = 0
+        self.peak_frontier = 0
+        self.peak_memory = None
+        self.path_length = None
+        self.times['init'] = 0.0
+        self.times['search'] = 0.0
+
+    def start(self, name):
+        """
+        :param name: <str>, 'parse', 'init' or 'search'
+        :return: <None>
+        """
+        self.started[name] = time.perf_counter()
+
+    def stop(self, name):
+        """
+        :param name: <str>, timer which is started
+        :return: <None>, the time is added to times[name]
+        """
+        self.times[name] = self.times.get(name, 0.0) + time.perf_counter() - self.started.pop(name)
+
+    def start_init(self):
+        """
+        Called at the beginning of the solver's __init__, counters of the previous search are cleared
+        :return: <None>
+        """
+        self.reset()
+        if self.memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self.is_tracing = True
+        self.start('init')
+
+    def attach(self, solver):
+        """
+        Called at the end of the solver's __init__, the grid and the trace of the solver are wrapped
+        :param solver: <object>, solver which has grid, trace and explored
+        :return: <None>
+        """
+        self.stop('init')
+        solver.grid = StatsGrid(solver.grid, self)
+        solver.trace = StatsTrace(solver.trace, self)
+
+    def start_search(self):
+        """
+        Called at the beginning of search_iter, every search pushes the start first
+        :return: <None>
+        """
+        self.pushes = 1
+        self.frontier = 1
+        self.peak_frontier = 1
+        self.start('search')
+
+    def stop_search(self, paths):
+        """
+        Called at the end of search_iter, also when the caller closes it before the end
+        :param paths: <list>, (y, x) locations of the path, or None
+        :return: <None>
+        """
+        if 'search' in self.started:
+            self.stop('search')
+        self.path_length = len(paths) - 1 if paths is not None else None
+
+    def finish(self, paths):
+        """
+        Called when the trace finishes, the search is stopped and the stats are exported
+        :param paths: <list>, (y, x) locations of the path, or None
+        :return: <None>
+        """
+        self.stop_search(paths)
+        if self.memory:
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self.is_tracing:
+                tracemalloc.stop()
+                self.is_tracing = False
+        if self.export is not None:
+            self.export(self.as_dict())
+        # Parse time of the next search is timed again
+        self.times['parse'] = 0.0
+
+    def as_dict(self):
+        """
+        :return: <dict>, flat dict of the counters and the times, for metrics
+        """
+        return {
+            'expanded': self.expanded,
+            'pushes': self.pushes,
+            'decrease_keys': self.decrease_keys,
+            're_expansions': self.re_expansions,
+            'peak_frontier': self.peak_frontier,
+            'peak_memory': self.peak_memory,
+            'path_length': self.path_length,
+            'parse_time': self.times['parse'],
+            'init_time': self.times['init'],
+            'search_time': self.times['search'],
+        }
@@ -0,0 +1,125 @@
+"""
+Trace sink receives every explored node and the optimal path of a search
+Every search (A*, UCS, BFS, DFS) calls explore(y, x) when a node is explored,
+and finish(paths) when the search ends, paths is None if the goal is not found
+
+PrintTrace keeps "y x" strings and prints them, which is the output of the homework
+CountTrace only counts the explored nodes
+ListTrace keeps (y, x) pairs
+FileTrace writes "y x" lines to file through a buffer
+CallbackTrace calls the function with y and x
+"""
+
+
+class PrintTrace(object):
+    def __init__(self):
+        self.count = 0
+        self.explored = []
+
+    def explore(self, y, x):
+        self.count += 1
+        self.explored.append(str(y) + " " + str(x))
+        print(str(y) + " " + str(x))
+
+    def finish(self, paths):
+        # Print optimal paths
+        if paths is None:
+            return
+        for path in paths:
+            print(path, end='')
+
+        print()
+        print()
+
+
+class CountTrace(object):
+    def __init__(self):
+        self.count = 0
+        self.explored = None
+
+    def explore(self, y, x):
+        self.count += 1
+
+    def finish(self, paths):
+        pass
+
+
+class ListTrace(object):
+    def __init__(self):
+        self.count = 0
+        self.explored = []
+
+    def explore(self, y, x):
+        self.count += 1
+        self.explored.append((y, x))
+
+    def finish(self, paths):
+        pass
+
+
+class FileTrace(object):
+    def __init__(self, file, buffer_size=65536):
+        """
+        :param file: <file>, opened text file, it is not closed by the trace
+        :param buffer_size: <int>, the number of lines kept before writing
+        """
+        self.count = 0
+        self.explored = None
+        self.file = file
+        self.buffer_size = buffer_size
+        self.lines = []
+
+    def explore(self, y, x):
+        self.count += 1
+        self.lines.append(str(y) + " " + str(x) + "\n")
+        if len(self.lines) >= self.buffer_size:
+            self.flush()
+
+    def finish(self, paths):
+        self.flush()
+
+    def flush(self):
+        self.file.write(''.join(self.lines))
+        self.lines = []
+
+
+class CallbackTrace(object):
+    def __init__(self, callback):
+        """
+        :param callback: <function>, called with y and x of the explored node
+        """
+        self.count = 0
+        self.explored = None
+        self.callback = callback
+
+    def explore(self, y, x):
+        self.count += 1
+        self.callback(y, x)
+
+    def finish(self, paths):
+        pass
+
+
+TRACES = {
+    'print': PrintTrace,
+    'none': CountTrace,
+    'list': ListTrace,
+}
+
+
+def make_trace(trace):
+    """
+    :param trace: <str>, 'print', 'none' or 'list', or callback function, or trace object
+    :return: trace
+    """
+    if trace is None:
+        return PrintTrace()
+    if isinstance(trace, str):
+        if trace not in TRACES:
+            raise ValueError("unknown trace: " + trace)
+        return TRACES[trace]()
+    if hasattr(trace, 'explore'):
+        return trace
+    if callable(trace):
+        return CallbackTrace(trace)
+    raise ValueError("unknown trace: " + str(trace))
@@ -10,43 +10,14 @@ Each node has their location(y, x), costs, and parent node.
 By following parent node, you can get optimal solution.
 """
 
-import heapq
+from MazeReader import MazeReader
+from PathEncoding import format_paths
+from SearchEngine import SearchEngine
 
 
-class Node(object):
-    def __init__(self, y, x, back_cost, parent):
-        """
-        Initialize node
-        :param y: <int>, y coordinates
-        :param x: <int>, x coordinates
-        :param back_cost: <int>, backward cost
-        :param parent: <Node>, parent node
-        """
-        self.y = y
-        self.x = x
-        self.back_cost = back_cost
-        self.cost = back_cost
-        self.parent = parent
-
-    def __lt__(self, other_node):
-        """
-        Override function for priority comparison
-        :param other_node: <Node>
-        :return: <bool>
-        """
-        return self.cost < other_node.cost
-
-    def __eq__(self, other_node):
-        """
-        Override function for priority comparison
-        :param other_node: <Node>
-        :return: <bool>
-        """
-        return self.cost == other_node.cost
-
-
-class UCS(object):
-    def __init__(self, cells, y_start, x_start, y_end, x_end):
+class UCS(SearchEngine):
+    def __init__(self, cells, y_start, x_start, y_end, x_end, frontier='list', layout='nested', state='nodes',
+                 trace=None, components=None, stats=None):
         """
 
         :param cells: <list>, 0 is road, and 1 is wall in list
@@ -54,234 +25,41 @@ class UCS(object):
         :param x_start: <int>, 0 in this homework
         :param y_end: <int>, height - 1 in this homework
         :param x_end: <int>, width - 1 in this homework
-        """
-        self.LEFT = 0
-        self.RIGHT = 1
-        self.UP = 2
-        self.DOWN = 3
-
-        self.WALL = 1
-
-        self.cells = cells
-        self.y_start = y_start
-        self.x_start = x_start
-        self.y_end = y_end
-        self.x_end = x_end
-        self.y = y_start
-        self.x = x_start
-
-        width = len(cells[0])
-        height = len(cells)
-        self.queue_cells = [[False for x in range(width)] for y in range(height)]
-        self.visit_cells = [[False for x in range(width)] for y in range(height)]
-        self.nodes = [[Node(y, x, 0, None) for x in range(width)]
-                      for y in range(height)]
-        self.queued = []
-        self.explored = []
-
-    def search_answer(self):
-        """
-        Search answer from starting point (0, 0)
-        :return: <None>, print the explored node, and optimal path
-        """
-
-        # Start from starting point (0, 0)
-        start_back_cost = 0
-        root_node = Node(self.y_start, self.x_start, start_back_cost, None)
-        heapq.heappush(self.queued, (root_node.cost, root_node))
-
-        # Search answer until queue is empty or answer is found
-        while len(self.queued) > 0:
-            current_node = self.dequeue()
-
-            # End search when the goal is found
-            if self.is_arrived(current_node):
-                # Print optimal paths
-                path_node = current_node
-                paths = []
-                while path_node.parent is not None:
-                    paths.insert(0, (path_node.y, path_node.x))
-                    path_node = path_node.parent
-                paths.insert(0, (path_node.y, path_node.x))
-
-                for path in paths:
-                    print(path, end='')
-
-                print()
-                print()
-
-                return self.explored, paths
-
-            # Search adjacent nodes
-            self.search_adjacent_nodes(current_node)
-
-    def search_adjacent_nodes(self, current_node):
-        """
-        Search adjacent nodes and queue if they are reachable
-        :param current_node: <Node>
-        :return: <None>, queue the adjacent nodes
-        """
-        if self.is_reachable(current_node, self.LEFT):
-            self.enqueue(current_node, self.LEFT)
-        if self.is_reachable(current_node, self.RIGHT):
-            self.enqueue(current_node, self.RIGHT)
-        if self.is_reachable(current_node, self.UP):
-            self.enqueue(current_node, self.UP)
-        if self.is_reachable(current_node, self.DOWN):
-            self.enqueue(current_node, self.DOWN)
-
-    def dequeue(self) -> Node:
-        """
-        Explore the node based on their priority
-        Cost is Manhattan distance
-        Tie index is Euclidean distance, which is used for the case the cost is same
-        Node is explored node
-
-        Change the boolean table visit cells where the node visited
-
-        :return: <Node>, explored Node
-        """
-
-        current_cost, current_node = heapq.heappop(self.queued)
-        self.visit_cells[current_node.y][current_node.x] = True
-        self.explored.append(str(current_node.y) + " " + str(current_node.x))
-        print(str(current_node.y) + " " + str(current_node.x))
-
-        self.y = current_node.y
-        self.x = current_node.x
-        return current_node
-
-    def enqueue(self, node, direction):
-        """
-        Calculate cost, and add or update the node
-        Change the boolean table queue cells where the node queued
-
-        :param node: <Node>, current node, next node is combined with current node and direction
-        :param direction: <int>, LEFT = 0, RIGHT = 1, TOP = 2, BOTTOM = 3
-        :return: <None>
-        """
-        y = node.y
-        x = node.x
-
-        if direction == self.LEFT:
-            x = x - 1
-        elif direction == self.RIGHT:
-            x = x + 1
-        elif direction == self.UP:
-            y = y - 1
-        elif direction == self.DOWN:
-            y = y + 1
-
-        old_back_cost = self.nodes[y][x].back_cost
-        back_cost = self.get_backward_cost(node)
-
-        # Update cost by removing old cost node from queue if new explored cost is smaller than old cost
-        if (self.is_queued(y, x) or self.is_visited(y, x)) and back_cost < old_back_cost:
-            prev_el_set = (self.nodes[y][x].cost, self.nodes[y][x])
-            if self.queued.count(prev_el_set) > 0:
-                self.queued.remove(prev_el_set)
-
-        # Add new node to queue
-        self.nodes[y][x] = Node(y, x, back_cost, node)
-        heapq.heappush(self.queued, (self.nodes[y][x].cost, self.nodes[y][x]))
-        self.queue_cells[y][x] = True
-
-    def get_backward_cost(self, node):
-        """
-        Get backward cost by using the number of search
-        :param node: <Node>, current node
-        :return: <int>, current backward cost + 1
-        """
-        return node.back_cost + 1
-
-    def is_reachable(self, node, direction):
-        """
-        Check out of index error, and the cell is not wall
-        If the cell is not in queue and not visited, then return true
-        If the cell is in queue or visited, return true when the new cost is smaller than previous cost
-        :param node: <Node>, current node
-        :param direction: <int>, LEFT = 0, RIGHT = 1, TOP = 2, BOTTOM = 3
-        :return: <bool>, True if the next node is reachable
-        """
-        y = node.y
-        x = node.x
-        width = len(self.cells[0])
-        height = len(self.cells)
-
-        if direction == self.LEFT:
-            if (x - 1 >= 0) and (self.cells[y][x - 1] != self.WALL):
-                if (self.is_visited(y, x - 1) is False) and (self.is_queued(y, x - 1) is False):
-                    return True
-                else:
-                    return self.get_backward_cost(node) < self.nodes[y][x - 1].back_cost
-
-        elif direction == self.RIGHT:
-            if (x + 1 <= width - 1) and (self.cells[y][x + 1] != self.WALL):
-                if (self.is_visited(y, x + 1) is False) and (self.is_queued(y, x + 1) is False):
-                    return True
-                else:
-                    return self.get_backward_cost(node) < self.nodes[y][x + 1].back_cost
-
-        elif direction == self.UP:
-            if (y - 1 >= 0) and (self.cells[y - 1][x] != self.WALL):
-                if (self.is_visited(y - 1, x) is False) and (self.is_queued(y - 1, x) is False):
-                    return True
-                else:
-                    return self.get_backward_cost(node) < self.nodes[y - 1][x].back_cost
-
-        elif direction == self.DOWN:
-            if (y + 1 <= height - 1) and (self.cells[y + 1][x] != self.WALL):
-                if (self.is_visited(y + 1, x) is False) and (self.is_queued(y + 1, x) is False):
-                    return True
-                else:
-                    return self.get_backward_cost(node) < self.nodes[y + 1][x].back_cost
-
-        return False
-
-    def is_queued(self, y, x) -> bool:
-        return self.queue_cells[y][x]
-
-    def is_visited(self, y, x) -> bool:
-        return self.visit_cells[y][x]
-
-    def is_arrived(self, node) -> bool:
-        return (node.y == self.y_end) and (node.x == self.x_end)
-
-
-def main():
-    input_file = open('input.txt', 'r')
+        :param frontier: <str>, priority queue of the frontier, 'list', 'lazy', 'indexed' or 'bucket'
+        :param layout: <str>, tables of the grid, 'nested' list of lists, 'flat' bytearray, 'bits' packed walls,
+                       or 'bitset' packed walls and tables
+        :param state: <str>, search state, 'nodes' for Node objects, 'arrays' for cell id arrays,
+                      or 'sparse' for dicts of the touched cells, which become arrays when many cells are touched
+        :param trace: <str>, sink of explored nodes, 'print', 'none', 'list', callback function, or trace object
+        :param components: <Components>, connected components of the maze, disconnected goal is rejected at once
+        :param stats: <Stats>, counters and timers of the search, None collects nothing
+        """
+        super(UCS, self).__init__(cells, y_start, x_start, y_end, x_end, frontier=frontier, layout=layout,
+                                  state=state, trace=trace, components=components, stats=stats)
+
+
+def main(path_format='list'):
+    """
+    :param path_format: <str>, 'list' writes every location of the optimal path, 'directions' writes compact path
+    """
     output_file = open("output.txt", "w")
-    T = input_file.readline()
-    for i in range(int(T)):
-        # read maze files T times
-        input_file.readline()
-        height, width = input_file.readline().split()
-        height = int(height)
-        width = int(width)
-
+    # read mazes one by one
+    for height, width, cells in MazeReader('input.txt').mazes():
         y_start = 0
         x_start = 0
         y_end = height - 1
         x_end = width - 1
 
-        cells = []
-        for h in range(int(height)):
-            row = input_file.readline().strip().split(',')
-            row = [int(element) for element in row]
-            cells.append(row)
-
         ucs = UCS(cells, y_start, x_start, y_end, x_end)
         explored, paths = ucs.search_answer()
 
         for ele in explored:
             output_file.write(str(ele) + "\n")
 
-        for path in paths:
-            output_file.write(str(path))
+        output_file.write(format_paths(paths, path_format))
         output_file.write("\n\n")
 
     output_file.close()
-    input_file.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,205 @@
+"""
+Level synchronous BFS which expands the whole frontier at once with NumPy
+Frontier is an array of the cell ids which have the same distance, cell id is y * width + x
+Next frontier is the frontier shifted to LEFT, RIGHT, UP, and DOWN (cell id - 1, + 1, - width, + width),
+masked by the walls and the cells already reached
+Each level touches only the cells around the frontier instead of the whole grid
+
+Distance field keeps the number of step from the start for every cell, -1 is not reachable
+Optimal path is found from the goal by following the adjacent cell which has distance - 1
+
+get_distance_field works without NumPy by using BFS with deque, so other searches can use it for precomputation
+"""
+
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from Grid import FlatGrid, make_grid
+from Trace import CountTrace, make_trace
+
+
+def get_wall_array(grid):
+    """
+    :param grid: <FlatGrid> or <NestedGrid>
+    :return: <numpy.ndarray>, bool array of walls, the array shares memory with FlatGrid
+    """
+    if isinstance(grid, FlatGrid):
+        walls = np.frombuffer(grid.walls, dtype=np.uint8).reshape(grid.height, grid.width)
+    else:
+        walls = np.array(grid.cells, dtype=np.int64)
+    return walls == 1
+
+
+def get_wavefront_distances(walls, y_start, x_start, y_end=None, x_end=None):
+    """
+    :param walls: <numpy.ndarray>, bool array of walls
+    :param y_start: <int>
+    :param x_start: <int>
+    :param y_end: <int>, search stops when the goal is reached, None to fill the whole field
+    :param x_end: <int>
+    :return: <tuple>, int32 distance field, and sorted cell ids of each level
+    """
+    height, width = walls.shape
+    size = height * width
+    roads = ~walls.ravel()
+    distances = np.full(size, -1, dtype=np.int32)
+    if walls[y_start, x_start]:
+        return distances.reshape(height, width), []
+
+    start = y_start * width + x_start
+    goal = y_end * width + x_end if y_end is not None else -1
+    distances[start] = 0
+    frontier = np.array([start], dtype=np.int64)
+    levels = [frontier]
+    level = 0
+    while distances[goal] == -1 or goal == -1:
+        # Shift cell ids of the frontier to LEFT, RIGHT, UP, and DOWN
+        columns = frontier % width
+        reached = np.concatenate((frontier[columns > 0] - 1,
+                                  frontier[columns < width - 1] + 1,
+                                  frontier[frontier >= width] - width,
+                                  frontier[frontier < size - width] + width))
+        reached = reached[roads[reached] & (distances[reached] == -1)]
+        if len(reached) == 0:
+            break
+
+        level += 1
+        frontier = np.unique(reached)
+        distances[frontier] = level
+        levels.append(frontier)
+
+    return distances.reshape(height, width), levels
+
+
+def get_distance_field(cells, y_start, x_start):
+    """
+    Number of step from (y_start, x_start) to every cell
+    :param cells: <list>, 0 is road, and 1 is wall in list, or grid
+    :param y_start: <int>
+    :param x_start: <int>
+    :return: <array>, distance of cell id y * width + x, -1 is not reachable
+    """
+    grid = make_grid(cells, 'flat')
+    width = grid.width
+    height = grid.height
+    if np is not None:
+        distances, levels = get_wavefront_distances(get_wall_array(grid), y_start, x_start)
+        return array('i', distances.tobytes())
+
+    distances = array('i', [-1]) * (width * height)
+    if grid.is_wall(y_start, x_start):
+        return distances
+
+    start = y_start * width + x_start
+    distances[start] = 0
+    q = deque([start])
+    while len(q) > 0:
+        cell = q.popleft()
+        y, x = divmod(cell, width)
+        distance = distances[cell] + 1
+        for next_y, next_x in ((y, x - 1), (y, x + 1), (y - 1, x), (y + 1, x)):
+            if (0 <= next_y < height) and (0 <= next_x < width) and not grid.is_wall(next_y, next_x):
+                next_cell = next_y * width + next_x
+                if distances[next_cell] == -1:
+                    distances[next_cell] = distance
+                    q.append(next_cell)
+    return distances
+
+
+class WavefrontBFS(object):
+    def __init__(self, cells, y_start, x_start, y_end, x_end, layout='flat', trace=None):
+        """
+        :param cells: <list>, 0 is road, and 1 is wall in list
+        :param y_start: <int>, 0 in this homework
+        :param x_start: <int>, 0 in this homework
+        :param y_end: <int>, height - 1 in this homework
+        :param x_end: <int>, width - 1 in this homework
+        :param layout: <str>, tables of the grid, 'nested' list of lists or 'flat' bytearray
+        :param trace: <str>, sink of explored nodes, 'print', 'none', 'list', callback function, or trace object
+                      explored nodes of each level are reported in row major order
+        """
+        if np is None:
+            raise ImportError("WavefrontBFS needs numpy")
+
+        self.cells = cells
+        self.y_start = y_start
+        self.x_start = x_start
+        self.y_end = y_end
+        self.x_end = x_end
+
+        self.grid = make_grid(cells, layout)
+        self.walls = get_wall_array(self.grid)
+        self.distances = None
+        self.trace = make_trace(trace)
+        self.explored = self.trace.explored
+
+    def get_distance_field(self, stop_at_goal=False):
+        """
+        :param stop_at_goal: <bool>, stop when the goal is reached instead of filling the whole field
+        :return: <numpy.ndarray>, int32 distances, -1 is not reachable
+        """
+        if stop_at_goal:
+            distances, levels = get_wavefront_distances(self.walls, self.y_start, self.x_start,
+                                                        self.y_end, self.x_end)
+        else:
+            distances, levels = get_wavefront_distances(self.walls, self.y_start, self.x_start)
+        self.distances = distances
+        self.report_levels(levels)
+        return distances
+
+    def report_levels(self, levels):
+        """
+        Report explored nodes level by level, the level of the goal is expanded until the goal
+        :param levels: <list>, sorted cell ids of each level
+        :return: <None>
+        """
+        width = self.grid.width
+        goal = self.y_end * width + self.x_end
+        for frontier in levels:
+            if isinstance(self.trace, CountTrace):
+                self.trace.count += len(frontier)
+                continue
+            for cell in frontier.tolist():
+                y, x = divmod(cell, width)
+                self.trace.explore(y, x)
+                if cell == goal:
+                    return
+
+    def search_answer(self):
+        """
+        :return: <tuple>, explored nodes and optimal path, path is None if the goal is not reachable
+        """
+        distances = self.get_distance_field(stop_at_goal=True)
+        if distances[self.y_end, self.x_end] == -1:
+            self.trace.finish(None)
+            return self.trace.explored, None
+
+        paths = self.get_path(distances, self.y_end, self.x_end)
+        self.trace.finish(paths)
+        return self.trace.explored, paths
+
+    def get_path(self, distances, y, x):
+        """
+        Follow the adjacent cell which has distance - 1 from the goal to the start
+        :param distances: <numpy.ndarray>
+        :param y: <int>, y of the goal
+        :param x: <int>, x of the goal
+        :return: <list>, (y, x) locations from the start to the goal
+        """
+        height, width = distances.shape
+        paths = [(y, x)]
+        distance = int(distances[y, x])
+        while distance > 0:
+            distance -= 1
+            for next_y, next_x in ((y, x - 1), (y, x + 1), (y - 1, x), (y + 1, x)):
+                if (0 <= next_y < height) and (0 <= next_x < width) and distances[next_y, next_x] == distance:
+                    y, x = next_y, next_x
+                    break
+            paths.append((y, x))
+        paths.reverse()
+        return paths
@@ -0,0 +1,211 @@
+"""
+Time AStar, UCS, BFS and DFS on the generated mazes, and compare the results with a baseline
+Each result has the wall time of the initialization and the search, the number of explored nodes,
+the length of the path, and the peak memory which is traced by tracemalloc in another run
+
+Results are saved to JSON, and the results which are slower, use more memory, or explore different nodes
+than the baseline are reported as regressions
+
+python -m benchmark --max-cells 1000000 --output results.json --baseline baseline.json
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from benchmark.MazeGenerator import GENERATORS, make_maze
+
+SOLVERS = ('AStar', 'UCS', 'BFS', 'DFS')
+# height and width of the mazes, 10^2 to 10^8 cells
+SIDES = (10, 100, 1000, 10000)
+# name, generator, and options of the generator
+CASES = (
+    ('random 10%', 'random', {'wall_rate': 0.1}),
+    ('random 25%', 'random', {'wall_rate': 0.25}),
+    ('random 40%', 'random', {'wall_rate': 0.4}),
+    ('perfect', 'perfect', {}),
+    ('rooms', 'rooms', {}),
+    ('spiral', 'spiral', {}),
+    ('unreachable', 'unreachable', {}),
+)
+# time difference which is smaller than this is noise
+MIN_TIME_DIFFERENCE = 0.01
+
+
+class Benchmark(object):
+    def __init__(self, solvers=SOLVERS, generators=None, max_cells=10 ** 6, seed=0, options=None,
+                 memory=True, repeat=3):
+        """
+        :param solvers: <tuple>, names of the solvers
+        :param generators: <tuple>, names of the maze generators, None is every generator
+        :param max_cells: <int>, mazes which have more cells are skipped
+        :param seed: <int>, seed of every maze
+        :param options: <dict>, keyword arguments of the solvers, like {'state': 'arrays'}
+        :param memory: <bool>, True runs each search again to trace the peak memory
+        :param repeat: <int>, each search is timed this number of times, and the fastest time is kept
+        """
+        self.solvers = solvers
+        self.generators = generators if generators is not None else tuple(GENERATORS)
+        self.max_cells = max_cells
+        self.seed = seed
+        self.options = options if options is not None else {}
+        self.memory = memory
+        self.repeat = repeat
+
+    def get_cases(self):
+        """
+        :return: <list>, (name, generator, options, height, width) of the mazes
+        """
+        return [(name, generator, options, side, side) for side in SIDES if side * side <= self.max_cells
+                for name, generator, options in CASES if generator in self.generators]
+
+    def run(self, report=None):
+        """
+        :param report: <function>, called with each result
+        :return: <list>, result of every maze and solver
+        """
+        results = []
+        for name, generator, options, height, width in self.get_cases():
+            grid, start, goal = make_maze(generator, height, width, self.seed, **options)
+            for solver_name in self.solvers:
+                result = self.run_case(solver_name, grid, start, goal)
+                result['case'] = name + " " + str(height) + "x" + str(width)
+                result['seed'] = self.seed
+                results.append(result)
+                if report is not None:
+                    report(result)
+        return results
+
+    def run_case(self, solver_name, grid, start, goal):
+        """
+        :param solver_name: <str>
+        :param grid: <FlatGrid>
+        :param start: <tuple>, (y, x)
+        :param goal: <tuple>, (y, x)
+        :return: <dict>, result of the search
+        """
+        solver_class = getattr(importlib.import_module(solver_name), solver_name)
+
+        init_time = None
+        search_time = None
+        for i in range(self.repeat):
+            start_time = time.perf_counter()
+            solver = solver_class(grid, start[0], start[1], goal[0], goal[1], trace='none', **self.options)
+            middle_time = time.perf_counter()
+            explored, paths = solver.search_answer()
+            end_time = time.perf_counter()
+            if init_time is None or end_time - start_time < init_time + search_time:
+                init_time = middle_time - start_time
+                search_time = end_time - middle_time
+
+        result = {
+            'solver': solver_name,
+            'init_time': init_time,
+            'search_time': search_time,
+            'time': init_time + search_time,
+            'expansions': solver.trace.count,
+            'path_length': len(paths) - 1 if paths is not None else None,
+            'peak_memory': None,
+        }
+
+        if self.memory:
+            tracemalloc.start()
+            try:
+                solver = solver_class(grid, start[0], start[1], goal[0], goal[1], trace='none', **self.options)
+                solver.search_answer()
+                result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        return result
+
+
+def save_results(results, file_name):
+    """
+    :param results: <list>, results of Benchmark.run
+    :param file_name: <str>
+    :return: <None>
+    """
+    document = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(file_name, 'w') as output_file:
+        json.dump(document, output_file, indent=2)
+
+
+def load_results(file_name):
+    with open(file_name, 'r') as input_file:
+        return json.load(input_file)['results']
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    :param results: <list>, new results
+    :param baseline: <list>, old results
+    :param tolerance: <float>, time and memory can be larger by this rate
+    :return: <list>, text of each regression
+    """
+    old_results = {(result['case'], result['solver']): result for result in baseline}
+    regressions = []
+    for result in results:
+        old_result = old_results.get((result['case'], result['solver']))
+        if old_result is None:
+            continue
+
+        name = result['case'] + " " + result['solver']
+        if result['time'] > old_result['time'] * (1 + tolerance) and \
+                result['time'] - old_result['time'] > MIN_TIME_DIFFERENCE:
+            regressions.append(name + " time: " + "%.4f" % old_result['time'] + " -> " + "%.4f" % result['time'])
+        if result['peak_memory'] is not None and old_result['peak_memory'] is not None and \
+                result['peak_memory'] > old_result['peak_memory'] * (1 + tolerance):
+            regressions.append(name + " peak memory: " + str(old_result['peak_memory']) + " -> " +
+                               str(result['peak_memory']))
+        if result['expansions'] != old_result['expansions']:
+            regressions.append(name + " expansions: " + str(old_result['expansions']) + " -> " +
+                               str(result['expansions']))
+        if result['path_length'] != old_result['path_length']:
+            regressions.append(name + " path length: " + str(old_result['path_length']) + " -> " +
+                               str(result['path_length']))
+    return regressions
+
+
+def print_result(result):
+    print(result['case'] + " " + result['solver'] + " time: " + "%.4f" % result['time'] +
+          " expansions: " + str(result['expansions']) + " path: " + str(result['path_length']) +
+          " memory: " + str(result['peak_memory']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the solvers on generated mazes")
+    parser.add_argument('--solvers', default=','.join(SOLVERS), help="comma separated solver names")
+    parser.add_argument('--generators', default=','.join(GENERATORS), help="comma separated maze generators")
+    parser.add_argument('--max-cells', type=int, default=10 ** 6, help="largest maze, up to 10^8 cells")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--options', default='{}', help="keyword arguments of the solvers in JSON")
+    parser.add_argument('--no-memory', action='store_true', help="do not trace the peak memory")
+    parser.add_argument('--repeat', type=int, default=3, help="the number of timed runs of each search")
+    parser.add_argument('--output', default='results.json')
+    parser.add_argument('--baseline', default=None, help="results file to compare with")
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+
+    benchmark = Benchmark(tuple(args.solvers.split(',')), tuple(args.generators.split(',')), args.max_cells,
+                          args.seed, json.loads(args.options), not args.no_memory, args.repeat)
+    results = benchmark.run(print_result)
+    save_results(results, args.output)
+
+    if args.baseline is not None:
+        regressions = compare(results, load_results(args.baseline), args.tolerance)
+        for regression in regressions:
+            print("regression: " + regression)
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""
+Reproducible mazes for the benchmark, the same seed always makes the same maze
+Every generator makes flat walls, 1 is wall at index y * width + x, so large mazes fit in memory
+
+'random': each cell is wall with the wall rate
+'perfect': maze which has exactly one path between every two roads, made by randomized depth first search
+'rooms': rooms divided by walls, and each wall between two rooms has a door at random position
+'spiral': square walls around the center, the gap of each wall is on the other side of the gap of the next wall
+'unreachable': random maze, but the goal is surrounded by walls
+
+Each generator returns the grid, the start, and the goal
+"""
+
+import random
+
+from Grid import FlatGrid
+
+
+def get_random_walls(rand, size, wall_rate):
+    """
+    :param rand: <random.Random>
+    :param size: <int>, the number of cells
+    :param wall_rate: <float>, probability of wall
+    :return: <bytearray>, 1 is wall
+    """
+    # Each random byte is wall if it is smaller than the wall rate * 256
+    threshold = int(wall_rate * 256)
+    table = bytes(1 if value < threshold else 0 for value in range(256))
+    if size == 0:
+        return bytearray()
+    return bytearray(rand.getrandbits(8 * size).to_bytes(size, 'little').translate(table))
+
+
+def make_random(height, width, seed, wall_rate=0.3):
+    """
+    Start, goal, and their adjacent cells are road, so the search is not stopped at the start
+    """
+    rand = random.Random(seed)
+    size = height * width
+    walls = get_random_walls(rand, size, wall_rate)
+    for cell in (0, 1, width, size - 1, size - 2, size - 1 - width):
+        if 0 <= cell < size:
+            walls[cell] = 0
+    return FlatGrid.from_walls(height, width, walls), (0, 0), (height - 1, width - 1)
+
+
+def make_perfect(height, width, seed):
+    """
+    Rooms are the cells whose y and x are even, and walls between two rooms are removed by depth first search
+    Goal is the last room, which is (height - 1, width - 1) when height and width are odd
+    """
+    rand = random.Random(seed)
+    walls = bytearray([1]) * (height * width)
+    start = 0
+    walls[start] = 0
+    stack = [start]
+    while len(stack) > 0:
+        cell = stack[-1]
+        y, x = divmod(cell, width)
+        next_cells = []
+        for dy, dx in ((0, -2), (0, 2), (-2, 0), (2, 0)):
+            next_y = y + dy
+            next_x = x + dx
+            if 0 <= next_y < height and 0 <= next_x < width and walls[next_y * width + next_x] == 1:
+                next_cells.append((next_y, next_x))
+        if len(next_cells) == 0:
+            stack.pop()
+            continue
+
+        next_y, next_x = next_cells[rand.randrange(len(next_cells))]
+        walls[((y + next_y) // 2) * width + (x + next_x) // 2] = 0
+        walls[next_y * width + next_x] = 0
+        stack.append(next_y * width + next_x)
+
+    y_end = (height - 1) // 2 * 2
+    x_end = (width - 1) // 2 * 2
+    return FlatGrid.from_walls(height, width, walls), (0, 0), (y_end, x_end)
+
+
+def make_rooms(height, width, seed, room_size=8):
+    """
+    Rooms are room_size - 1 cells wide, and the walls between them are on every room_size cells
+    """
+    rand = random.Random(seed)
+    walls = bytearray(height * width)
+    for y in range(room_size - 1, height, room_size):
+        walls[y * width:(y + 1) * width] = bytearray([1]) * width
+    for x in range(room_size - 1, width, room_size):
+        for y in range(height):
+            walls[y * width + x] = 1
+
+    # Door of each wall segment between two rooms
+    for y in range(room_size - 1, height, room_size):
+        for left in range(0, width, room_size):
+            right = min(left + room_size - 1, width)
+            walls[y * width + rand.randrange(left, right)] = 0
+    for x in range(room_size - 1, width, room_size):
+        for top in range(0, height, room_size):
+            bottom = min(top + room_size - 1, height)
+            walls[rand.randrange(top, bottom) * width + x] = 0
+
+    walls[0] = 0
+    walls[height * width - 1] = 0
+    return FlatGrid.from_walls(height, width, walls), (0, 0), (height - 1, width - 1)
+
+
+def make_spiral(height, width, seed):
+    """
+    Square walls are on every 2 cells from the border, and the goal is at the center
+    Seed decides the side of the first gap
+    """
+    rand = random.Random(seed)
+    walls = bytearray(height * width)
+    side = rand.randrange(2)
+    depth = 1
+    while depth * 2 < min(height, width) - 1:
+        top = depth
+        left = depth
+        bottom = height - 1 - depth
+        right = width - 1 - depth
+        for x in range(left, right + 1):
+            walls[top * width + x] = 1
+            walls[bottom * width + x] = 1
+        for y in range(top, bottom + 1):
+            walls[y * width + left] = 1
+            walls[y * width + right] = 1
+
+        # Gap is at the top left or the bottom right corner, on the other side of the gap of the outer wall
+        if side == 0:
+            walls[top * width + left + 1] = 0
+        else:
+            walls[bottom * width + right - 1] = 0
+        side = 1 - side
+        depth += 2
+
+    y_end = height // 2
+    x_end = width // 2
+    walls[y_end * width + x_end] = 0
+    return FlatGrid.from_walls(height, width, walls), (0, 0), (y_end, x_end)
+
+
+def make_unreachable(height, width, seed, wall_rate=0.2):
+    grid, start, goal = make_random(height, width, seed, wall_rate)
+    walls = grid.walls
+    if height * width > 1:
+        # Walls around the goal at the bottom right corner
+        walls[height * width - 1] = 0
+        if width > 1:
+            walls[height * width - 2] = 1
+        if height > 1:
+            walls[(height - 1) * width - 1] = 1
+    return grid, start, goal
+
+
+GENERATORS = {
+    'random': make_random,
+    'perfect': make_perfect,
+    'rooms': make_rooms,
+    'spiral': make_spiral,
+    'unreachable': make_unreachable,
+}
+
+
+def make_maze(generator, height, width, seed, **options):
+    """
+    :param generator: <str>, 'random', 'perfect', 'rooms', 'spiral' or 'unreachable'
+    :param height: <int>
+    :param width: <int>
+    :param seed: <int>
+    :param options: keyword arguments of the generator, like wall_rate=0.3
+    :return: <tuple>, (FlatGrid, (y, x) of the start, (y, x) of the goal)
+    """
+    if generator not in GENERATORS:
+        raise ValueError("unknown maze generator: " + str(generator))
+    return GENERATORS[generator](height, width, seed, **options)
@@ -0,0 +1,7 @@
+"""
+Benchmark of the solvers on reproducible generated mazes
+python -m benchmark --help
+"""
+
+from benchmark.Benchmark import Benchmark, compare, load_results, save_results
+from benchmark.MazeGenerator import GENERATORS, make_maze
@@ -0,0 +1,3 @@
+from benchmark.Benchmark import main
+
+main()
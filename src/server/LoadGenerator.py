@@ -0,0 +1,149 @@
+"""
+Send random queries to SolveServer from concurrent clients, and report the latency percentiles
+Latency is the time from sending the request to receiving the response, so it includes the queue of the server
+
+python -m server.LoadGenerator --socket /tmp/maze.sock --requests 10000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from server.SolveClient import SolveClient
+
+PERCENTILES = (50, 90, 99)
+
+
+def get_percentile(latencies, percentile):
+    """
+    :param latencies: <list>, sorted seconds
+    :param percentile: <int>, 0 to 100
+    :return: <float>, nearest rank percentile
+    """
+    if len(latencies) == 0:
+        return None
+    rank = max((len(latencies) * percentile + 99) // 100, 1)
+    return latencies[rank - 1]
+
+
+class LoadGenerator(object):
+    def __init__(self, path, requests=1000, concurrency=16, connections=1, solvers=('AStar',), deadline=None,
+                 options=None, path_format='list', seed=0):
+        """
+        :param path: <str>, path of the Unix socket of the server
+        :param requests: <int>, the total number of queries
+        :param concurrency: <int>, the number of queries which are sent and not answered yet
+        :param connections: <int>, the number of connections, queries are sent on them in turn
+        :param solvers: <tuple>, each query uses one of them at random
+        :param deadline: <float>, seconds of each query, None is the deadline of the server
+        :param options: <dict>, keyword arguments of the solvers
+        :param path_format: <str>, 'list' or 'directions'
+        :param seed: <int>, seed of the starts and the goals
+        """
+        self.path = path
+        self.requests = requests
+        self.concurrency = concurrency
+        self.connections = connections
+        self.solvers = solvers
+        self.deadline = deadline
+        self.options = options
+        self.path_format = path_format
+        self.random = random.Random(seed)
+
+    def make_queries(self, maps):
+        """
+        :param maps: <list>, {'name', 'height', 'width'} of the mazes of the server
+        :return: <list>, (map name, start, goal, solver name)
+        """
+        queries = []
+        for i in range(self.requests):
+            maze = self.random.choice(maps)
+            start = (self.random.randrange(maze['height']), self.random.randrange(maze['width']))
+            goal = (self.random.randrange(maze['height']), self.random.randrange(maze['width']))
+            queries.append((maze['name'], start, goal, self.random.choice(self.solvers)))
+        return queries
+
+    async def run(self):
+        """
+        :return: <dict>, the counts, the throughput and the latency percentiles in seconds
+        """
+        clients = [await SolveClient.connect(self.path) for i in range(self.connections)]
+        queries = self.make_queries(await clients[0].get_maps())
+        latencies = []
+        counts = {'solved': 0, 'partial': 0, 'no_path': 0, 'errors': 0}
+
+        async def send(number):
+            # Each sender sends the next query when its previous query is answered
+            for i in range(number, len(queries), self.concurrency):
+                map_name, start, goal, solver_name = queries[i]
+                client = clients[i % len(clients)]
+                start_time = time.perf_counter()
+                response = await client.solve(map_name, start, goal, solver_name, self.deadline, self.options,
+                                              self.path_format)
+                latencies.append(time.perf_counter() - start_time)
+                if 'error' in response:
+                    counts['errors'] += 1
+                elif response['path'] is None:
+                    counts['no_path'] += 1
+                elif response['partial']:
+                    counts['partial'] += 1
+                else:
+                    counts['solved'] += 1
+
+        start_time = time.perf_counter()
+        try:
+            await asyncio.gather(*[send(number) for number in range(self.concurrency)])
+        finally:
+            for client in clients:
+                await client.close()
+        total_time = time.perf_counter() - start_time
+
+        latencies.sort()
+        result = dict(counts)
+        result['requests'] = len(latencies)
+        result['time'] = total_time
+        result['throughput'] = len(latencies) / total_time if total_time > 0 else None
+        for percentile in PERCENTILES:
+            result['p' + str(percentile)] = get_percentile(latencies, percentile)
+        result['max'] = latencies[-1] if len(latencies) > 0 else None
+        return result
+
+
+def print_result(result):
+    print("requests: " + str(result['requests']) + " solved: " + str(result['solved']) +
+          " partial: " + str(result['partial']) + " no path: " + str(result['no_path']) +
+          " errors: " + str(result['errors']))
+    print("throughput: " + "%.1f" % result['throughput'] + " requests/s")
+    print("latency ms: " + " ".join("p" + str(percentile) + " " + "%.3f" % (result['p' + str(percentile)] * 1000)
+                                    for percentile in PERCENTILES) + " max " + "%.3f" % (result['max'] * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the latency of SolveServer under concurrent load")
+    parser.add_argument('--socket', default='/tmp/maze.sock', help="path of the Unix socket of the server")
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--connections', type=int, default=1)
+    parser.add_argument('--solvers', default='AStar', help="comma separated solver names")
+    parser.add_argument('--deadline', type=float, default=None, help="seconds of each query")
+    parser.add_argument('--options', default=None, help="keyword arguments of the solvers in JSON")
+    parser.add_argument('--path-format', default='list', help="'list' or 'directions'")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="JSON file of the result")
+    args = parser.parse_args()
+
+    generator = LoadGenerator(args.socket, args.requests, args.concurrency, args.connections,
+                              tuple(args.solvers.split(',')), args.deadline,
+                              json.loads(args.options) if args.options is not None else None, args.path_format,
+                              args.seed)
+    result = asyncio.run(generator.run())
+    print_result(result)
+    if args.output is not None:
+        with open(args.output, 'w') as output_file:
+            json.dump(result, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Mazes which are loaded once and kept warm for every query of the server
+Text input file is parsed to FlatGrid, and binary maze file is viewed through mmap without copying
+Each maze is named "file name:number", and its connected components are labelled when it is loaded,
+so the goal which is walled off is rejected before the query is sent to a worker
+
+Workers keep one MapStore each, process workers load it in the initializer of the pool without the components,
+which the server has already checked, and thread workers share the MapStore of the server
+"""
+
+import time
+
+from Batch import get_options, get_solver
+from Components import Components
+from MazeFile import MazeFile
+from MazeReader import MazeReader
+from PathEncoding import encode_directions
+
+# deadline is checked once per this number of explored nodes
+DEADLINE_INTERVAL = 1024
+
+store = None
+
+
+class MapStore(object):
+    def __init__(self, file_names, components=True):
+        """
+        :param file_names: <list>, input files of MazeReader, or binary maze files which end with '.maze'
+        :param components: <bool>, True labels the connected components of each maze
+        """
+        self.is_labelled = components
+        self.grids = {}
+        self.components = {}
+        self.files = []
+        for file_name in file_names:
+            self.load_file(file_name)
+
+    def load_file(self, file_name):
+        """
+        :param file_name: <str>
+        :return: <list>, names of the loaded mazes
+        """
+        if file_name.endswith('.maze'):
+            maze_file = MazeFile(file_name)
+            self.files.append(maze_file)
+            mazes = maze_file.mazes()
+        else:
+            mazes = MazeReader(file_name, 'flat').mazes()
+
+        names = []
+        for number, (height, width, grid) in enumerate(mazes):
+            name = file_name + ":" + str(number)
+            self.grids[name] = grid
+            if self.is_labelled:
+                self.components[name] = Components(grid)
+            names.append(name)
+        return names
+
+    def get_grid(self, name):
+        grid = self.grids.get(name)
+        if grid is None:
+            raise ValueError("unknown map: " + str(name))
+        return grid
+
+    def get_maps(self):
+        """
+        :return: <list>, {'name', 'height', 'width'} of each maze
+        """
+        return [{'name': name, 'height': grid.height, 'width': grid.width} for name, grid in self.grids.items()]
+
+    def close(self):
+        for maze_file in self.files:
+            maze_file.close()
+        self.files = []
+
+    def solve(self, request):
+        """
+        :param request: <dict>, 'id', 'map', 'solver', 'start', 'goal', 'options', 'path_format',
+                        and 'deadline' which is time.time() when the search is stopped, or None
+        :return: <dict>, 'id', 'path', 'partial', 'expansions' and 'time', or 'id' and 'error',
+                 path is (y, x) locations for 'list' or run length encoded directions for 'directions',
+                 and None if the goal is not reachable,
+                 partial is True if max_expansions or time_limit of the options stopped the search,
+                 and the path leads to the explored node closest to the goal
+        """
+        start_time = time.perf_counter()
+        name = request['map']
+        (y_start, x_start), (y_end, x_end) = request['start'], request['goal']
+        deadline = request.get('deadline')
+        # Query which waits behind the other queries of its batch can be late before it starts
+        if deadline is not None and time.time() > deadline:
+            return {'id': request.get('id'), 'error': "deadline exceeded", 'expansions': 0}
+        try:
+            solver_name = request.get('solver', 'AStar')
+            solver = get_solver(solver_name)(self.get_grid(name), y_start, x_start, y_end, x_end, trace='none',
+                                             components=self.components.get(name),
+                                             **get_options(solver_name, request.get('options', {})))
+            steps = solver.search_iter()
+            expansions = 0
+            for step in steps:
+                expansions += 1
+                if deadline is not None and expansions % DEADLINE_INTERVAL == 0 and time.time() > deadline:
+                    steps.close()
+                    return {'id': request.get('id'), 'error': "deadline exceeded", 'expansions': expansions}
+        except (TypeError, ValueError, IndexError) as e:
+            return {'id': request.get('id'), 'error': str(e)}
+
+        paths = solver.paths
+        if paths is not None and request.get('path_format') == 'directions':
+            paths = encode_directions(paths)[1]
+        return {
+            'id': request.get('id'),
+            'path': paths,
+            'partial': solver.is_partial,
+            'expansions': expansions,
+            'time': time.perf_counter() - start_time,
+        }
+
+
+def init_worker(file_names, map_store=None):
+    """
+    Initializer of the pool
+    :param file_names: <list>, loaded again by each process worker
+    :param map_store: <MapStore>, shared by thread workers instead of loading the files
+    :return: <None>
+    """
+    global store
+    store = map_store if map_store is not None else MapStore(file_names, components=False)
+
+
+def solve_batch(requests):
+    """
+    Worker function, a batch of queries is sent at once to share the cost of the dispatch
+    :param requests: <list>, requests of MapStore.solve
+    :return: <list>, responses in the order of the requests
+    """
+    return [store.solve(request) for request in requests]
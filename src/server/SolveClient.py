@@ -0,0 +1,102 @@
+"""
+Asyncio client of SolveServer, many queries are sent on one connection without waiting for the previous ones
+
+client = await SolveClient.connect('/tmp/maze.sock')
+response = await client.solve('input.txt:0', (0, 0), (9, 9), 'AStar', deadline=0.5)
+await client.close()
+"""
+
+import asyncio
+import json
+
+# the longest line of a response, the path of a large maze is long
+LINE_LIMIT = 2 ** 26
+
+
+class SolveClient(object):
+    def __init__(self, reader, writer):
+        """
+        :param reader: <StreamReader>
+        :param writer: <StreamWriter>
+        """
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.futures = {}
+        self.receiver = asyncio.ensure_future(self.receive())
+
+    @classmethod
+    async def connect(cls, path):
+        """
+        :param path: <str>, path of the Unix socket of the server
+        :return: <SolveClient>
+        """
+        reader, writer = await asyncio.open_unix_connection(path, limit=LINE_LIMIT)
+        return cls(reader, writer)
+
+    async def receive(self):
+        """
+        Each response is matched to its request by 'id'
+        :return: <None>, runs until the connection is closed
+        """
+        try:
+            while True:
+                line = await self.reader.readline()
+                if len(line) == 0:
+                    break
+                response = json.loads(line)
+                future = self.futures.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self.futures.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection is closed"))
+            self.futures = {}
+
+    async def request(self, request):
+        """
+        :param request: <dict>, request without 'id'
+        :return: <dict>, response of the server
+        """
+        self.next_id += 1
+        request = dict(request, id=self.next_id)
+        future = asyncio.get_event_loop().create_future()
+        self.futures[self.next_id] = future
+        self.writer.write(json.dumps(request).encode() + b'\n')
+        await self.writer.drain()
+        return await future
+
+    async def solve(self, map_name, start, goal, solver_name='AStar', deadline=None, options=None,
+                    path_format='list'):
+        """
+        :param map_name: <str>, "file name:number"
+        :param start: <tuple>, (y, x)
+        :param goal: <tuple>, (y, x)
+        :param solver_name: <str>, 'AStar', 'UCS', 'BFS' or 'DFS'
+        :param deadline: <float>, seconds, None is the deadline of the server
+        :param options: <dict>, keyword arguments of the solver
+        :param path_format: <str>, 'list' of [y, x] or run length encoded 'directions'
+        :return: <dict>, 'path', 'expansions' and 'time', or 'error'
+        """
+        request = {'map': map_name, 'solver': solver_name, 'start': list(start), 'goal': list(goal),
+                   'path_format': path_format}
+        if deadline is not None:
+            request['deadline'] = deadline
+        if options is not None:
+            request['options'] = options
+        return await self.request(request)
+
+    async def get_maps(self):
+        """
+        :return: <list>, {'name', 'height', 'width'} of each maze of the server
+        """
+        return (await self.request({'op': 'maps'}))['maps']
+
+    async def close(self):
+        self.receiver.cancel()
+        try:
+            await self.receiver
+        except asyncio.CancelledError:
+            pass
+        self.writer.close()
@@ -0,0 +1,345 @@
+"""
+Asyncio server which answers the queries of the mazes in JSON lines, over a Unix socket or stdin and stdout
+Mazes are loaded once, so each query pays only the search, not the startup, the parsing and the grid allocation
+
+Each line is one request, and each response has the 'id' of its request, responses can be in any order
+{"id": 1, "map": "input.txt:0", "solver": "AStar", "start": [0, 0], "goal": [9, 9], "deadline": 0.5}
+{"id": 1, "path": [[0, 0], [0, 1], ...], "partial": false, "expansions": 42, "time": 0.0004}
+"partial": true when max_expansions or time_limit of the options stopped the search, and the path leads
+to the explored node closest to the goal instead of the goal
+"path_format": "directions" answers the path as run length encoded directions like "R1D2", which is much shorter
+{"id": 2, "op": "maps"} answers the names and the sizes of the mazes
+
+Batching: queries which wait for a worker are sent to the next free worker at once, up to batch size,
+          so the batches are 1 query under light load and larger under heavy load
+Deadline: seconds from the arrival, the query is answered with an error when the deadline passes
+          in the queue, or when the worker checks it between the explored nodes
+Backpressure: at most max pending queries are accepted, and the connection is not read until one is answered
+
+python -m server --maps input.txt --socket /tmp/maze.sock
+python -m server --maps input.txt input.maze --stdio
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from Batch import SOLVERS, is_free_threaded
+from server.MapStore import MapStore, init_worker, solve_batch
+
+PATH_FORMATS = ('list', 'directions')
+# the longest line of a request or a response, the path of a large maze is long
+LINE_LIMIT = 2 ** 26
+
+
+def read_file(input_file, reader, loop):
+    """
+    Feed the lines of the file to the stream reader of the event loop
+    :param input_file: <file>, binary file
+    :param reader: <StreamReader>
+    :param loop: <AbstractEventLoop>
+    :return: <None>
+    """
+    for line in input_file:
+        loop.call_soon_threadsafe(reader.feed_data, line)
+    loop.call_soon_threadsafe(reader.feed_eof)
+
+
+class StdoutWriter(object):
+    """
+    Writer of the responses to stdout, which can be a pipe, a terminal or a regular file
+    Each response is written and flushed at once, so drain has nothing to wait for
+    """
+
+    def __init__(self, output_file):
+        """
+        :param output_file: <file>, binary file
+        """
+        self.output_file = output_file
+
+    def write(self, data):
+        self.output_file.write(data)
+        self.output_file.flush()
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.output_file.flush()
+
+
+class SolveServer(object):
+    def __init__(self, file_names, workers=None, executor='auto', batch_size=16, max_pending=1024,
+                 deadline=None, options=None):
+        """
+        :param file_names: <list>, input files or binary maze files, which are loaded once
+        :param workers: <int>, the number of workers, None is the number of CPUs
+        :param executor: <str>, 'auto', 'process' or 'thread'
+        :param batch_size: <int>, the largest number of queries which are sent to a worker at once
+        :param max_pending: <int>, the largest number of queries which are accepted and not answered yet
+        :param deadline: <float>, seconds of the query which has no deadline, None is no deadline
+        :param options: <dict>, keyword arguments of the solvers, which each query can override
+        """
+        if executor == 'auto':
+            executor = 'thread' if is_free_threaded() else 'process'
+        if executor not in ('process', 'thread'):
+            raise ValueError("unknown executor: " + str(executor))
+
+        self.file_names = list(file_names)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.executor = executor
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.deadline = deadline
+        self.options = options if options is not None else {}
+        self.store = MapStore(self.file_names)
+        self.pool = None
+        self.queue = None
+        self.pending = None
+        self.idle_workers = None
+        self.dispatcher = None
+
+    def start(self):
+        """
+        Start the worker pool, it is called in the event loop before the first connection
+        :return: <None>
+        """
+        if self.executor == 'thread':
+            self.pool = ThreadPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                           initargs=(self.file_names, self.store))
+        else:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                            initargs=(self.file_names,))
+            # Workers are started and load the mazes now, not at the first queries
+            for i in range(self.workers):
+                self.pool.submit(solve_batch, [])
+        self.queue = asyncio.Queue()
+        self.pending = asyncio.Semaphore(self.max_pending)
+        self.idle_workers = asyncio.Semaphore(self.workers)
+        self.dispatcher = asyncio.ensure_future(self.dispatch())
+
+    def close(self):
+        if self.dispatcher is not None:
+            self.dispatcher.cancel()
+            self.dispatcher = None
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        self.store.close()
+
+    async def serve_unix(self, path):
+        """
+        :param path: <str>, path of the Unix socket
+        :return: <None>, serves until it is cancelled
+        """
+        self.start()
+        server = await asyncio.start_unix_server(self.handle_connection, path=path, limit=LINE_LIMIT)
+        # SIGTERM stops the server like Ctrl+C, so the socket is removed
+        asyncio.get_event_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+            if os.path.exists(path):
+                os.remove(path)
+
+    async def serve_stdio(self):
+        """
+        Serve one connection of stdin and stdout until stdin is closed
+        :return: <None>
+        """
+        self.start()
+        loop = asyncio.get_event_loop()
+        reader = asyncio.StreamReader(limit=LINE_LIMIT)
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        except ValueError:
+            # stdin is a regular file, which is read by a thread
+            threading.Thread(target=read_file, args=(sys.stdin.buffer, reader, loop), daemon=True).start()
+        try:
+            await self.handle_connection(reader, StdoutWriter(sys.stdout.buffer))
+        finally:
+            self.close()
+
+    async def handle_connection(self, reader, writer):
+        """
+        Read the requests of one connection, each request is answered as soon as it is solved
+        :param reader: <StreamReader>
+        :param writer: <StreamWriter>
+        :return: <None>
+        """
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                # Connection is not read while max pending queries are not answered
+                await self.pending.acquire()
+                line = await reader.readline()
+                if len(line) == 0:
+                    self.pending.release()
+                    break
+                if len(line.strip()) == 0:
+                    self.pending.release()
+                    continue
+                task = asyncio.ensure_future(self.answer(line, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if len(tasks) > 0:
+                await asyncio.wait(tasks)
+        finally:
+            writer.close()
+
+    async def answer(self, line, writer, lock):
+        try:
+            response = await self.handle_request(line)
+        finally:
+            self.pending.release()
+        writer.write(json.dumps(response).encode() + b'\n')
+        async with lock:
+            await writer.drain()
+
+    async def handle_request(self, line):
+        """
+        :param line: <bytes>, JSON of one request
+        :return: <dict>, response
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {'id': None, 'error': "invalid request: " + str(e)}
+        if not isinstance(request, dict):
+            return {'id': None, 'error': "invalid request: " + str(request)}
+
+        op = request.get('op', 'solve')
+        if op == 'maps':
+            return {'id': request.get('id'), 'maps': self.store.get_maps()}
+        if op != 'solve':
+            return {'id': request.get('id'), 'error': "unknown op: " + str(op)}
+
+        try:
+            request = self.get_query(request)
+        except (KeyError, TypeError, ValueError) as e:
+            return {'id': request.get('id'), 'error': "invalid request: " + str(e)}
+
+        # Goal which is walled off is answered without a worker
+        (y_start, x_start), (y_end, x_end) = request['start'], request['goal']
+        if not self.store.components[request['map']].is_connected(y_start, x_start, y_end, x_end):
+            return {'id': request['id'], 'path': None, 'partial': False, 'expansions': 0, 'time': 0.0}
+
+        future = asyncio.get_event_loop().create_future()
+        self.queue.put_nowait((request, future))
+        return await future
+
+    def get_query(self, request):
+        """
+        Check the request, and make the query which is sent to a worker
+        :param request: <dict>
+        :return: <dict>, query with the options and the deadline of time.time()
+        """
+        grid = self.store.get_grid(request['map'])
+        solver_name = request.get('solver', 'AStar')
+        if solver_name not in SOLVERS:
+            raise ValueError("unknown solver: " + str(solver_name))
+
+        locations = []
+        for key in ('start', 'goal'):
+            y, x = request[key]
+            if not (isinstance(y, int) and isinstance(x, int) and 0 <= y < grid.height and 0 <= x < grid.width):
+                raise ValueError(key + " is out of the map: " + str(request[key]))
+            locations.append((y, x))
+
+        path_format = request.get('path_format', 'list')
+        if path_format not in PATH_FORMATS:
+            raise ValueError("unknown path format: " + str(path_format))
+
+        options = dict(self.options)
+        options.update(request.get('options', {}))
+        deadline = request.get('deadline', self.deadline)
+        return {
+            'id': request.get('id'),
+            'map': request['map'],
+            'solver': solver_name,
+            'start': locations[0],
+            'goal': locations[1],
+            'options': options,
+            'path_format': path_format,
+            'deadline': time.time() + deadline if deadline is not None else None,
+        }
+
+    async def dispatch(self):
+        """
+        Send the waiting queries to the free workers, all of the waiting queries up to batch size go at once
+        :return: <None>, runs until the server is closed
+        """
+        while True:
+            batch = [await self.queue.get()]
+            await self.idle_workers.acquire()
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            asyncio.ensure_future(self.run_batch(batch))
+
+    async def run_batch(self, batch):
+        """
+        :param batch: <list>, (query, future)
+        :return: <None>, the response of each query is set to its future
+        """
+        try:
+            now = time.time()
+            futures = []
+            requests = []
+            for request, future in batch:
+                if request['deadline'] is not None and now > request['deadline']:
+                    future.set_result({'id': request['id'], 'error': "deadline exceeded", 'expansions': 0})
+                else:
+                    futures.append(future)
+                    requests.append(request)
+            if len(requests) == 0:
+                return
+
+            try:
+                responses = await asyncio.get_event_loop().run_in_executor(self.pool, solve_batch, requests)
+            except Exception as e:
+                responses = [{'id': request['id'], 'error': "worker failed: " + str(e)} for request in requests]
+            for future, response in zip(futures, responses):
+                if not future.done():
+                    future.set_result(response)
+        finally:
+            self.idle_workers.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the queries of the mazes in JSON lines")
+    parser.add_argument('--maps', nargs='+', default=['input.txt'], help="input files or binary maze files")
+    parser.add_argument('--socket', default=None, help="path of the Unix socket")
+    parser.add_argument('--stdio', action='store_true', help="serve stdin and stdout instead of the socket")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--executor', default='auto', help="'auto', 'process' or 'thread'")
+    parser.add_argument('--batch-size', type=int, default=16)
+    parser.add_argument('--max-pending', type=int, default=1024)
+    parser.add_argument('--deadline', type=float, default=None, help="seconds of the query which has no deadline")
+    parser.add_argument('--options', default='{"state": "sparse"}',
+                        help="keyword arguments of the solvers in JSON, sparse state allocates only the explored cells")
+    args = parser.parse_args()
+    if args.socket is None and not args.stdio:
+        parser.error("--socket or --stdio is required")
+
+    server = SolveServer(args.maps, args.workers, args.executor, args.batch_size, args.max_pending, args.deadline,
+                         json.loads(args.options))
+    try:
+        if args.stdio:
+            asyncio.run(server.serve_stdio())
+        else:
+            asyncio.run(server.serve_unix(args.socket))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,8 @@
+"""
+Long running solving service, which loads the mazes once and answers queries in JSON lines
+python -m server --help
+"""
+
+from server.MapStore import MapStore
+from server.SolveClient import SolveClient
+from server.SolveServer import SolveServer
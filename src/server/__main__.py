@@ -0,0 +1,3 @@
+from server.SolveServer import main
+
+main()
@@ -0,0 +1,68 @@
+"""
+Modules of src are flat scripts which are run from src, so src is put on the path of the tests
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+sys.path.insert(0, SRC_DIR)
+
+from BFS import BFS  # noqa: E402
+from Grid import WALL  # noqa: E402
+
+
+def get_cells(grid):
+    """
+    :param grid: <FlatGrid>, grid of the maze generator
+    :return: <list>, list of lists of the cells, which is not shared with the grid
+    """
+    return [list(grid.walls[y * grid.width:(y + 1) * grid.width]) for y in range(grid.height)]
+
+
+def get_optimal_length(cells, start, goal):
+    """
+    :param cells: <list>, 0 is road, and 1 is wall in list
+    :param start: <tuple>, (y, x)
+    :param goal: <tuple>, (y, x)
+    :return: <int>, the number of step of the optimal path, or None if the goal is not reachable
+    """
+    explored, paths = BFS(cells, start[0], start[1], goal[0], goal[1], trace='none').search_answer()
+    return len(paths) - 1 if paths is not None else None
+
+
+def assert_valid_path(cells, paths, start, goal):
+    """
+    :param cells: <list>, 0 is road, and 1 is wall in list
+    :param paths: <list>, (y, x) locations from the start to the goal
+    :param start: <tuple>, (y, x)
+    :param goal: <tuple>, (y, x)
+    """
+    assert tuple(paths[0]) == tuple(start)
+    assert tuple(paths[-1]) == tuple(goal)
+    for (y, x), (next_y, next_x) in zip(paths, paths[1:]):
+        assert abs(y - next_y) + abs(x - next_x) == 1
+    for y, x in paths:
+        assert cells[y][x] != WALL
+
+
+def get_blocked_cells(paths, count):
+    """
+    :param paths: <list>, (y, x) locations from the start to the goal
+    :param count: <int>, the number of cell to block
+    :return: <list>, (y, x) cells on the path between the start and the goal
+    """
+    step = max(1, (len(paths) - 2) // (count + 1))
+    return [tuple(cell) for cell in paths[step:-1:step][:count]]
+
+
+def get_opened_cells(cells, goal):
+    """
+    :param cells: <list>, 0 is road, and 1 is wall in list
+    :param goal: <tuple>, (y, x)
+    :return: <list>, (y, x) walls adjacent to the goal
+    """
+    y, x = goal
+    return [(next_y, next_x) for next_y, next_x in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1))
+            if 0 <= next_y < len(cells) and 0 <= next_x < len(cells[0]) and cells[next_y][next_x] == 1]
@@ -0,0 +1,68 @@
+"""
+Batch writes the output of the mazes in the order of the input file, like main() of each solver
+"""
+
+import os
+
+import pytest
+
+from conftest import DATA_DIR, SRC_DIR
+from Batch import Batch, solve_grid
+from Grid import FlatGrid
+from benchmark.MazeGenerator import make_maze
+
+
+def write_input(file_name, grids):
+    """
+    :param file_name: <str>, input file of MazeReader
+    :param grids: <list>, FlatGrid of each maze
+    :return: <None>
+    """
+    with open(file_name, 'w') as input_file:
+        input_file.write(str(len(grids)) + "\n\n")
+        for grid in grids:
+            input_file.write(str(grid.height) + " " + str(grid.width) + "\n")
+            for y in range(grid.height):
+                row = grid.walls[y * grid.width:(y + 1) * grid.width]
+                input_file.write(",".join(str(value) for value in row) + "\n")
+            input_file.write("\n")
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_input_file_is_same_as_main(tmp_path, executor):
+    output_file_name = str(tmp_path / 'output.txt')
+    count = Batch('AStar', workers=2, executor=executor).solve_file(os.path.join(SRC_DIR, 'input.txt'),
+                                                                    output_file_name)
+    assert count == 3
+    with open(output_file_name) as output_file, open(os.path.join(DATA_DIR, 'astar_output.txt')) as baseline:
+        assert output_file.read() == baseline.read()
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+@pytest.mark.parametrize('solver_name', ['AStar', 'BFS', 'DFS'])
+def test_output_is_in_input_order(tmp_path, executor, solver_name):
+    # large and small mazes are mixed, so the workers finish them out of order, and the groups are many
+    grids = [make_maze('random', 5 + seed % 7 * 9, 8 + seed % 5 * 11, seed, wall_rate=0.2)[0] for seed in range(30)]
+    input_file_name = str(tmp_path / 'input.txt')
+    output_file_name = str(tmp_path / 'output.txt')
+    write_input(input_file_name, grids)
+
+    batch = Batch(solver_name, workers=3, chunk_size=2, executor=executor, options={'layout': 'flat'})
+    assert batch.group_size < len(grids)
+    assert batch.solve_file(input_file_name, output_file_name) == len(grids)
+    expected = ''.join(solve_grid(solver_name, FlatGrid.from_walls(grid.height, grid.width, grid.walls),
+                                  {'layout': 'flat'}) for grid in grids)
+    with open(output_file_name) as output_file:
+        assert output_file.read() == expected
+
+
+def test_trace_is_rejected():
+    with pytest.raises(ValueError):
+        Batch('AStar', workers=1, executor='thread', options={'trace': 'none'})
+
+
+def test_unknown_solver_and_executor():
+    with pytest.raises(ValueError):
+        Batch('JPS')
+    with pytest.raises(ValueError):
+        Batch('AStar', executor='fork')
@@ -0,0 +1,56 @@
+"""
+Bidirectional BFS and A* find the path of the same optimal length as BFS
+"""
+
+import pytest
+
+from conftest import assert_valid_path, get_cells, get_optimal_length
+from Bidirectional import BidirectionalAStar, BidirectionalBFS
+from benchmark.MazeGenerator import make_maze
+
+SOLVERS = [BidirectionalBFS, BidirectionalAStar]
+CASES = [
+    ('random', {'wall_rate': 0.1}),
+    ('random', {'wall_rate': 0.3}),
+    ('perfect', {}),
+    ('rooms', {}),
+    ('spiral', {}),
+    ('unreachable', {}),
+]
+
+
+def check_path(solver, cells, start, goal, layout='nested'):
+    explored, paths = solver(cells, start[0], start[1], goal[0], goal[1], layout=layout,
+                             trace='list').search_answer()
+    optimal_length = get_optimal_length(cells, start, goal)
+    if optimal_length is None:
+        assert paths is None
+    else:
+        assert_valid_path(cells, paths, start, goal)
+        assert len(paths) - 1 == optimal_length
+    return explored, paths
+
+
+@pytest.mark.parametrize('generator, options', CASES)
+@pytest.mark.parametrize('layout', ['nested', 'flat'])
+@pytest.mark.parametrize('solver', SOLVERS)
+def test_optimal_on_generated_mazes(solver, layout, generator, options):
+    for seed in range(5):
+        grid, start, goal = make_maze(generator, 21, 33, seed, **options)
+        check_path(solver, get_cells(grid), start, goal, layout)
+
+
+@pytest.mark.parametrize('solver', SOLVERS)
+def test_optimal_between_random_cells(solver):
+    for seed in range(30):
+        grid, start, goal = make_maze('random', 17, 29, seed, wall_rate=0.25)
+        cells = get_cells(grid)
+        roads = [(y, x) for y in range(grid.height) for x in range(grid.width) if cells[y][x] == 0]
+        check_path(solver, cells, roads[seed * 7 % len(roads)], roads[-1 - seed * 11 % len(roads)])
+
+
+@pytest.mark.parametrize('solver', SOLVERS)
+def test_start_is_goal(solver):
+    cells = [[0, 0], [1, 0]]
+    explored, paths = check_path(solver, cells, (1, 1), (1, 1))
+    assert len(paths) == 1
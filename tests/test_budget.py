@@ -0,0 +1,88 @@
+"""
+Search which runs out of the expansion or time budget returns the path to the explored node closest to the goal
+"""
+
+import pytest
+
+from conftest import assert_valid_path, get_cells, get_optimal_length
+from AStar import AStar
+from AnytimeAStar import AnytimeAStar
+from benchmark.MazeGenerator import make_maze
+
+
+@pytest.fixture
+def maze():
+    grid, start, goal = make_maze('random', 30, 40, 7, wall_rate=0.2)
+    return get_cells(grid), start, goal
+
+
+def get_distance(cell, goal):
+    return abs(cell[0] - goal[0]) + abs(cell[1] - goal[1])
+
+
+@pytest.mark.parametrize('state', ['nodes', 'arrays', 'sparse'])
+def test_max_expansions_returns_partial_path(maze, state):
+    cells, start, goal = maze
+    a_star = AStar(cells, start[0], start[1], goal[0], goal[1], state=state, trace='list', max_expansions=20)
+    explored, paths = a_star.search_answer()
+
+    assert a_star.is_partial
+    assert len(explored) == 20
+    assert tuple(paths[-1]) in explored
+    assert get_distance(paths[-1], goal) == min(get_distance(cell, goal) for cell in explored)
+    assert_valid_path(cells, paths, start, paths[-1])
+
+
+def test_enough_budget_is_not_partial(maze):
+    cells, start, goal = maze
+    a_star = AStar(cells, start[0], start[1], goal[0], goal[1], trace='none', max_expansions=10 ** 6,
+                   time_limit=60)
+    explored, paths = a_star.search_answer()
+
+    assert not a_star.is_partial
+    assert len(paths) - 1 == get_optimal_length(cells, start, goal)
+
+
+def test_time_limit_returns_partial_path(maze):
+    cells, start, goal = maze
+    a_star = AStar(cells, start[0], start[1], goal[0], goal[1], trace='none', time_limit=0)
+    explored, paths = a_star.search_answer()
+
+    assert a_star.is_partial
+    assert tuple(paths[0]) == start
+
+
+def test_anytime_budget_before_first_path(maze):
+    cells, start, goal = maze
+    anytime = AnytimeAStar(cells, start[0], start[1], goal[0], goal[1], trace='none', max_expansions=10)
+    explored, paths = anytime.search_answer()
+
+    assert anytime.is_partial
+    assert anytime.bound is None
+    assert_valid_path(cells, paths, start, paths[-1])
+    assert tuple(paths[-1]) != goal
+
+
+def test_anytime_without_budget_is_optimal(maze):
+    cells, start, goal = maze
+    anytime = AnytimeAStar(cells, start[0], start[1], goal[0], goal[1], trace='none')
+    explored, paths = anytime.search_answer()
+
+    assert not anytime.is_partial
+    assert anytime.bound == 1
+    assert_valid_path(cells, paths, start, goal)
+    assert len(paths) - 1 == get_optimal_length(cells, start, goal)
+
+
+@pytest.mark.parametrize('solver, options', [(AStar, {'state': 'nodes'}), (AStar, {'state': 'arrays'}),
+                                             (AnytimeAStar, {})], ids=['nodes', 'arrays', 'anytime'])
+def test_partial_is_reset_by_next_search(maze, solver, options):
+    cells, start, goal = maze
+    searcher = solver(cells, start[0], start[1], goal[0], goal[1], trace='none', max_expansions=5, **options)
+    searcher.search_answer()
+    assert searcher.is_partial
+
+    searcher.max_expansions = None
+    explored, paths = searcher.search_answer()
+    assert not searcher.is_partial
+    assert tuple(paths[-1]) == goal
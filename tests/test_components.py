@@ -0,0 +1,70 @@
+"""
+Components connect two cells exactly when BFS reaches one from the other, and disconnected goals are rejected at once
+"""
+
+import pytest
+
+from conftest import get_cells, get_optimal_length
+from AStar import AStar
+from BFS import BFS
+from Batch import solve_grid
+from Components import Components
+from DFS import DFS
+from JPS import JPS
+from PathEncoding import NO_PATH
+from UCS import UCS
+from benchmark.MazeGenerator import make_maze
+
+SOLVERS = [AStar, UCS, BFS, DFS, JPS]
+
+
+@pytest.mark.parametrize('generator, options', [('random', {'wall_rate': 0.45}), ('rooms', {}), ('unreachable', {})])
+def test_connected_is_reachable(generator, options):
+    grid, start, goal = make_maze(generator, 13, 17, 1, **options)
+    cells = get_cells(grid)
+    components = Components(cells)
+    roads = [(y, x) for y in range(grid.height) for x in range(grid.width) if cells[y][x] == 0]
+    for y, x in roads[::5]:
+        for other in roads[::7]:
+            assert components.is_connected(y, x, other[0], other[1]) == \
+                (get_optimal_length(cells, (y, x), other) is not None)
+    labels = set(components.get_label(y, x) for y, x in roads)
+    assert labels == set(range(1, len(components) + 1))
+
+
+def test_walls_are_not_connected():
+    components = Components([[0, 1, 0], [0, 1, 0]])
+    assert len(components) == 2
+    assert components.get_label(0, 1) == 0
+    assert not components.is_connected(0, 1, 0, 1)
+    assert components.is_connected(0, 0, 1, 0)
+    assert not components.is_connected(0, 0, 0, 2)
+    # labels are numbered in row major order
+    assert components.get_label(0, 0) == 1 and components.get_label(0, 2) == 2
+
+
+@pytest.mark.parametrize('solver', SOLVERS)
+def test_disconnected_goal_is_rejected(solver):
+    grid, start, goal = make_maze('unreachable', 15, 19, 0)
+    cells = get_cells(grid)
+    components = Components(grid)
+    assert solver(cells, start[0], start[1], goal[0], goal[1], trace='list',
+                  components=components).search_answer() == ([], None)
+    explored, paths = solver(cells, start[0], start[1], goal[0], goal[1], trace='list').search_answer()
+    assert paths is None
+    assert len(explored) > 0
+
+
+@pytest.mark.parametrize('solver', SOLVERS)
+def test_connected_goal_is_searched(solver):
+    grid, start, goal = make_maze('rooms', 15, 19, 0)
+    cells = get_cells(grid)
+    with_components = solver(cells, start[0], start[1], goal[0], goal[1], trace='list',
+                             components=Components(grid)).search_answer()
+    assert with_components == solver(cells, start[0], start[1], goal[0], goal[1], trace='list').search_answer()
+
+
+@pytest.mark.parametrize('solver_name', ['AStar', 'UCS', 'BFS', 'DFS'])
+def test_no_path_is_written(solver_name):
+    grid, start, goal = make_maze('unreachable', 9, 11, 0)
+    assert solve_grid(solver_name, grid, {}).endswith(NO_PATH + "\n\n")
@@ -0,0 +1,98 @@
+"""
+Distance cache answers queries by the distance field of the goal, and keeps the mazes and fields in its memory limit
+"""
+
+import pytest
+
+from conftest import assert_valid_path, get_cells, get_optimal_length
+from AStar import AStar
+from DistanceCache import DistanceCache, get_grid_memory
+from benchmark.MazeGenerator import make_maze
+
+
+@pytest.fixture
+def maze():
+    grid, start, goal = make_maze('random', 20, 30, 2, wall_rate=0.25)
+    return get_cells(grid), start, goal
+
+
+def test_query_is_optimal(maze):
+    cells, start, goal = maze
+    cache = DistanceCache()
+    key = cache.add_map(cells)
+    roads = [(y, x) for y in range(len(cells)) for x in range(len(cells[0])) if cells[y][x] == 0]
+    for y, x in roads[::17]:
+        paths = cache.query(key, y, x, goal[0], goal[1])
+        optimal_length = get_optimal_length(cells, (y, x), goal)
+        if optimal_length is None:
+            assert paths is None
+        else:
+            assert_valid_path(cells, paths, (y, x), goal)
+            assert len(paths) - 1 == optimal_length
+    assert cache.misses == 1
+    assert cache.hits == len(roads[::17]) - 1
+
+
+def test_same_walls_get_same_key(maze):
+    cells, start, goal = maze
+    cache = DistanceCache()
+    grid, start, goal = make_maze('random', 20, 30, 2, wall_rate=0.25)
+    assert cache.add_map(cells) == cache.add_map(grid)
+    assert len(cache.grids) == 1
+
+
+def test_walls_are_copied(maze):
+    cells, start, goal = maze
+    grid, start, goal = make_maze('random', 20, 30, 2, wall_rate=0.25)
+    cache = DistanceCache()
+    key = cache.add_map(grid)
+
+    # the field is made after the grid of the caller is changed, but from the walls which are added
+    for y in range(grid.height):
+        grid.set_cell(y, grid.width // 2, 1)
+    assert cache.get_field(key, goal[0], goal[1]).get_cost(start[0], start[1]) == \
+        get_optimal_length(cells, start, goal)
+    assert cache.add_map(grid) != key
+
+
+def test_memory_counts_mazes_and_fields(maze):
+    cells, start, goal = maze
+    cache = DistanceCache()
+    key = cache.add_map(cells)
+    grid_memory = get_grid_memory(cache.grids[key])
+    assert cache.memory == grid_memory
+    field = cache.get_field(key, goal[0], goal[1])
+    assert cache.memory == grid_memory + field.get_memory()
+    cache.remove_map(key)
+    assert cache.memory == 0
+    assert len(cache) == 0
+
+
+def test_least_recently_used_maze_is_evicted_with_fields():
+    mazes = [make_maze('random', 20, 30, seed, wall_rate=0.2) for seed in range(3)]
+    grid_memory = get_grid_memory(mazes[0][0])
+    cache = DistanceCache(max_memory=grid_memory * 2)
+    keys = [cache.add_map(grid) for grid, start, goal in mazes[:2]]
+    cache.get_field(keys[0], 0, 0)
+    # the first maze and its field are used later than the second maze, so the second maze is evicted
+    keys.append(cache.add_map(mazes[2][0]))
+    assert keys[1] not in cache.grids
+    assert cache.memory <= cache.max_memory or len(cache.grids) == 1
+    with pytest.raises(KeyError):
+        cache.get_field(keys[1], 0, 0)
+    assert all(field_key[0] in cache.grids for field_key in cache.fields)
+
+
+def test_astar_uses_field_as_heuristic(maze):
+    cells, start, goal = maze
+    cache = DistanceCache()
+    key = cache.add_map(cells)
+    cache.get_field(key, goal[0], goal[1])
+    a_star = AStar(cells, start[0], start[1], goal[0], goal[1], trace='list', cache=cache, maze_key=key)
+    explored, paths = a_star.search_answer()
+    assert len(paths) - 1 == get_optimal_length(cells, start, goal)
+    # perfect heuristic explores only the cells of one optimal path
+    assert len(explored) == len(paths)
+
+    with pytest.raises(ValueError):
+        AStar(cells, start[0], start[1], goal[0], goal[1], cache=cache)
@@ -0,0 +1,68 @@
+"""
+D* Lite finds the optimal path of the changed maze after update_cell and move_start by replan()
+"""
+
+import pytest
+
+from conftest import assert_valid_path, get_blocked_cells, get_cells, get_opened_cells, get_optimal_length
+from DStarLite import DStarLite
+from benchmark.MazeGenerator import make_maze
+
+
+@pytest.mark.parametrize('layout', ['nested', 'flat'])
+@pytest.mark.parametrize('seed', range(3))
+def test_dstar_lite_replans_around_new_walls(layout, seed):
+    grid, start, goal = make_maze('random', 25, 35, seed, wall_rate=0.25)
+    cells = get_cells(grid)
+    expected = get_cells(grid)
+    d_star = DStarLite(cells, start[0], start[1], goal[0], goal[1], layout=layout, trace='none')
+    explored, paths = d_star.search_answer()
+    assert len(paths) - 1 == get_optimal_length(expected, start, goal)
+
+    for y, x in get_blocked_cells(paths, 3):
+        d_star.update_cell(y, x, 1)
+        expected[y][x] = 1
+        explored, paths = d_star.replan()
+        optimal_length = get_optimal_length(expected, start, goal)
+        if optimal_length is None:
+            assert paths is None
+            break
+        assert_valid_path(expected, paths, start, goal)
+        assert len(paths) - 1 == optimal_length
+
+
+def test_dstar_lite_replans_when_goal_is_opened():
+    grid, start, goal = make_maze('unreachable', 20, 20, 1)
+    cells = get_cells(grid)
+    d_star = DStarLite(cells, start[0], start[1], goal[0], goal[1], layout='flat', trace='none')
+    explored, paths = d_star.search_answer()
+    assert paths is None
+
+    for y, x in get_opened_cells(cells, goal):
+        d_star.update_cell(y, x, 0)
+        cells[y][x] = 0
+    explored, paths = d_star.replan()
+    optimal_length = get_optimal_length(cells, start, goal)
+    assert optimal_length is not None
+    assert_valid_path(cells, paths, start, goal)
+    assert len(paths) - 1 == optimal_length
+
+
+def test_dstar_lite_moves_start():
+    grid, start, goal = make_maze('random', 25, 35, 4, wall_rate=0.2)
+    cells = get_cells(grid)
+    d_star = DStarLite(cells, start[0], start[1], goal[0], goal[1], layout='flat', trace='none')
+    explored, paths = d_star.search_answer()
+
+    y, x = paths[len(paths) // 2]
+    d_star.move_start(y, x)
+    blocked_y, blocked_x = paths[len(paths) // 2 + 2]
+    d_star.update_cell(blocked_y, blocked_x, 1)
+    cells[blocked_y][blocked_x] = 1
+    explored, paths = d_star.replan()
+    optimal_length = get_optimal_length(cells, (y, x), goal)
+    if optimal_length is None:
+        assert paths is None
+    else:
+        assert_valid_path(cells, paths, (y, x), goal)
+        assert len(paths) - 1 == optimal_length
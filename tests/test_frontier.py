@@ -0,0 +1,51 @@
+"""
+Frontiers pop the smallest entry after update, and AStar and UCS find the optimal path with every frontier
+"""
+
+import random
+
+import pytest
+
+from conftest import get_optimal_length
+from AStar import AStar
+from Frontier import FRONTIERS, PRIORITY_FRONTIERS
+from UCS import UCS
+from benchmark.MazeGenerator import make_maze
+
+
+@pytest.mark.parametrize('frontier', PRIORITY_FRONTIERS)
+def test_update_keeps_heap_order(frontier):
+    rand = random.Random(3)
+    queued = FRONTIERS[frontier]()
+    costs = {}
+    for key in range(200):
+        costs[key] = rand.randrange(50, 100)
+        queued.push(key, (costs[key], 0, key))
+    for key in rand.sample(range(200), 80):
+        new_cost = costs[key] - rand.randrange(1, 50)
+        queued.update(key, (costs[key], 0, key), (new_cost, 0, key))
+        costs[key] = new_cost
+
+    popped = [queued.pop() for _ in range(len(queued))]
+    assert popped == sorted((cost, 0, key) for key, cost in costs.items())
+
+
+@pytest.mark.parametrize('state', ['nodes', 'arrays'])
+@pytest.mark.parametrize('frontier', PRIORITY_FRONTIERS)
+def test_astar_is_optimal_after_update(frontier, state):
+    # the list frontier lost the heap order when it removed the old entry, and AStar found 67 steps
+    grid, start, goal = make_maze('random', 18, 47, 166)
+    explored, paths = AStar(grid, start[0], start[1], goal[0], goal[1], frontier=frontier, state=state,
+                            trace='none').search_answer()
+    assert len(paths) - 1 == get_optimal_length(grid, start, goal) == 65
+
+
+@pytest.mark.parametrize('solver', [AStar, UCS], ids=lambda solver: solver.__name__)
+@pytest.mark.parametrize('frontier', PRIORITY_FRONTIERS)
+def test_optimal_on_random_mazes(solver, frontier):
+    for seed in range(20):
+        grid, start, goal = make_maze('random', 15, 30, seed, wall_rate=0.3)
+        explored, paths = solver(grid, start[0], start[1], goal[0], goal[1], frontier=frontier,
+                                 trace='none').search_answer()
+        optimal_length = get_optimal_length(grid, start, goal)
+        assert (len(paths) - 1 if paths is not None else None) == optimal_length
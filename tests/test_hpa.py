@@ -0,0 +1,50 @@
+"""
+ClusterGraph.update_cell rebuilds the changed clusters locally, and HPA* finds the same path as with a new graph
+"""
+
+import pytest
+
+from conftest import assert_valid_path, get_blocked_cells, get_cells, get_opened_cells, get_optimal_length
+from HPAStar import ClusterGraph, HPAStar
+from benchmark.MazeGenerator import make_maze
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_hpa_update_cell_is_same_as_new_graph(seed):
+    grid, start, goal = make_maze('rooms', 40, 40, seed)
+    cells = get_cells(grid)
+    graph = ClusterGraph(cells, cluster_size=8)
+    explored, paths = HPAStar(cells, start[0], start[1], goal[0], goal[1], graph=graph, trace='none').search_answer()
+
+    for y, x in get_blocked_cells(paths, 3):
+        graph.update_cell(y, x, 1)
+        cells[y][x] = 1
+        explored, paths = HPAStar(cells, start[0], start[1], goal[0], goal[1], graph=graph,
+                                  trace='none').search_answer()
+        explored, new_paths = HPAStar(cells, start[0], start[1], goal[0], goal[1], graph=ClusterGraph(cells, 8),
+                                      trace='none').search_answer()
+        assert paths == new_paths
+        if paths is None:
+            assert get_optimal_length(cells, start, goal) is None
+            break
+        assert_valid_path(cells, paths, start, goal)
+        assert (y, x) not in paths
+
+        explored, optimal_paths = HPAStar(cells, start[0], start[1], goal[0], goal[1], graph=graph,
+                                          near_optimal=False, trace='none').search_answer()
+        assert len(optimal_paths) - 1 == get_optimal_length(cells, start, goal)
+
+
+def test_hpa_update_cell_opens_goal():
+    grid, start, goal = make_maze('unreachable', 20, 20, 1)
+    cells = get_cells(grid)
+    graph = ClusterGraph(cells, cluster_size=5)
+    explored, paths = HPAStar(cells, start[0], start[1], goal[0], goal[1], graph=graph, trace='none').search_answer()
+    assert paths is None
+
+    for y, x in get_opened_cells(cells, goal):
+        graph.update_cell(y, x, 0)
+        cells[y][x] = 0
+    explored, paths = HPAStar(cells, start[0], start[1], goal[0], goal[1], graph=graph, trace='none').search_answer()
+    assert get_optimal_length(cells, start, goal) is not None
+    assert_valid_path(cells, paths, start, goal)
@@ -0,0 +1,56 @@
+"""
+JPS finds the path of the same optimal length as BFS with every frontier and layout
+"""
+
+import pytest
+
+from conftest import assert_valid_path, get_cells, get_optimal_length
+from Frontier import PRIORITY_FRONTIERS
+from Grid import GRIDS
+from JPS import JPS
+from benchmark.MazeGenerator import make_maze
+
+CASES = [
+    ('random', {'wall_rate': 0.1}),
+    ('random', {'wall_rate': 0.3}),
+    ('perfect', {}),
+    ('rooms', {}),
+    ('spiral', {}),
+    ('unreachable', {}),
+]
+
+
+def check_jps(grid, start, goal, **options):
+    cells = get_cells(grid)
+    explored, paths = JPS(cells, start[0], start[1], goal[0], goal[1], trace='none', **options).search_answer()
+    optimal_length = get_optimal_length(cells, start, goal)
+    if optimal_length is None:
+        assert paths is None
+    else:
+        assert_valid_path(cells, paths, start, goal)
+        assert len(paths) - 1 == optimal_length
+
+
+@pytest.mark.parametrize('layout', sorted(GRIDS))
+@pytest.mark.parametrize('frontier', PRIORITY_FRONTIERS + (None,))
+def test_reported_maze_is_optimal(frontier, layout):
+    # JPS found 126 steps instead of 124 when the list frontier lost the heap order
+    grid, start, goal = make_maze('random', 45, 79, 91, wall_rate=0.2)
+    options = {'frontier': frontier} if frontier is not None else {}
+    check_jps(grid, (0, 0), (44, 78), layout=layout, **options)
+
+
+@pytest.mark.parametrize('generator, options', CASES)
+@pytest.mark.parametrize('layout', sorted(GRIDS))
+def test_optimal_on_generated_mazes(generator, options, layout):
+    for seed in range(5):
+        grid, start, goal = make_maze(generator, 23, 37, seed, **options)
+        check_jps(grid, start, goal, layout=layout)
+
+
+def test_optimal_between_random_cells():
+    for seed in range(30):
+        grid, start, goal = make_maze('random', 17, 29, seed, wall_rate=0.25)
+        cells = get_cells(grid)
+        roads = [(y, x) for y in range(grid.height) for x in range(grid.width) if cells[y][x] == 0]
+        check_jps(grid, roads[seed * 7 % len(roads)], roads[-1 - seed * 11 % len(roads)], layout='flat')
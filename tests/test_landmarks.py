@@ -0,0 +1,82 @@
+"""
+ALT heuristic is admissible, so AStar with landmarks finds optimal paths, and the tables are saved and loaded
+"""
+
+import pytest
+
+from conftest import assert_valid_path, get_cells, get_optimal_length
+from AStar import AStar
+from Landmarks import Landmarks
+from WavefrontBFS import get_distance_field
+from benchmark.MazeGenerator import make_maze
+
+SELECTIONS = ['farthest', 'planar']
+
+
+@pytest.mark.parametrize('selection', SELECTIONS)
+@pytest.mark.parametrize('generator', ['perfect', 'rooms', 'unreachable'])
+def test_heuristic_is_admissible(generator, selection):
+    grid, start, goal = make_maze(generator, 21, 31, 4)
+    landmarks = Landmarks(grid, count=6, selection=selection)
+    assert 0 < len(landmarks.locations) <= 6
+    distances = get_distance_field(grid, goal[0], goal[1])
+    heuristic = landmarks.get_heuristic(goal[0], goal[1])
+    for cell, distance in enumerate(distances):
+        y, x = divmod(cell, grid.width)
+        if distance != -1:
+            assert heuristic.get_cost(y, x) <= distance
+    assert heuristic.get_cost(goal[0], goal[1]) == 0
+
+
+@pytest.mark.parametrize('selection', SELECTIONS)
+def test_astar_with_landmarks_is_optimal(selection):
+    for seed in range(5):
+        grid, start, goal = make_maze('random', 25, 35, seed, wall_rate=0.3)
+        cells = get_cells(grid)
+        landmarks = Landmarks(cells, count=4, selection=selection)
+        explored, paths = AStar(cells, start[0], start[1], goal[0], goal[1], trace='list',
+                                heuristic=landmarks.get_heuristic(goal[0], goal[1])).search_answer()
+        optimal_length = get_optimal_length(cells, start, goal)
+        if optimal_length is None:
+            assert paths is None
+        else:
+            assert_valid_path(cells, paths, start, goal)
+            assert len(paths) - 1 == optimal_length
+
+
+def test_landmarks_explore_less_in_perfect_maze():
+    grid, start, goal = make_maze('perfect', 41, 41, 2)
+    cells = get_cells(grid)
+    landmarks = Landmarks(cells, count=8)
+    manhattan, paths = AStar(cells, start[0], start[1], goal[0], goal[1], trace='list').search_answer()
+    alt, alt_paths = AStar(cells, start[0], start[1], goal[0], goal[1], trace='list',
+                           heuristic=landmarks.get_heuristic(goal[0], goal[1])).search_answer()
+    assert len(alt_paths) == len(paths)
+    assert len(alt) <= len(manhattan)
+
+
+def test_save_and_load(tmp_path):
+    grid, start, goal = make_maze('rooms', 21, 31, 0)
+    landmarks = Landmarks(grid, count=5)
+    file_name = str(tmp_path / 'rooms.alt')
+    landmarks.save(file_name)
+
+    loaded = Landmarks.load(file_name, grid)
+    assert (loaded.height, loaded.width) == (landmarks.height, landmarks.width)
+    assert loaded.locations == landmarks.locations
+    assert loaded.tables == landmarks.tables
+    assert loaded.get_heuristic(goal[0], goal[1]).get_cost(*start) == \
+        landmarks.get_heuristic(goal[0], goal[1]).get_cost(*start)
+
+    other, start, goal = make_maze('rooms', 21, 31, 1)
+    with pytest.raises(ValueError):
+        Landmarks.load(file_name, other)
+    with open(file_name, 'r+b') as landmark_file:
+        landmark_file.write(b'XXXX')
+    with pytest.raises(ValueError):
+        Landmarks.load(file_name)
+
+
+def test_unknown_selection():
+    with pytest.raises(ValueError):
+        Landmarks([[0, 0]], selection='random')
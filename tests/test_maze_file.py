@@ -0,0 +1,83 @@
+"""
+Mazes which are converted to the binary file are loaded with the same walls, and searched with the same output
+"""
+
+import os
+
+import pytest
+
+from conftest import SRC_DIR
+from AStar import AStar
+from MazeFile import MazeFile, convert, write_mazes
+from MazeReader import MazeReader
+from benchmark.MazeGenerator import make_maze
+
+INPUT_FILE = os.path.join(SRC_DIR, 'input.txt')
+
+
+def get_walls(grid):
+    return [[1 if grid.is_wall(y, x) else 0 for x in range(grid.width)] for y in range(grid.height)]
+
+
+@pytest.mark.parametrize('bits', [1, 8])
+def test_convert_round_trip(tmp_path, bits):
+    file_name = str(tmp_path / 'input.maze')
+    mazes = list(MazeReader(INPUT_FILE).mazes())
+    assert convert(INPUT_FILE, file_name, bits) == len(mazes)
+
+    with MazeFile(file_name) as maze_file:
+        assert len(maze_file) == len(mazes)
+        for number, (height, width, cells) in enumerate(mazes):
+            loaded_height, loaded_width, grid = maze_file.load(number)
+            assert (loaded_height, loaded_width) == (height, width)
+            assert get_walls(grid) == cells
+            assert maze_file.get_start_goal(number) == ((0, 0), (height - 1, width - 1))
+            assert AStar(grid, 0, 0, height - 1, width - 1, trace='list').search_answer() == \
+                AStar(cells, 0, 0, height - 1, width - 1, trace='list').search_answer()
+
+
+@pytest.mark.parametrize('bits', [1, 8])
+def test_write_mazes_keeps_start_and_goal(tmp_path, bits):
+    file_name = str(tmp_path / 'random.maze')
+    mazes = [make_maze('random', 13, 29, seed, wall_rate=0.3) for seed in range(3)]
+    write_mazes(file_name, ((grid.height, grid.width, bytes(grid.walls), start, goal)
+                            for grid, start, goal in mazes), len(mazes), bits)
+
+    with MazeFile(file_name) as maze_file:
+        for number, (grid, start, goal) in enumerate(mazes):
+            height, width, loaded_grid = maze_file.load(number)
+            assert get_walls(loaded_grid) == get_walls(grid)
+            assert maze_file.get_start_goal(number) == (start, goal)
+
+
+def test_grid_is_alive_after_close(tmp_path):
+    file_name = str(tmp_path / 'input.maze')
+    convert(INPUT_FILE, file_name)
+    maze_file = MazeFile(file_name)
+    height, width, grid = maze_file.load(0)
+    walls = get_walls(grid)
+    maze_file.close()
+    assert get_walls(grid) == walls
+    maze_file.close()
+
+
+def test_set_cell_does_not_change_file(tmp_path):
+    file_name = str(tmp_path / 'input.maze')
+    convert(INPUT_FILE, file_name, 8)
+    with open(file_name, 'rb') as input_file:
+        data = input_file.read()
+
+    with MazeFile(file_name) as maze_file:
+        height, width, grid = maze_file.load(0)
+        grid.set_cell(0, 1, 1)
+        assert grid.is_wall(0, 1)
+    with open(file_name, 'rb') as input_file:
+        assert input_file.read() == data
+
+
+def test_not_a_maze_file(tmp_path):
+    file_name = str(tmp_path / 'input.txt')
+    with open(file_name, 'wb') as output_file:
+        output_file.write(b'not a maze file')
+    with pytest.raises(ValueError):
+        MazeFile(file_name)
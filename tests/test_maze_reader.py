@@ -0,0 +1,88 @@
+"""
+MazeReader reads the same mazes one by one, or one maze at a time through the index, in both layouts
+"""
+
+import os
+
+import pytest
+
+from conftest import SRC_DIR, get_cells
+from MazeReader import MazeReader, parse_rows
+from benchmark.MazeGenerator import make_maze
+
+INPUT_FILE = os.path.join(SRC_DIR, 'input.txt')
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    """
+    :return: <tuple>, file name, and cells of each maze
+    """
+    mazes = [get_cells(make_maze('random', 3 + seed * 4, 5 + seed * 3, seed, wall_rate=0.3)[0]) for seed in range(6)]
+    lines = [str(len(mazes))]
+    for number, cells in enumerate(mazes):
+        # blank lines between the mazes vary, and the last maze has no blank line and no newline
+        lines.extend([''] * (number % 3))
+        lines.append(str(len(cells)) + " " + str(len(cells[0])))
+        lines.extend(','.join(str(cell) for cell in row) for row in cells)
+    file_name = str(tmp_path / 'input.txt')
+    with open(file_name, 'w') as output_file:
+        output_file.write('\n'.join(lines))
+    return file_name, mazes
+
+
+def get_walls(grid):
+    return [[1 if grid.is_wall(y, x) else 0 for x in range(grid.width)] for y in range(grid.height)]
+
+
+def test_mazes_in_both_layouts(input_file):
+    file_name, mazes = input_file
+    nested = list(MazeReader(file_name).mazes())
+    flat = list(MazeReader(file_name, 'flat'))
+    assert [cells for height, width, cells in nested] == mazes
+    assert [(height, width) for height, width, cells in nested] == [(len(cells), len(cells[0])) for cells in mazes]
+    assert [get_walls(grid) for height, width, grid in flat] == mazes
+
+
+@pytest.mark.parametrize('layout', ['nested', 'flat'])
+def test_load_is_same_as_mazes(input_file, layout):
+    file_name, mazes = input_file
+    expected = list(MazeReader(file_name, layout).mazes())
+    reader = MazeReader(file_name, layout)
+    assert len(reader) == len(mazes)
+    for number in reversed(range(len(mazes))):
+        height, width, cells = reader.load(number)
+        assert (height, width) == expected[number][:2]
+        if layout == 'nested':
+            assert cells == expected[number][2]
+        else:
+            assert get_walls(cells) == get_walls(expected[number][2])
+
+
+def test_saved_index_is_loaded(input_file, tmp_path):
+    file_name, mazes = input_file
+    reader = MazeReader(file_name)
+    index = reader.build_index()
+    index_file_name = str(tmp_path / 'input.index')
+    reader.save_index(index_file_name)
+
+    loaded = MazeReader(file_name)
+    assert loaded.load_index(index_file_name) == index
+    assert loaded.load(4)[2] == mazes[4]
+    height, width, rows = loaded.load_rows(1)
+    assert parse_rows(rows, height, width, 'nested') == mazes[1]
+
+
+def test_homework_input():
+    reader = MazeReader(INPUT_FILE)
+    assert len(reader) == 3
+    assert [(height, width) for height, width, cells in reader] == [(6, 6), (8, 8), (15, 25)]
+
+
+def test_invalid_rows():
+    with pytest.raises(ValueError):
+        parse_rows([b'0,1\n', b'1,0\n'], 3, 2, 'nested')
+    with pytest.raises(ValueError):
+        parse_rows(b'0,1\n1,0\n', 2, 3, 'flat')
+    with pytest.raises(ValueError):
+        parse_rows(b'0,1\n1,0\n', 2, 2, 'bitset')
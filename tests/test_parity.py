@@ -0,0 +1,74 @@
+"""
+Every frontier, layout and state writes the same output as the original AStar for input.txt,
+and UCS finds the paths of the same length as the original UCS
+"""
+
+import os
+
+import pytest
+
+from conftest import DATA_DIR, SRC_DIR
+from AStar import AStar
+from Frontier import PRIORITY_FRONTIERS
+from Grid import GRIDS
+from MazeReader import MazeReader
+from PathEncoding import format_paths
+from UCS import UCS
+
+STATES = ('nodes', 'arrays', 'sparse')
+
+
+def read_baseline(file_name):
+    """
+    :param file_name: <str>, output.txt of the original solver for input.txt
+    :return: <str>
+    """
+    with open(os.path.join(DATA_DIR, file_name)) as baseline_file:
+        return baseline_file.read()
+
+
+def get_output(solver, **options):
+    """
+    :param solver: <class>, AStar or UCS
+    :param options: keyword arguments of the solver
+    :return: <str>, output.txt of main() for input.txt
+    """
+    output = []
+    for height, width, cells in MazeReader(os.path.join(SRC_DIR, 'input.txt')).mazes():
+        explored, paths = solver(cells, 0, 0, height - 1, width - 1, **options).search_answer()
+        for ele in explored:
+            output.append(str(ele) + "\n")
+        output.append(format_paths(paths, 'list'))
+        output.append("\n\n")
+    return ''.join(output)
+
+
+def get_path_lengths(output):
+    """
+    :param output: <str>, output.txt
+    :return: <list>, the number of location of the path of each maze
+    """
+    return [maze.splitlines()[-1].count('(') for maze in output.split("\n\n") if maze.strip()]
+
+
+@pytest.mark.parametrize('state', STATES)
+@pytest.mark.parametrize('layout', sorted(GRIDS))
+@pytest.mark.parametrize('frontier', PRIORITY_FRONTIERS)
+def test_astar_output_is_same_as_baseline(frontier, layout, state):
+    baseline = read_baseline('astar_output.txt')
+    assert get_output(AStar, frontier=frontier, layout=layout, state=state) == baseline
+
+
+@pytest.mark.parametrize('layout', sorted(GRIDS))
+def test_ucs_output_is_same_as_baseline(layout):
+    assert get_output(UCS, layout=layout) == read_baseline('ucs_output.txt')
+
+
+@pytest.mark.parametrize('state', STATES)
+@pytest.mark.parametrize('layout', sorted(GRIDS))
+@pytest.mark.parametrize('frontier', PRIORITY_FRONTIERS)
+def test_ucs_path_is_optimal(frontier, layout, state):
+    # UCS has no tie breaker, so the order of the same cost depends on the frontier and the state
+    baseline = read_baseline('ucs_output.txt')
+    output = get_output(UCS, frontier=frontier, layout=layout, state=state)
+    assert get_path_lengths(output) == get_path_lengths(baseline)
@@ -0,0 +1,58 @@
+"""
+Encoded paths decode to the same locations, and the rebuilt paths of every state are the same
+"""
+
+import pytest
+
+from conftest import assert_valid_path, get_cells
+from AStar import AStar
+from PathEncoding import (NO_PATH, decode_cells, decode_directions, encode_cells, encode_directions,
+                          format_paths)
+from benchmark.MazeGenerator import make_maze
+
+
+def get_paths(generator, seed, **options):
+    grid, start, goal = make_maze(generator, 31, 45, seed, **options)
+    cells = get_cells(grid)
+    explored, paths = AStar(cells, start[0], start[1], goal[0], goal[1], trace='none').search_answer()
+    return cells, start, goal, paths
+
+
+@pytest.mark.parametrize('generator', ['perfect', 'spiral', 'rooms'])
+def test_round_trip(generator):
+    for seed in range(3):
+        cells, start, goal, paths = get_paths(generator, seed)
+        encoded_start, directions = encode_directions(paths)
+        assert encoded_start == start
+        assert decode_directions(encoded_start, directions) == paths
+        assert decode_cells(encode_cells(paths, len(cells[0])), len(cells[0])) == paths
+
+
+def test_directions_are_run_length_encoded():
+    paths = [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (1, 1)]
+    assert encode_directions(paths) == ((0, 0), 'R2D2L1U1')
+    assert encode_directions([(3, 4)]) == ((3, 4), '')
+    assert decode_directions((3, 4), '') == [(3, 4)]
+    # long runs have counts of many digits
+    paths = [(0, x) for x in range(123)]
+    assert encode_directions(paths)[1] == 'R122'
+    assert decode_directions((0, 0), 'R122') == paths
+
+
+def test_format_paths():
+    paths = [(0, 0), (0, 1), (1, 1)]
+    assert format_paths(paths) == '(0, 0)(0, 1)(1, 1)'
+    assert format_paths(paths, 'directions') == '(0, 0) R1D1'
+    assert format_paths(None) == NO_PATH
+    assert format_paths(None, 'directions') == NO_PATH
+    with pytest.raises(ValueError):
+        format_paths(paths, 'cells')
+
+
+@pytest.mark.parametrize('state', ['nodes', 'arrays', 'sparse'])
+def test_long_path_is_rebuilt_in_order(state):
+    grid, start, goal = make_maze('spiral', 61, 61, 0)
+    cells = get_cells(grid)
+    explored, paths = AStar(cells, start[0], start[1], goal[0], goal[1], state=state, trace='none').search_answer()
+    assert_valid_path(cells, paths, start, goal)
+    assert len(paths) > 500
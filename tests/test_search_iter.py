@@ -0,0 +1,75 @@
+"""
+search_iter yields the same explored nodes as the trace of search_answer, pauses between the steps, and can be closed
+"""
+
+import pytest
+
+from conftest import assert_valid_path, get_cells, get_optimal_length
+from AStar import AStar
+from AnytimeAStar import AnytimeAStar
+from BFS import BFS
+from DFS import DFS
+from JPS import JPS
+from UCS import UCS
+from benchmark.MazeGenerator import make_maze
+
+SOLVERS = [AStar, UCS, BFS, DFS, JPS, AnytimeAStar]
+
+
+@pytest.fixture
+def maze():
+    grid, start, goal = make_maze('rooms', 21, 29, 2)
+    return get_cells(grid), start, goal
+
+
+def make_solver(solver, maze, **options):
+    cells, start, goal = maze
+    return solver(cells, start[0], start[1], goal[0], goal[1], **options)
+
+
+@pytest.mark.parametrize('solver', SOLVERS)
+def test_steps_are_explored_nodes(solver, maze, capsys):
+    explored, paths = make_solver(solver, maze, trace='list').search_answer()
+    a_solver = make_solver(solver, maze)
+    steps = a_solver.search_iter()
+    assert list(steps) == explored
+    assert a_solver.paths == paths
+    # trace is not used by search_iter, so the default print trace prints nothing
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize('solver', [AStar, BFS, JPS])
+def test_path_is_returned(solver, maze):
+    cells, start, goal = maze
+    steps = make_solver(solver, maze, trace='none').search_iter()
+    with pytest.raises(StopIteration) as stop:
+        while True:
+            next(steps)
+    assert_valid_path(cells, stop.value.value, start, goal)
+    assert len(stop.value.value) - 1 == get_optimal_length(cells, start, goal)
+
+
+def test_searches_are_paused_between_steps(maze):
+    a_star = make_solver(AStar, maze, trace='none')
+    bfs = make_solver(BFS, maze, trace='none')
+    a_star_steps = a_star.search_iter()
+    bfs_steps = bfs.search_iter()
+    interleaved = []
+    for a_star_step, bfs_step in zip(a_star_steps, bfs_steps):
+        interleaved.append((a_star_step, bfs_step))
+    assert [step for step, bfs_step in interleaved] == \
+        make_solver(AStar, maze, trace='list').search_answer()[0][:len(interleaved)]
+    assert [step for a_star_step, step in interleaved] == \
+        make_solver(BFS, maze, trace='list').search_answer()[0][:len(interleaved)]
+
+
+@pytest.mark.parametrize('solver', SOLVERS)
+def test_close_aborts_search(solver, maze):
+    a_solver = make_solver(solver, maze, trace='none')
+    steps = a_solver.search_iter()
+    for i in range(10):
+        next(steps)
+    steps.close()
+    assert a_solver.paths is None
+    with pytest.raises(StopIteration):
+        next(steps)
@@ -0,0 +1,149 @@
+"""
+Server answers the queries of the loaded mazes with optimal paths, partial paths, errors and walled off goals
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from conftest import SRC_DIR, assert_valid_path, get_cells, get_optimal_length
+from MazeFile import write_mazes
+from PathEncoding import decode_directions
+from benchmark.MazeGenerator import make_maze
+from server.MapStore import MapStore
+from server.SolveClient import SolveClient
+from server.SolveServer import SolveServer
+
+INPUT_FILE = os.path.join(SRC_DIR, 'input.txt')
+
+
+@pytest.fixture
+def maze_file(tmp_path):
+    """
+    :return: <tuple>, file name of the binary maze file, and (cells, start, goal) of each maze
+    """
+    file_name = str(tmp_path / 'mazes.maze')
+    mazes = [make_maze('random', 25, 40, seed, wall_rate=0.25) for seed in range(2)] + \
+        [make_maze('unreachable', 25, 40, 0)]
+    write_mazes(file_name, ((grid.height, grid.width, bytes(grid.walls), start, goal) for grid, start, goal in mazes),
+                len(mazes))
+    return file_name, [(get_cells(grid), start, goal) for grid, start, goal in mazes]
+
+
+@pytest.fixture
+def store(maze_file):
+    map_store = MapStore([INPUT_FILE, maze_file[0]])
+    yield map_store
+    map_store.close()
+
+
+def make_request(name, start, goal, **request):
+    request.update({'id': 1, 'map': name, 'start': start, 'goal': goal})
+    return request
+
+
+@pytest.mark.parametrize('solver_name', ['AStar', 'UCS', 'BFS'])
+def test_paths_are_optimal(store, maze_file, solver_name):
+    file_name, mazes = maze_file
+    for number, (cells, start, goal) in enumerate(mazes):
+        response = store.solve(make_request(file_name + ":" + str(number), start, goal, solver=solver_name))
+        assert response['partial'] is False
+        optimal_length = get_optimal_length(cells, start, goal)
+        if optimal_length is None:
+            assert response['path'] is None
+        else:
+            assert_valid_path(cells, response['path'], start, goal)
+            assert len(response['path']) - 1 == optimal_length
+
+
+def test_maps_are_named_by_file_and_number(store, maze_file):
+    names = [maze['name'] for maze in store.get_maps()]
+    assert names == [INPUT_FILE + ":" + str(number) for number in range(3)] + \
+        [maze_file[0] + ":" + str(number) for number in range(3)]
+    assert store.get_maps()[0]['height'] == store.get_maps()[0]['width'] == 6
+
+
+def test_directions_decode_to_path(store, maze_file):
+    file_name, mazes = maze_file
+    cells, start, goal = mazes[0]
+    name = file_name + ":0"
+    paths = store.solve(make_request(name, start, goal))['path']
+    directions = store.solve(make_request(name, start, goal, path_format='directions'))['path']
+    assert isinstance(directions, str)
+    assert decode_directions(start, directions) == paths
+
+
+def test_max_expansions_gives_partial_path(store, maze_file):
+    file_name, mazes = maze_file
+    cells, start, goal = mazes[0]
+    response = store.solve(make_request(file_name + ":0", start, goal, options={'max_expansions': 10}))
+    assert response['partial'] is True
+    assert response['expansions'] == 10
+    assert response['path'][0] == start
+    assert response['path'][-1] != goal
+
+
+def test_errors(store, maze_file):
+    file_name, mazes = maze_file
+    cells, start, goal = mazes[0]
+    assert 'error' in store.solve(make_request('missing:0', start, goal))
+    assert 'error' in store.solve(make_request(file_name + ":0", start, goal, solver='JPS'))
+    late = store.solve(make_request(file_name + ":0", start, goal, deadline=time.time() - 1))
+    assert late['error'] == "deadline exceeded"
+
+
+async def run_client(server, socket_path, requests):
+    """
+    :param server: <SolveServer>
+    :param socket_path: <str>
+    :param requests: <list>, (map name, start, goal, keyword arguments of SolveClient.solve)
+    :return: <list>, responses in the order of the requests
+    """
+    serving = asyncio.ensure_future(server.serve_unix(socket_path))
+    while not os.path.exists(socket_path):
+        await asyncio.sleep(0.01)
+    client = await SolveClient.connect(socket_path)
+    try:
+        maps = await client.get_maps()
+        responses = await asyncio.gather(*[client.solve(name, start, goal, **options)
+                                           for name, start, goal, options in requests])
+    finally:
+        await client.close()
+        serving.cancel()
+        try:
+            await serving
+        except asyncio.CancelledError:
+            pass
+    return maps, responses
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_server_answers_every_query(tmp_path, maze_file, executor):
+    file_name, mazes = maze_file
+    requests = []
+    for number, (cells, start, goal) in enumerate(mazes):
+        for solver_name in ('AStar', 'BFS'):
+            requests.append((file_name + ":" + str(number), start, goal, {'solver_name': solver_name}))
+    requests.append((file_name + ":0", mazes[0][1], (99, 99), {}))
+    requests.append((file_name + ":0", mazes[0][1], mazes[0][2], {'options': {'max_expansions': 5}}))
+
+    server = SolveServer([file_name], workers=2, executor=executor, batch_size=3, options={'state': 'sparse'})
+    socket_path = str(tmp_path / 'maze.sock')
+    maps, responses = asyncio.run(run_client(server, socket_path, requests))
+
+    assert len(maps) == len(mazes)
+    assert not os.path.exists(socket_path)
+    for (name, start, goal, options), response in zip(requests[:-2], responses):
+        cells = mazes[int(name.split(":")[-1])][0]
+        optimal_length = get_optimal_length(cells, start, goal)
+        if optimal_length is None:
+            # walled off goal is answered by the components without a worker
+            assert response['path'] is None
+            assert response['expansions'] == 0
+        else:
+            assert_valid_path(cells, [tuple(location) for location in response['path']], start, goal)
+            assert len(response['path']) - 1 == optimal_length
+    assert 'out of the map' in responses[-2]['error']
+    assert responses[-1]['partial'] is True
@@ -0,0 +1,80 @@
+"""
+Sparse state becomes dense when the search touches many cells, and the dense tables follow the layout
+"""
+
+import pytest
+
+from conftest import get_cells
+from AStar import AStar
+from BFS import BFS
+from CellArrays import LARGE_SIZE, CellArrays, SparseCells, get_typecode
+from DFS import DFS
+from Grid import Bitset, SparseGrid
+from UCS import UCS
+from benchmark.MazeGenerator import make_maze
+
+
+@pytest.mark.parametrize('layout, table_type', [('bitset', Bitset), ('flat', bytearray), ('nested', bytearray)])
+def test_dense_tables_follow_layout(layout, table_type):
+    grid, start, goal = make_maze('perfect', 31, 31, 0)
+    cells = get_cells(grid)
+    sparse = AStar(cells, start[0], start[1], goal[0], goal[1], layout=layout, state='sparse', trace='list')
+    explored, paths = sparse.search_answer()
+
+    assert isinstance(sparse.grid.queue_cells, table_type)
+    assert isinstance(sparse.grid.visit_cells, table_type)
+    assert type(sparse.arrays) is CellArrays
+    arrays = AStar(cells, start[0], start[1], goal[0], goal[1], layout=layout, state='arrays', trace='list')
+    assert (explored, paths) == arrays.search_answer()
+
+
+def test_large_grid_uses_int64():
+    assert get_typecode(LARGE_SIZE - 1) == 'i'
+    assert get_typecode(LARGE_SIZE) == 'q'
+    assert get_typecode(100000 * 100000) == 'q'
+    assert CellArrays(3, 4).parents.typecode == 'i'
+
+
+def test_short_search_stays_sparse():
+    cells = [[0] * 200 for y in range(200)]
+    sparse = AStar(cells, 100, 100, 100, 103, state='sparse', trace='list')
+    explored, paths = sparse.search_answer()
+    assert type(sparse.arrays) is SparseCells
+    assert isinstance(sparse.grid.visit_cells, set)
+    assert len(sparse.arrays) < 20
+    assert paths == [(100, 100), (100, 101), (100, 102), (100, 103)]
+
+
+@pytest.mark.parametrize('solver', [AStar, UCS, BFS, DFS])
+@pytest.mark.parametrize('generator', ['perfect', 'rooms', 'unreachable'])
+def test_sparse_is_same_as_arrays(solver, generator):
+    for seed in range(3):
+        grid, start, goal = make_maze(generator, 27, 35, seed)
+        cells = get_cells(grid)
+        sparse = solver(cells, start[0], start[1], goal[0], goal[1], state='sparse', trace='list').search_answer()
+        arrays = solver(cells, start[0], start[1], goal[0], goal[1], state='arrays', trace='list').search_answer()
+        assert sparse == arrays
+
+
+def test_get_dense_keeps_touched_cells():
+    sparse = SparseCells(3, 4)
+    sparse.set_cell(5, 2, 7, 4)
+    sparse.set_cell(11, 3, 3, 5)
+    arrays = sparse.get_dense()
+    assert type(arrays) is CellArrays
+    assert (arrays.back_costs[5], arrays.costs[5], arrays.parents[5]) == (2, 7, 4)
+    assert (arrays.back_costs[11], arrays.costs[11], arrays.parents[11]) == (3, 3, 5)
+    assert arrays.parents[0] == CellArrays(3, 4).parents[0]
+
+
+@pytest.mark.parametrize('layout', ['bitset', 'flat', 'nested'])
+def test_make_dense_keeps_queued_and_visited(layout):
+    grid = SparseGrid([[0] * 70 for y in range(3)], layout)
+    grid.set_queued(1, 65)
+    grid.set_visited(2, 3)
+    grid.make_dense()
+    assert grid.is_queued(1, 65) and not grid.is_visited(1, 65)
+    assert grid.is_visited(2, 3) and not grid.is_queued(2, 3)
+    grid.set_queued(0, 0)
+    assert grid.is_queued(0, 0)
+    assert not grid.is_wall(0, 0)
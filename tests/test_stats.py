@@ -0,0 +1,80 @@
+"""
+Stats counts the pushes and the expansions, and times the search of search_answer and search_iter
+"""
+
+import pytest
+
+from conftest import get_cells
+from AStar import AStar
+from BFS import BFS
+from Stats import Stats
+from benchmark.MazeGenerator import make_maze
+
+
+@pytest.fixture
+def maze():
+    grid, start, goal = make_maze('random', 20, 30, 5, wall_rate=0.25)
+    return get_cells(grid), start, goal
+
+
+@pytest.mark.parametrize('state', ['nodes', 'arrays', 'sparse'])
+def test_search_answer_counts(maze, state):
+    cells, start, goal = maze
+    exported = []
+    stats = Stats(export=exported.append)
+    explored, paths = AStar(cells, start[0], start[1], goal[0], goal[1], state=state, trace='list',
+                            stats=stats).search_answer()
+
+    assert stats.expanded == len(explored)
+    assert stats.pushes >= stats.expanded
+    assert stats.peak_frontier >= 1
+    assert stats.path_length == len(paths) - 1
+    assert stats.times['search'] > 0
+    assert stats.times['init'] > 0
+    assert len(exported) == 1
+    assert exported[0]['expanded'] == len(explored)
+
+
+def test_bfs_has_no_decrease_keys(maze):
+    cells, start, goal = maze
+    stats = Stats()
+    explored, paths = BFS(cells, start[0], start[1], goal[0], goal[1], trace='list', stats=stats).search_answer()
+    assert stats.decrease_keys == 0
+    assert stats.re_expansions == 0
+    assert stats.expanded == len(explored)
+
+
+def test_search_iter_is_timed(maze):
+    cells, start, goal = maze
+    stats = Stats()
+    a_star = AStar(cells, start[0], start[1], goal[0], goal[1], trace='none', stats=stats)
+    steps = list(a_star.search_iter())
+
+    assert stats.expanded == len(steps)
+    assert stats.pushes >= len(steps)
+    assert stats.times['search'] > 0
+    assert 'search' not in stats.started
+    assert stats.path_length == len(a_star.paths) - 1
+
+
+def test_closed_search_iter_stops_timer(maze):
+    cells, start, goal = maze
+    stats = Stats()
+    steps = AStar(cells, start[0], start[1], goal[0], goal[1], trace='none', stats=stats).search_iter()
+    for _ in range(5):
+        next(steps)
+    steps.close()
+
+    assert stats.expanded == 5
+    assert 'search' not in stats.started
+    assert stats.times['search'] > 0
+    assert stats.path_length is None
+
+
+def test_next_solver_resets_counters(maze):
+    cells, start, goal = maze
+    stats = Stats()
+    AStar(cells, start[0], start[1], goal[0], goal[1], trace='none', stats=stats).search_answer()
+    explored, paths = AStar(cells, start[0], start[1], start[0], start[1], trace='list', stats=stats).search_answer()
+    assert stats.expanded == len(explored) == 1
+    assert stats.path_length == 0
@@ -0,0 +1,72 @@
+"""
+Every trace sink receives the same explored nodes, and the print trace keeps the output of the homework
+"""
+
+import io
+
+import pytest
+
+from conftest import get_cells
+from AStar import AStar
+from BFS import BFS
+from Trace import CountTrace, FileTrace, ListTrace, make_trace
+from benchmark.MazeGenerator import make_maze
+
+
+@pytest.fixture
+def maze():
+    grid, start, goal = make_maze('random', 15, 21, 3, wall_rate=0.25)
+    return get_cells(grid), start, goal
+
+
+def solve(maze, trace, solver=AStar):
+    cells, start, goal = maze
+    return solver(cells, start[0], start[1], goal[0], goal[1], trace=trace).search_answer()
+
+
+@pytest.mark.parametrize('solver', [AStar, BFS])
+def test_print_trace_prints_explored_and_path(maze, capsys, solver):
+    explored, paths = solve(maze, 'print', solver)
+    output = capsys.readouterr().out
+    list_explored, list_paths = solve(maze, 'list', solver)
+
+    assert explored == [str(y) + " " + str(x) for y, x in list_explored]
+    assert paths == list_paths
+    assert output == ''.join(line + "\n" for line in explored) + ''.join(str(path) for path in paths) + "\n\n"
+    # default trace is the print trace
+    assert solve(maze, None, solver) == (explored, paths)
+
+
+def test_count_and_callback_see_same_nodes(maze, capsys):
+    list_explored, paths = solve(maze, 'list')
+    explored, count_paths = solve(maze, 'none')
+    assert explored is None
+    assert count_paths == paths
+
+    called = []
+    explored, callback_paths = solve(maze, lambda y, x: called.append((y, x)))
+    assert explored is None
+    assert called == list_explored
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize('buffer_size', [1, 7, 65536])
+def test_file_trace_writes_every_line(maze, buffer_size):
+    list_explored, paths = solve(maze, 'list')
+    output_file = io.StringIO()
+    trace = FileTrace(output_file, buffer_size)
+    explored, file_paths = solve(maze, trace)
+    assert file_paths == paths
+    assert trace.count == len(list_explored)
+    assert output_file.getvalue() == ''.join(str(y) + " " + str(x) + "\n" for y, x in list_explored)
+
+
+def test_make_trace():
+    assert isinstance(make_trace('none'), CountTrace)
+    assert isinstance(make_trace('list'), ListTrace)
+    trace = ListTrace()
+    assert make_trace(trace) is trace
+    with pytest.raises(ValueError):
+        make_trace('stdout')
+    with pytest.raises(ValueError):
+        make_trace(42)
@@ -0,0 +1,85 @@
+"""
+Distance field and wavefront BFS find the same distances and path lengths as BFS
+"""
+
+from collections import deque
+
+import pytest
+
+import WavefrontBFS as wavefront
+from conftest import assert_valid_path, get_cells, get_optimal_length
+from WavefrontBFS import WavefrontBFS, get_distance_field
+from benchmark.MazeGenerator import make_maze
+
+CASES = [
+    ('random', {'wall_rate': 0.3}),
+    ('perfect', {}),
+    ('rooms', {}),
+    ('unreachable', {}),
+]
+
+needs_numpy = pytest.mark.skipif(wavefront.np is None, reason="numpy is not installed")
+
+
+def get_distances(cells, start):
+    """
+    :return: <list>, BFS distance of cell id y * width + x, -1 is not reachable
+    """
+    height, width = len(cells), len(cells[0])
+    distances = [-1] * (height * width)
+    distances[start[0] * width + start[1]] = 0
+    q = deque([start])
+    while len(q) > 0:
+        y, x = q.popleft()
+        for next_y, next_x in ((y, x - 1), (y, x + 1), (y - 1, x), (y + 1, x)):
+            if 0 <= next_y < height and 0 <= next_x < width and cells[next_y][next_x] != 1 and \
+                    distances[next_y * width + next_x] == -1:
+                distances[next_y * width + next_x] = distances[y * width + x] + 1
+                q.append((next_y, next_x))
+    return distances
+
+
+@pytest.mark.parametrize('generator, options', CASES)
+def test_distance_field_is_bfs(generator, options):
+    for seed in range(3):
+        grid, start, goal = make_maze(generator, 19, 27, seed, **options)
+        cells = get_cells(grid)
+        assert list(get_distance_field(cells, start[0], start[1])) == get_distances(cells, start)
+        assert list(get_distance_field(grid, goal[0], goal[1])) == get_distances(cells, goal)
+
+
+def test_distance_field_from_wall():
+    assert list(get_distance_field([[1, 0], [0, 0]], 0, 0)) == [-1] * 4
+
+
+@needs_numpy
+@pytest.mark.parametrize('layout', ['nested', 'flat'])
+@pytest.mark.parametrize('generator, options', CASES)
+def test_path_is_optimal(generator, options, layout):
+    for seed in range(3):
+        grid, start, goal = make_maze(generator, 19, 27, seed, **options)
+        cells = get_cells(grid)
+        explored, paths = WavefrontBFS(cells, start[0], start[1], goal[0], goal[1], layout=layout,
+                                       trace='list').search_answer()
+        optimal_length = get_optimal_length(cells, start, goal)
+        if optimal_length is None:
+            assert paths is None
+        else:
+            assert_valid_path(cells, paths, start, goal)
+            assert len(paths) - 1 == optimal_length
+            assert explored[-1] == goal
+        assert len(explored) == len(set(explored))
+
+
+@needs_numpy
+def test_whole_field_is_bfs():
+    grid, start, goal = make_maze('rooms', 19, 27, 1)
+    cells = get_cells(grid)
+    distances = WavefrontBFS(cells, start[0], start[1], goal[0], goal[1], trace='none').get_distance_field()
+    assert distances.ravel().tolist() == get_distances(cells, start)
+
+
+@pytest.mark.skipif(wavefront.np is not None, reason="numpy is installed")
+def test_needs_numpy():
+    with pytest.raises(ImportError):
+        WavefrontBFS([[0]], 0, 0, 0, 0)